@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Memory per task node after build_dag.
+
+Loads a synthetic corpus (see generate_corpus.py) through load_task_nodes
++ resolve_dependencies + compute_levels under tracemalloc and reports the
+bytes held by the resulting node dict. For comparison the same data is
+also kept in the pre-slots model (a plain dataclass with a Path and
+un-interned strings per node).
+
+    python -m Codebase.Bench.bench_memory --tasks 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import tempfile
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from Codebase.Bench.generate_corpus import generate_corpus
+from Codebase.Core.Tracing.log_config import configure_logging
+from Codebase.GUI.Logic.dag_builder import build_dag
+
+
+@dataclass
+class LegacyTaskNode:
+    """The node model before Object/task_node.py, kept for comparison."""
+    key: str
+    label: str
+    file_path: Path
+    depends_on_raw: List[str]
+    group: Optional[str] = None
+    id: Optional[int] = None
+    depends_on: List[str] = field(default_factory=list)
+    children: List[str] = field(default_factory=list)
+    x: float = 0.0
+    y: float = 0.0
+    level: int = 0
+
+
+def measure(build: Callable[[], object]) -> tuple[object, int]:
+    """(result, bytes still allocated by build() once it returns)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = build()
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    held = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return result, held
+
+
+def legacy_copy(nodes) -> dict:
+    """Rebuild the graph as LegacyTaskNode objects with fresh (non-shared) strings."""
+    def fresh(s):
+        return "".join(list(s)) if isinstance(s, str) else s
+
+    out = {}
+    for key, n in nodes.items():
+        legacy = LegacyTaskNode(
+            key=fresh(key),
+            label=fresh(n.label),
+            file_path=Path(fresh(str(n.file_path))),
+            depends_on_raw=[fresh(d) for d in n.depends_on_raw],
+            group=fresh(n.group),
+            id=n.id,
+        )
+        legacy.depends_on = [fresh(d) for d in n.deps_resolved]
+        legacy.children = [fresh(c) for c in n.children]
+        legacy.level = n.level
+        str(legacy.file_path)  # Path caches its string once used, as the GUI does
+        out[legacy.key] = legacy
+    return out
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Per-node memory of the DAG model.")
+    parser.add_argument("--tasks", type=int, default=100000)
+    parser.add_argument("--groups", type=int, default=20)
+    parser.add_argument("--deps", choices=("key", "label"), default="key")
+    parser.add_argument("-o", "--output", type=Path, default=None, help="JSON results (default: stdout)")
+    args = parser.parse_args(argv)
+    configure_logging("WARNING")
+
+    with tempfile.TemporaryDirectory(prefix="dag_mem_") as tmp:
+        tasks_dir = generate_corpus(Path(tmp), args.tasks, args.groups, deps=args.deps)
+        nodes, current = measure(lambda: build_dag(tasks_dir))
+        _, legacy = measure(lambda: legacy_copy(nodes))
+
+    n = len(nodes)
+    report = {
+        "nodes": n,
+        "task_node_bytes": current,
+        "task_node_bytes_per_node": current / n,
+        "legacy_bytes": legacy,
+        "legacy_bytes_per_node": legacy / n,
+        "reduction": 1 - current / legacy if legacy else None,
+    }
+    print(
+        f"[bench_memory] {n} nodes: {current / n:.0f} B/node "
+        f"(legacy {legacy / n:.0f} B/node, {report['reduction']:.0%} less)",
+        file=sys.stderr,
+    )
+
+    text = json.dumps(report, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark for the DAG pipeline.
+
+For each size, a synthetic Tasks/ directory is generated (see
+generate_corpus.py) and these stages are timed:
+
+- load_task_nodes       (JSON parsing)
+- resolve_dependencies
+- compute_levels
+- draw_graph            (needs X; runs under Xvfb when $DISPLAY is unset)
+- update_edges          (every edge, router cache cold)
+
+Results go to a JSON file: one row per (stage, n) plus, per stage, the
+curve and the fitted log-log slope (1.0 = linear, 2.0 = quadratic).
+
+    python -m Codebase.Bench.bench_scaling --sizes 100 1000 10000 100000 -o bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import math
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from statistics import median
+from typing import Callable, Dict, List
+
+from Codebase.Bench.generate_corpus import generate_corpus
+from Codebase.Bench.virtual_display import virtual_display
+from Codebase.Core.Tracing.log_config import configure_logging
+from Codebase.GUI.IO.task_loader import load_task_nodes
+from Codebase.GUI.Logic.dag_builder import compute_levels, resolve_dependencies
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000]
+
+
+def time_stage(fn: Callable[[], object], repeats: int, setup: Callable[[], object] | None = None) -> List[float]:
+    """Run setup() (untimed) then fn() ``repeats`` times; return seconds per run."""
+    samples = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def fit_exponent(curve: List[List[float]]) -> float | None:
+    """Least-squares slope of log(seconds) over log(n)."""
+    pts = [(math.log(n), math.log(s)) for n, s in curve if n > 0 and s > 0]
+    if len(pts) < 2:
+        return None
+    mx = sum(x for x, _ in pts) / len(pts)
+    my = sum(y for _, y in pts) / len(pts)
+    var = sum((x - mx) ** 2 for x, _ in pts)
+    if var == 0:
+        return None
+    return sum((x - mx) * (y - my) for x, y in pts) / var
+
+
+def bench_logic(tasks_dir: Path, repeats: int) -> Dict[str, List[float]]:
+    """Time the Tk-free stages. Each stage gets fresh input from the previous one."""
+    out: Dict[str, List[float]] = {}
+    state: Dict[str, object] = {}
+
+    def load():
+        state["nodes"] = load_task_nodes(tasks_dir)
+
+    out["load_task_nodes"] = time_stage(load, repeats)
+    out["resolve_dependencies"] = time_stage(
+        lambda: resolve_dependencies(state["nodes"]), repeats, setup=load
+    )
+
+    def fresh_resolved():
+        load()
+        resolve_dependencies(state["nodes"])
+
+    out["compute_levels"] = time_stage(
+        lambda: compute_levels(state["nodes"]), repeats, setup=fresh_resolved
+    )
+    return out
+
+
+def bench_canvas(tasks_dir: Path, repeats: int) -> Dict[str, List[float]]:
+    """Time draw_graph / update_edges on a real (possibly virtual) display."""
+    import tkinter as tk
+
+    from Codebase.GUI.GUI.Draw.draw_graph import draw_graph
+    from Codebase.GUI.GUI.Draw.draw_graph_progressive import cancel_progressive_render
+    from Codebase.GUI.GUI.Draw.update_edges import update_edges
+    from Codebase.GUI.GUI.dag_canvas import DAGCanvas
+    from Codebase.GUI.Logic.dag_builder import build_dag
+
+    nodes = build_dag(tasks_dir)
+    root = tk.Tk()
+    root.withdraw()
+    try:
+        # Item backend: that is what draw_graph/update_edges drive
+        canvas = DAGCanvas(root, nodes, backend="items", width=1000, height=700)
+        cancel_progressive_render(canvas)
+        root.update_idletasks()
+
+        out = {"draw_graph": time_stage(lambda: draw_graph(canvas), repeats)}
+        out["update_edges"] = time_stage(
+            lambda: update_edges(canvas), repeats, setup=canvas.edge_router.forget
+        )
+        return out
+    finally:
+        root.destroy()
+
+
+def run(sizes: List[int], repeats: int, corpus_dir: Path | None, canvas: bool, max_canvas_n: int | None, **corpus_opts) -> dict:
+    rows: List[dict] = []
+
+    with tempfile.TemporaryDirectory(prefix="dag_bench_") as tmp, virtual_display() as display:
+        base = corpus_dir or Path(tmp)
+        if canvas and display is None:
+            print("[bench_scaling] No $DISPLAY and no Xvfb: skipping canvas stages", file=sys.stderr)
+
+        for n in sizes:
+            tasks_dir = base / f"tasks_{n}"
+            if not tasks_dir.is_dir():
+                t0 = time.perf_counter()
+                generate_corpus(tasks_dir, n, **corpus_opts)
+                print(f"[bench_scaling] Generated {n} tasks in {time.perf_counter() - t0:.2f}s", file=sys.stderr)
+
+            samples = bench_logic(tasks_dir, repeats)
+            if canvas and display is not None and (max_canvas_n is None or n <= max_canvas_n):
+                samples.update(bench_canvas(tasks_dir, repeats))
+
+            for stage, secs in samples.items():
+                rows.append({"stage": stage, "n": n, "median_s": median(secs), "min_s": min(secs), "samples": secs})
+                print(f"{stage:>22} n={n:<8} median={median(secs) * 1000:10.2f} ms", file=sys.stderr)
+
+    scaling = {}
+    for stage in dict.fromkeys(r["stage"] for r in rows):
+        curve = [[r["n"], r["median_s"]] for r in rows if r["stage"] == stage]
+        scaling[stage] = {"curve": curve, "exponent": fit_exponent(curve)}
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeats": repeats,
+            "corpus": corpus_opts,
+        },
+        "results": rows,
+        "scaling": scaling,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark DAG stages over growing task counts.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--groups", type=int, default=20)
+    parser.add_argument("--fan-in", type=int, default=2)
+    parser.add_argument("--fan-out", type=int, default=4)
+    parser.add_argument("--attachment-bytes", type=int, default=0)
+    parser.add_argument("--deps", choices=("key", "label"), default="key")
+    parser.add_argument("--corpus-dir", type=Path, default=None,
+                        help="Keep generated corpora here (reused on later runs)")
+    parser.add_argument("--no-canvas", action="store_true", help="Skip draw_graph/update_edges")
+    parser.add_argument("--max-canvas-n", type=int, default=None,
+                        help="Skip canvas stages above this many tasks")
+    parser.add_argument("-o", "--output", type=Path, default=None, help="JSON results (default: stdout)")
+    args = parser.parse_args(argv)
+    configure_logging()
+
+    # The loader prints progress; keep stdout clean for the JSON report
+    with contextlib.redirect_stdout(sys.stderr):
+        report = run(
+            args.sizes, args.repeats, args.corpus_dir, not args.no_canvas, args.max_canvas_n,
+            n_groups=args.groups, fan_in=args.fan_in, fan_out=args.fan_out,
+            attachment_bytes=args.attachment_bytes, deps=args.deps,
+        )
+
+    for stage, info in report["scaling"].items():
+        exp = info["exponent"]
+        print(f"{stage:>22} ~ n^{exp:.2f}" if exp is not None else f"{stage:>22} ~ n/a", file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
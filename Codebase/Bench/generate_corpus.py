@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Generate a synthetic Tasks/ directory for benchmarks.
+
+Files have the same shape as Codebase/Template/task_template.json.j2 and
+the usual <GROUP><ID>.json names. Dependencies always point to earlier
+tasks, so the result is a DAG.
+
+    python -m Codebase.Bench.generate_corpus /tmp/Tasks --tasks 10000 \\
+        --groups 20 --fan-in 2 --fan-out 4 --attachment-bytes 256 --deps label
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import string
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+
+def group_name(index: int) -> str:
+    """0 -> 'AAAA', 1 -> 'AAAB', ... (4 uppercase letters like real groups)."""
+    letters = []
+    for _ in range(4):
+        index, rem = divmod(index, 26)
+        letters.append(string.ascii_uppercase[rem])
+    return "".join(reversed(letters))
+
+
+def generate_corpus(
+    out_dir: Path,
+    n_tasks: int,
+    n_groups: int = 10,
+    fan_in: int = 2,
+    fan_out: int = 4,
+    attachment_bytes: int = 0,
+    deps: str = "key",
+    window: int = 200,
+    seed: int = 0,
+) -> Path:
+    """
+    Write n_tasks task files into out_dir and return it.
+
+    fan_in:
+        Max parents per task (actual count is 0..fan_in).
+    fan_out:
+        Max children per task; saturated parents are not picked again.
+    attachment_bytes:
+        Size of the single text attachment on each task's first update
+        (0 = no updates at all).
+    deps:
+        "key" writes depends_on as "<GROUP><ID>", "label" uses the parent's
+        task name (exercises the label-matching path in resolve_dependencies).
+    window:
+        Parents are drawn from the previous ``window`` tasks, which keeps
+        the DAG deep instead of everything hanging off the first tasks.
+    """
+    if deps not in ("key", "label"):
+        raise ValueError("deps must be 'key' or 'label'")
+
+    rng = random.Random(seed)
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    groups = [group_name(i) for i in range(max(1, n_groups))]
+    next_id: Dict[str, int] = {g: 1 for g in groups}
+    refs: List[str] = []            # dependency string per task index
+    children: List[int] = []        # children count per task index
+    payload = ("x" * attachment_bytes)
+
+    for i in range(n_tasks):
+        group = groups[rng.randrange(len(groups))]
+        task_id = next_id[group]
+        next_id[group] += 1
+        label = f"Task {i}"
+
+        parents: List[str] = []
+        lo = max(0, i - window)
+        for _ in range(rng.randint(0, fan_in) if i else 0):
+            p = rng.randrange(lo, i)
+            if children[p] >= fan_out or refs[p] in parents:
+                continue
+            children[p] += 1
+            parents.append(refs[p])
+
+        updates = []
+        if attachment_bytes:
+            updates.append({
+                "timestamp": "2025-01-01T00:00:00Z",
+                "author": "bench",
+                "note": f"Synthetic update for {label}",
+                "attachments": [{"name": "blob.txt", "type": "text/plain", "format": "", "content": payload}],
+            })
+
+        doc = {
+            "task": label,
+            "description": f"Synthetic task {i} in group {group}",
+            "id": task_id,
+            "group": group,
+            "owner": "bench",
+            "depends_on": parents,
+            "updates": updates,
+        }
+        (out_dir / f"{group}{task_id}.json").write_text(json.dumps(doc, indent=2) + "\n", encoding="utf-8")
+
+        refs.append(f"{group}{task_id}" if deps == "key" else label)
+        children.append(0)
+
+    return out_dir
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate a synthetic Tasks/ directory.")
+    parser.add_argument("out_dir", type=Path)
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--groups", type=int, default=10)
+    parser.add_argument("--fan-in", type=int, default=2)
+    parser.add_argument("--fan-out", type=int, default=4)
+    parser.add_argument("--attachment-bytes", type=int, default=0)
+    parser.add_argument("--deps", choices=("key", "label"), default="key")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    generate_corpus(
+        args.out_dir, args.tasks, args.groups, args.fan_in, args.fan_out,
+        args.attachment_bytes, args.deps, seed=args.seed,
+    )
+    print(f"[generate_corpus] Wrote {args.tasks} tasks to {args.out_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Record DAGCanvas interactions and replay them for latency measurements.
+
+Record (needs a real display; events are saved when the window closes):
+
+    python -m Codebase.Bench.interaction_replay record drag.jsonl --tasks Tasks/
+
+Replay against the same corpus (runs under Xvfb when $DISPLAY is unset):
+
+    python -m Codebase.Bench.interaction_replay replay drag.jsonl --tasks Tasks/ -o result.json
+    python -m Codebase.Bench.interaction_replay replay drag.jsonl --generate 10000 \\
+        --baseline baseline.json            # exit 1 on regression
+    python -m Codebase.Bench.interaction_replay replay drag.jsonl --generate 10000 \\
+        --save-baseline baseline.json
+
+The recording is JSONL: a {"meta": ...} header (canvas size, backend,
+node count) then one event per line, e.g.
+{"t": 1.234, "type": "motion", "x": 310, "y": 122}.
+
+Replay calls the canvas' event handlers directly with the recorded
+coordinates (no pointer warping, no real input queue), so a run only
+depends on the recording and the corpus. Latency per event is the
+handler plus ``update_idletasks()``, i.e. until the canvas has redrawn.
+Connect dialogs are answered "yes" automatically and the corpus is
+copied to a temporary directory first, so replays never touch the
+original task files.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from statistics import quantiles
+from types import SimpleNamespace
+from typing import Dict, List
+
+from Codebase.Bench.generate_corpus import generate_corpus
+from Codebase.Bench.virtual_display import virtual_display
+from Codebase.Core.Tracing.log_config import configure_logging
+
+# Tk sequence -> recorded event type
+RECORDED_EVENTS = {
+    "<ButtonPress-1>": "press",
+    "<B1-Motion>": "motion",
+    "<ButtonRelease-1>": "release",
+    "<ButtonPress-3>": "right_press",
+    "<B3-Motion>": "right_motion",
+    "<ButtonRelease-3>": "right_release",
+    "<MouseWheel>": "wheel",
+    "<Button-4>": "wheel",
+    "<Button-5>": "wheel",
+}
+
+# Slack on top of the relative tolerance so sub-millisecond noise
+# does not fail the gate
+ABSOLUTE_SLACK_MS = 1.0
+
+
+def _handlers() -> Dict[str, object]:
+    from Codebase.GUI.GUI.Interaction.on_button_motion import on_button_motion
+    from Codebase.GUI.GUI.Interaction.on_button_press import on_button_press
+    from Codebase.GUI.GUI.Interaction.on_button_release import on_button_release
+    from Codebase.GUI.GUI.Interaction.on_mousewheel import on_mousewheel
+    from Codebase.GUI.GUI.Interaction.on_right_button_motion import on_right_button_motion
+    from Codebase.GUI.GUI.Interaction.on_right_button_press import on_right_button_press
+    from Codebase.GUI.GUI.Interaction.on_right_button_release import on_right_button_release
+
+    return {
+        "press": on_button_press,
+        "motion": on_button_motion,
+        "release": on_button_release,
+        "right_press": on_right_button_press,
+        "right_motion": on_right_button_motion,
+        "right_release": on_right_button_release,
+        "wheel": on_mousewheel,
+    }
+
+
+def _open_canvas(
+    tasks_dir: Path, width: int, height: int, backend: str, publish_edits: bool = True
+):
+    """Tk root + DAGCanvas with rendering finished. Returns (root, canvas)."""
+    import tkinter as tk
+
+    from Codebase.GUI.GUI.dag_canvas import DAGCanvas
+    from Codebase.GUI.Logic.dag_builder import build_dag
+
+    nodes = build_dag(tasks_dir)
+    root = tk.Tk()
+    root.geometry(f"{width}x{height}+0+0")
+    canvas = DAGCanvas(
+        root, nodes, backend=backend, publish_edits=publish_edits, width=width, height=height
+    )
+    canvas.pack(fill="both", expand=True)
+
+    # Let progressive rendering run to completion before anything is timed
+    root.update()
+    while canvas._render_job is not None:
+        root.update()
+        time.sleep(0.001)
+    return root, canvas
+
+
+# ============================
+# Recording
+# ============================
+
+def record(out_path: Path, tasks_dir: Path, width: int, height: int, backend: str) -> int:
+    root, canvas = _open_canvas(tasks_dir, width, height, backend)
+    root.title(f"Recording to {out_path.name} (close window to save)")
+    t0 = time.perf_counter()
+    events: List[dict] = []
+
+    def make_recorder(kind: str):
+        def _record(e) -> None:
+            event = {"t": round(time.perf_counter() - t0, 4), "type": kind, "x": e.x, "y": e.y}
+            if kind == "wheel":
+                event["delta"] = getattr(e, "delta", 0)
+                event["num"] = getattr(e, "num", None)
+            events.append(event)
+        return _record
+
+    for sequence, kind in RECORDED_EVENTS.items():
+        canvas.bind(sequence, make_recorder(kind), add="+")
+
+    meta = {
+        "width": width,
+        "height": height,
+        "backend": canvas.backend,
+        "nodes": len(canvas.nodes),
+    }
+    root.mainloop()
+
+    with out_path.open("w", encoding="utf-8") as f:
+        f.write(json.dumps({"meta": meta}) + "\n")
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+    print(f"[interaction_replay] Recorded {len(events)} events to {out_path}")
+    return 0
+
+
+# ============================
+# Replay
+# ============================
+
+def load_recording(path: Path):
+    meta: dict = {}
+    events: List[dict] = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        if "meta" in item:
+            meta = item["meta"]
+        else:
+            events.append(item)
+    return meta, events
+
+
+@contextlib.contextmanager
+def _auto_confirm_dialogs():
+    """Answer connect_nodes' dialogs without blocking the replay."""
+    from tkinter import messagebox
+
+    saved = (messagebox.askyesno, messagebox.showinfo, messagebox.showerror)
+    messagebox.askyesno = lambda *a, **k: True
+    messagebox.showinfo = lambda *a, **k: "ok"
+    messagebox.showerror = lambda *a, **k: "ok"
+    try:
+        yield
+    finally:
+        messagebox.askyesno, messagebox.showinfo, messagebox.showerror = saved
+
+
+def latency_summary(samples: List[float]) -> dict:
+    """Percentiles in milliseconds."""
+    ms = sorted(s * 1000 for s in samples)
+    if len(ms) == 1:
+        p50 = p90 = p99 = ms[0]
+    else:
+        cuts = quantiles(ms, n=100, method="inclusive")
+        p50, p90, p99 = cuts[49], cuts[89], cuts[98]
+    return {"count": len(ms), "p50_ms": p50, "p90_ms": p90, "p99_ms": p99, "max_ms": ms[-1]}
+
+
+def replay(recording: Path, tasks_dir: Path) -> dict:
+    meta, events = load_recording(recording)
+    width = int(meta.get("width", 1000))
+    height = int(meta.get("height", 700))
+    backend = meta.get("backend", "auto")
+    handlers = _handlers()
+
+    with tempfile.TemporaryDirectory(prefix="dag_replay_") as tmp:
+        work_dir = Path(tmp) / "Tasks"
+        shutil.copytree(tasks_dir, work_dir)
+
+        # Edits go to the scratch copy; running viewers must not see them
+        root, canvas = _open_canvas(work_dir, width, height, backend, publish_edits=False)
+        if meta.get("nodes") not in (None, len(canvas.nodes)):
+            print(
+                f"[interaction_replay] Warning: recorded on {meta['nodes']} nodes, "
+                f"replaying on {len(canvas.nodes)}",
+                file=sys.stderr,
+            )
+
+        samples: Dict[str, List[float]] = {}
+        try:
+            with _auto_confirm_dialogs():
+                for event in events:
+                    kind = event["type"]
+                    tk_event = SimpleNamespace(
+                        widget=canvas,
+                        x=event["x"],
+                        y=event["y"],
+                        delta=event.get("delta", 0),
+                        num=event.get("num"),
+                    )
+                    t0 = time.perf_counter()
+                    handlers[kind](canvas, tk_event)
+                    canvas.update_idletasks()
+                    samples.setdefault(kind, []).append(time.perf_counter() - t0)
+                    # Deliver anything the handler scheduled (untimed)
+                    root.update()
+        finally:
+            root.destroy()
+
+    all_samples = [s for values in samples.values() for s in values]
+    return {
+        "recording": str(recording),
+        "meta": meta,
+        "events": {kind: latency_summary(values) for kind, values in sorted(samples.items())},
+        "overall": latency_summary(all_samples) if all_samples else None,
+    }
+
+
+def compare_to_baseline(result: dict, baseline: dict, metric: str, tolerance: float) -> List[str]:
+    """Human-readable regressions; empty when within tolerance."""
+    regressions = []
+    for kind, stats in result["events"].items():
+        base = baseline.get("events", {}).get(kind)
+        if base is None:
+            continue
+        limit = base[metric] * (1 + tolerance) + ABSOLUTE_SLACK_MS
+        if stats[metric] > limit:
+            regressions.append(
+                f"{kind}: {metric} {stats[metric]:.2f} ms > {limit:.2f} ms "
+                f"(baseline {base[metric]:.2f} ms)"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Record / replay DAGCanvas interactions.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rec = sub.add_parser("record", help="Record events from an interactive session")
+    rec.add_argument("output", type=Path)
+    rec.add_argument("--tasks", type=Path, required=True)
+    rec.add_argument("--width", type=int, default=1000)
+    rec.add_argument("--height", type=int, default=700)
+    rec.add_argument("--backend", choices=("auto", "items", "tiles"), default="auto")
+
+    rep = sub.add_parser("replay", help="Replay a recording and report latency")
+    rep.add_argument("recording", type=Path)
+    corpus = rep.add_mutually_exclusive_group(required=True)
+    corpus.add_argument("--tasks", type=Path)
+    corpus.add_argument("--generate", type=int, metavar="N",
+                        help="Replay on a synthetic corpus of N tasks (seed 0)")
+    rep.add_argument("-o", "--output", type=Path, default=None, help="JSON results (default: stdout)")
+    rep.add_argument("--baseline", type=Path, default=None, help="Fail on regression against this result file")
+    rep.add_argument("--save-baseline", type=Path, default=None)
+    rep.add_argument("--metric", choices=("p50_ms", "p90_ms", "p99_ms", "max_ms"), default="p90_ms")
+    rep.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative slowdown (0.25 = 25%%)")
+
+    args = parser.parse_args(argv)
+    configure_logging()
+
+    if args.command == "record":
+        return record(args.output, args.tasks, args.width, args.height, args.backend)
+
+    with virtual_display() as display, tempfile.TemporaryDirectory(prefix="dag_corpus_") as tmp:
+        if display is None:
+            print("[interaction_replay] No $DISPLAY and no Xvfb available", file=sys.stderr)
+            return 2
+        tasks_dir = args.tasks
+        if tasks_dir is None:
+            tasks_dir = generate_corpus(Path(tmp), args.generate)
+        result = replay(args.recording, tasks_dir)
+
+    text = json.dumps(result, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    if args.save_baseline is not None:
+        args.save_baseline.write_text(text + "\n", encoding="utf-8")
+
+    for kind, stats in result["events"].items():
+        print(
+            f"{kind:>14} n={stats['count']:<5} p50={stats['p50_ms']:7.2f} "
+            f"p90={stats['p90_ms']:7.2f} p99={stats['p99_ms']:7.2f} ms",
+            file=sys.stderr,
+        )
+
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare_to_baseline(result, baseline, args.metric, args.tolerance)
+        for line in regressions:
+            print(f"[interaction_replay] REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+        print("[interaction_replay] No regressions against baseline", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
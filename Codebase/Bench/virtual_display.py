@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Run Tk code on machines without a display.
+
+    with virtual_display() as display:
+        if display is None:
+            ...  # no X available: skip canvas work
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import subprocess
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# How long Xvfb gets to create its socket
+START_TIMEOUT = 5.0
+
+
+@contextmanager
+def virtual_display(size: str = "1280x1024x24") -> Iterator[Optional[str]]:
+    """
+    Yield a usable DISPLAY name.
+
+    - Reuses $DISPLAY when set.
+    - Otherwise starts Xvfb on a free display number and stops it afterwards.
+    - Yields None when neither is available, or Xvfb does not come up.
+    """
+    if os.environ.get("DISPLAY"):
+        yield os.environ["DISPLAY"]
+        return
+
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        yield None
+        return
+
+    number = next(n for n in range(99, 199) if not os.path.exists(f"/tmp/.X{n}-lock"))
+    display = f":{number}"
+    proc = subprocess.Popen(
+        [xvfb, display, "-screen", "0", size, "-nolisten", "tcp"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    socket_path = f"/tmp/.X11-unix/X{number}"
+    try:
+        # Wait for the server socket to appear (or Xvfb to give up)
+        deadline = time.monotonic() + START_TIMEOUT
+        while proc.poll() is None and not os.path.exists(socket_path) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        if proc.poll() is not None or not os.path.exists(socket_path):
+            logger.warning("Xvfb did not start on %s (exit code %s)", display, proc.returncode)
+            yield None
+            return
+        os.environ["DISPLAY"] = display
+        try:
+            yield display
+        finally:
+            os.environ.pop("DISPLAY", None)
+    finally:
+        if proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
@@ -17,5 +17,11 @@ if pgrep -x xbindkeys >/dev/null 2>&1; then
     pkill xbindkeys || true
 fi
 
+# Pre-start the resident Create Task window so the first hotkey press is instant
+PYTHON_BIN="$PROJECT_ROOT/.venv/bin/python"
+if [[ -x "$PYTHON_BIN" ]]; then
+    (cd "$PROJECT_ROOT" && PYTHONPATH="$PROJECT_ROOT" nohup "$PYTHON_BIN" -m Codebase.GUI.task_create_daemon >/dev/null 2>&1 &)
+fi
+
 # Start xbindkeys with the project's config
 exec xbindkeys -f "$XBINDSRC"
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Local publish/subscribe channel for task events (Unix datagram sockets).
+
+Every subscriber (e.g. each open DAG viewer) binds its own datagram
+socket inside UserData/.task_channel/. Publishing sends one datagram to
+every socket found there, so any number of viewers can listen at once
+and no broker process is needed. Sockets left behind by crashed
+subscribers are removed the first time a publish to them fails.
+
+Message payload (JSON):
+
+    {
+      "event": "task_created",
+      "key": "AAAA3",
+      "file_path": "/.../Tasks/AAAA3.json",
+      "task": "...", "group": "AAAA", "id": 3, "status": "todo",
+      "depends_on": ["AAAA1"]
+    }
+
+task_updated messages (sent after a compare-and-swap write, see
+FileIO/task_document.py) carry the same fields plus "rev".
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from Codebase.Core.Pathing.project_paths import ProjectPaths
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_DIR = ProjectPaths.userdata / ".task_channel"
+
+# Header fields copied from the task document into task_created messages
+HEADER_FIELDS = ("task", "group", "id", "status", "depends_on")
+
+
+def channel_supported() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+def publish(message: Dict[str, Any], channel_dir: Path | None = None) -> int:
+    """
+    Send ``message`` to every live subscriber. Returns how many got it.
+    Never raises for delivery problems; publishing is best-effort.
+    """
+    channel_dir = channel_dir or CHANNEL_DIR
+    if not channel_supported() or not channel_dir.is_dir():
+        return 0
+
+    payload = json.dumps(message).encode("utf-8")
+    delivered = 0
+    sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    sender.setblocking(False)
+    try:
+        for sock_path in channel_dir.glob("*.sock"):
+            try:
+                sender.sendto(payload, str(sock_path))
+                delivered += 1
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Subscriber is gone; clean up its socket file
+                try:
+                    sock_path.unlink()
+                except OSError:
+                    pass
+            except OSError as e:
+                # e.g. subscriber queue full; skip it this time
+                logger.warning("Could not notify %s: %s", sock_path.name, e)
+    finally:
+        sender.close()
+    return delivered
+
+
+def task_header(path: Path, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the task_created message for a task document on disk."""
+    message: Dict[str, Any] = {
+        "event": "task_created",
+        "key": path.stem,
+        "file_path": str(path),
+    }
+    for field in HEADER_FIELDS:
+        message[field] = data.get(field)
+    return message
+
+
+def publish_task_created(path: Path, data: Dict[str, Any]) -> int:
+    return publish(task_header(path, data))
+
+
+def publish_task_updated(path: Path, data: Dict[str, Any]) -> int:
+    message = task_header(path, data)
+    message["event"] = "task_updated"
+    message["rev"] = data.get("rev")
+    return publish(message)
+
+
+class TaskSubscriber:
+    """
+    Receiving end of the channel. Non-blocking: call receive() when the
+    socket is readable (e.g. from a Tk file handler) to drain messages.
+    """
+
+    def __init__(self, channel_dir: Path | None = None):
+        self.channel_dir = channel_dir or CHANNEL_DIR
+        self.channel_dir.mkdir(parents=True, exist_ok=True)
+        self.path = self.channel_dir / f"{os.getpid()}-{uuid.uuid4().hex[:8]}.sock"
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.sock.bind(str(self.path))
+        self.sock.setblocking(False)
+
+    @classmethod
+    def open(cls, channel_dir: Path | None = None) -> Optional["TaskSubscriber"]:
+        """Subscriber, or None when the platform has no Unix sockets."""
+        if not channel_supported():
+            return None
+        try:
+            return cls(channel_dir)
+        except OSError as e:
+            logger.warning("Could not subscribe: %s", e)
+            return None
+
+    def fileno(self) -> int:
+        return self.sock.fileno()
+
+    def receive(self) -> List[Dict[str, Any]]:
+        messages: List[Dict[str, Any]] = []
+        while True:
+            try:
+                data = self.sock.recv(65536)
+            except (BlockingIOError, InterruptedError):
+                break
+            try:
+                messages.append(json.loads(data.decode("utf-8")))
+            except ValueError:
+                logger.warning("Dropped malformed message")
+        return messages
+
+    def close(self) -> None:
+        self.sock.close()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Logging setup shared by the entrypoints.
+
+Library modules only do ``logger = logging.getLogger(__name__)`` and log
+with %-style arguments, so nothing is formatted for disabled levels.
+Entry points call configure_logging() once; $DAGVIEWER_LOG_LEVEL
+(DEBUG, INFO, WARNING, ...) overrides the default level.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+
+ENV_VAR = "DAGVIEWER_LOG_LEVEL"
+LOG_FORMAT = "[%(asctime)s] [%(name)s] %(levelname)s: %(message)s"
+
+
+def configure_logging(level: int | str = logging.INFO) -> None:
+    level = os.environ.get(ENV_VAR, level)
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+        if not isinstance(level, int):
+            level = logging.INFO
+    logging.basicConfig(level=level, format=LOG_FORMAT, datefmt="%Y-%m-%dT%H:%M:%S")
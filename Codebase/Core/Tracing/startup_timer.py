@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Tiny phase timer for start-up reports.
+
+    timer = StartupTimer()
+    ...; timer.mark("tk_root")          # main-thread phase since last mark
+    timer.record("load_tasks", t0, t1)  # phase measured elsewhere (threads)
+    print(timer.report())
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import List, Optional, Tuple
+
+
+class StartupTimer:
+    def __init__(self, t0: Optional[float] = None):
+        self.t0 = perf_counter() if t0 is None else t0
+        self._last = self.t0
+        # (phase, start offset s, duration s)
+        self.phases: List[Tuple[str, float, float]] = []
+
+    def mark(self, phase: str) -> None:
+        now = perf_counter()
+        self.phases.append((phase, self._last - self.t0, now - self._last))
+        self._last = now
+
+    def record(self, phase: str, start: float, end: float) -> None:
+        self.phases.append((phase, start - self.t0, end - start))
+
+    def report(self, title: str = "Startup timing") -> str:
+        total = perf_counter() - self.t0
+        lines = [f"[{title}]", f"  {'phase':<22}{'start ms':>10}{'took ms':>10}"]
+        for phase, start, duration in sorted(self.phases, key=lambda p: p[1]):
+            lines.append(f"  {phase:<22}{start * 1000:>10.1f}{duration * 1000:>10.1f}")
+        lines.append(f"  {'total':<22}{'':>10}{total * 1000:>10.1f}")
+        return "\n".join(lines)
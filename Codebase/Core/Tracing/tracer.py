@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Nested timing spans with Chrome trace-event export.
+
+    from Codebase.Core.Tracing.tracer import span
+
+    with span("load_task_nodes", tasks=len(files)):
+        ...
+
+    @traced()
+    def compute_levels(nodes): ...
+
+Tracing is off unless $DAGVIEWER_TRACE names an output file (written at
+exit) or enable_tracing() is called. While off, span() hands back a
+shared no-op context manager, so a span costs one function call and a
+flag check. Keep spans out of per-node loops anyway.
+
+Open the exported JSON in chrome://tracing or https://ui.perfetto.dev.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any, Dict, List, Optional
+
+ENV_VAR = "DAGVIEWER_TRACE"
+
+logger = logging.getLogger(__name__)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Tracer:
+    def __init__(self):
+        self.enabled: bool = False
+        self.output: Optional[Path] = None
+        self.events: List[Dict[str, Any]] = []
+        self.pid = os.getpid()
+        # perf_counter has an arbitrary origin; make timestamps start near 0
+        self.origin_ns = perf_counter_ns()
+
+
+_tracer = _Tracer()
+
+
+class _Span:
+    __slots__ = ("name", "args", "start_ns")
+
+    def __init__(self, name: str, args: Dict[str, Any]):
+        self.name = name
+        self.args = args
+        self.start_ns = 0
+
+    def __enter__(self):
+        self.start_ns = perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        end_ns = perf_counter_ns()
+        event = {
+            "name": self.name,
+            "ph": "X",
+            "ts": (self.start_ns - _tracer.origin_ns) / 1000,
+            "dur": (end_ns - self.start_ns) / 1000,
+            "pid": _tracer.pid,
+            "tid": threading.get_ident(),
+        }
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        if self.args:
+            event["args"] = self.args
+        # list.append is atomic, spans may close on any thread
+        _tracer.events.append(event)
+        return False
+
+
+def span(name: str, **args: Any):
+    """Context manager timing the enclosed block as one trace event."""
+    if not _tracer.enabled:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def traced(name: Optional[str] = None):
+    """Decorator: run the whole function inside span(name or qualname)."""
+    def decorate(fn):
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _tracer.enabled:
+                return fn(*args, **kwargs)
+            with _Span(label, {}):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def is_tracing() -> bool:
+    return _tracer.enabled
+
+
+def enable_tracing(output: str | Path | None = None) -> None:
+    """Start recording spans; if output is given it is written at exit."""
+    _tracer.enabled = True
+    if output is not None:
+        _tracer.output = Path(output)
+
+
+def disable_tracing() -> None:
+    _tracer.enabled = False
+
+
+def export_chrome_trace(path: str | Path) -> Path:
+    """Write recorded spans as Chrome trace-event JSON."""
+    path = Path(path)
+    thread_names = {t.ident: t.name for t in threading.enumerate()}
+    meta = [
+        {"name": "thread_name", "ph": "M", "pid": _tracer.pid, "tid": tid, "args": {"name": name}}
+        for tid, name in thread_names.items()
+    ]
+    doc = {"traceEvents": meta + list(_tracer.events), "displayTimeUnit": "ms"}
+    path.write_text(json.dumps(doc), encoding="utf-8")
+    return path
+
+
+@atexit.register
+def _write_on_exit() -> None:
+    if _tracer.output is not None and _tracer.events:
+        export_chrome_trace(_tracer.output)
+        logger.info("Wrote %d trace events to %s", len(_tracer.events), _tracer.output)
+
+
+if os.environ.get(ENV_VAR):
+    enable_tracing(os.environ[ENV_VAR])
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Export the resolved task DAG for other tools (no Tk).
+
+Usage (from project root):
+
+    python -m Codebase.Export.export_graph -o graph.dot
+    python -m Codebase.Export.export_graph -o graph.graphml --positions
+    python -m Codebase.Export.export_graph -o - --format jsonl --group AAAA
+    python -m Codebase.Export.export_graph -o deps.csv --ancestors-of AAAA12 --depth 2
+    python -m Codebase.Export.export_graph -o plan.jsonl.gz --descendants-of AAAA1
+
+Formats: dot, graphml, jsonl (node and edge records, readable by
+Import/import_graph.py) and csv (adjacency list); taken from the file
+suffix unless --format is given, and "*.gz" is compressed. Output is
+written as it is generated, one task / edge at a time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import gzip
+import sys
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional
+
+from Codebase.Core.Pathing.project_paths import ProjectPaths
+from Codebase.Core.Tracing.log_config import configure_logging
+from Codebase.Export.graph_selection import Positions, Selection, select_nodes
+from Codebase.Export.stream_csv import stream_csv
+from Codebase.Export.stream_dot import stream_dot
+from Codebase.Export.stream_graphml import stream_graphml
+from Codebase.Export.stream_jsonl import stream_jsonl
+from Codebase.GUI.Logic.dag_builder import build_dag
+from Codebase.GUI.Logic.layout import compute_grid_layout
+
+EXPORTERS: Dict[str, Callable[[Dict[str, "TaskNode"], Selection, Optional[Positions]], Iterator[str]]] = {
+    "dot": stream_dot,
+    "graphml": stream_graphml,
+    "jsonl": stream_jsonl,
+    "csv": stream_csv,
+}
+_SUFFIX_FORMATS = {
+    ".dot": "dot",
+    ".gv": "dot",
+    ".graphml": "graphml",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".csv": "csv",
+}
+
+
+def export_graph(
+    nodes: Dict[str, "TaskNode"],
+    fmt: str,
+    selection: Optional[Selection] = None,
+    positions: Optional[Positions] = None,
+) -> Iterator[str]:
+    """
+    Chunks of text exporting ``nodes`` (as returned by build_dag) as
+    ``fmt``; see select_nodes for ``selection``, compute_grid_layout for
+    ``positions``.
+    """
+    return EXPORTERS[fmt](nodes, selection or (lambda key: True), positions)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Export the task DAG as DOT, GraphML, JSONL or CSV.")
+    parser.add_argument("-o", "--output", required=True, help="Output file, or '-' for stdout")
+    parser.add_argument("--tasks", type=Path, default=None, help="Tasks directory (default: ProjectPaths.tasks)")
+    parser.add_argument("--format", choices=sorted(EXPORTERS), default=None, help="Override format detection")
+    parser.add_argument("--group", action="append", default=None, help="Only export this group (repeatable)")
+    parser.add_argument("--ancestors-of", metavar="TASK", default=None, help="Only this task and what it depends on")
+    parser.add_argument("--descendants-of", metavar="TASK", default=None, help="Only this task and what depends on it")
+    parser.add_argument("--depth", type=int, default=None, help="Stop --ancestors-of / --descendants-of after this many edges")
+    parser.add_argument("--positions", action="store_true", help="Include the viewer's grid layout (x, y)")
+    args = parser.parse_args(argv)
+    configure_logging()
+
+    tasks_dir: Path = args.tasks or ProjectPaths.tasks
+    if not tasks_dir.is_dir():
+        print(f"[export_graph] Tasks directory not found at:\n  {tasks_dir}", file=sys.stderr)
+        return 1
+
+    fmt = args.format
+    if fmt is None:
+        suffixes = [s.lower() for s in Path(args.output).suffixes if s.lower() != ".gz"]
+        fmt = _SUFFIX_FORMATS.get(suffixes[-1] if suffixes else "", "jsonl" if args.output == "-" else None)
+        if fmt is None:
+            print(f"[export_graph] Cannot tell the format of {args.output}; pass --format", file=sys.stderr)
+            return 1
+
+    # Keep loader chatter off stdout so '-o -' stays clean
+    with contextlib.redirect_stdout(sys.stderr):
+        nodes = build_dag(tasks_dir)
+    try:
+        selection = select_nodes(nodes, args.group, args.ancestors_of, args.descendants_of, args.depth)
+    except KeyError as e:
+        print(f"[export_graph] No task matches {e.args[0]!r}", file=sys.stderr)
+        return 1
+    positions = compute_grid_layout(nodes) if args.positions else None
+    chunks = export_graph(nodes, fmt, selection, positions)
+
+    if args.output == "-":
+        sys.stdout.writelines(chunks)
+        return 0
+    if args.output.lower().endswith(".gz"):
+        out = gzip.open(args.output, "wt", encoding="utf-8", newline="")
+    else:
+        out = open(args.output, "w", encoding="utf-8", newline="", buffering=1 << 16)
+    with out:
+        out.writelines(chunks)
+    print(f"[export_graph] Wrote {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
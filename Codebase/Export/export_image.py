@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Headless DAG image export (no Tk, no display needed).
+
+Usage (from project root):
+
+    python -m Codebase.Export.export_image -o graph.svg
+    python -m Codebase.Export.export_image -o graph.png --scale 0.5
+    python -m Codebase.Export.export_image -o - --group AAAA --group BBBB > graph.svg
+
+Suitable for cron jobs on display-less machines.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import sys
+from pathlib import Path
+
+from Codebase.Core.Pathing.project_paths import ProjectPaths
+from Codebase.Core.Tracing.log_config import configure_logging
+from Codebase.Export.render_png import DEFAULT_MAX_SIZE, render_png
+from Codebase.Export.render_svg import render_svg
+from Codebase.GUI.Logic.dag_builder import build_dag
+from Codebase.GUI.Logic.layout import compute_grid_layout
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Render the task DAG to SVG or PNG.")
+    parser.add_argument("-o", "--output", required=True, help="Output file (.svg / .png), or '-' for SVG on stdout")
+    parser.add_argument("--tasks", type=Path, default=None, help="Tasks directory (default: ProjectPaths.tasks)")
+    parser.add_argument("--format", choices=("svg", "png"), default=None, help="Override format detection")
+    parser.add_argument("--group", action="append", default=None, help="Only draw this group (repeatable)")
+    parser.add_argument("--scale", type=float, default=1.0, help="PNG scale factor")
+    parser.add_argument("--max-size", type=int, default=DEFAULT_MAX_SIZE, help="PNG longest side cap in px")
+    args = parser.parse_args(argv)
+    configure_logging()
+
+    tasks_dir: Path = args.tasks or ProjectPaths.tasks
+    if not tasks_dir.is_dir():
+        print(f"[export_image] Tasks directory not found at:\n  {tasks_dir}", file=sys.stderr)
+        return 1
+
+    fmt = args.format
+    if fmt is None:
+        fmt = "png" if args.output.lower().endswith(".png") else "svg"
+
+    # Keep loader chatter off stdout so '-o -' stays a clean SVG stream
+    with contextlib.redirect_stdout(sys.stderr):
+        nodes = build_dag(tasks_dir)
+    positions = compute_grid_layout(nodes)
+
+    if fmt == "png":
+        if args.output == "-":
+            print("[export_image] PNG output needs a file path.", file=sys.stderr)
+            return 1
+        try:
+            path = render_png(nodes, positions, Path(args.output), args.group, args.scale, args.max_size)
+        except RuntimeError as e:
+            print(e, file=sys.stderr)
+            return 1
+        print(f"[export_image] Wrote {path}", file=sys.stderr)
+        return 0
+
+    if args.output == "-":
+        render_svg(nodes, positions, sys.stdout, args.group)
+    else:
+        with open(args.output, "w", encoding="utf-8", buffering=1 << 16) as f:
+            render_svg(nodes, positions, f, args.group)
+        print(f"[export_image] Wrote {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Which part of a build_dag result the graph exporters write, and the
+fields written per task.
+
+A selection is a predicate over node keys, so the exporters can walk
+``nodes`` lazily instead of copying the subgraph. A group filter costs
+nothing; an ancestors / descendants filter keeps the set of reached keys
+(the size of the answer, not of the graph).
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Callable, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+Selection = Callable[[str], bool]
+Positions = Dict[str, Tuple[float, float]]
+
+# Per-task fields, in output order; x / y follow when positions are given
+NODE_FIELDS = ("key", "label", "group", "id", "status", "level")
+POSITION_FIELDS = ("x", "y")
+
+
+def find_node(nodes: Dict[str, "TaskNode"], ref: str) -> Optional[str]:
+    """Key for a task key, group+id or exact label, in that order (like depends_on)."""
+    if ref in nodes:
+        return ref
+    for key, node in nodes.items():
+        if node.group is not None and node.id is not None and f"{node.group}{node.id}" == ref:
+            return key
+    return next((key for key, node in nodes.items() if node.label == ref), None)
+
+
+def reachable(
+    nodes: Dict[str, "TaskNode"], start: str, upstream: bool, max_depth: Optional[int] = None
+) -> Set[str]:
+    """``start`` plus everything it depends on (upstream) or that depends on it."""
+    seen = {start}
+    queue = deque([(start, 0)])
+    while queue:
+        key, depth = queue.popleft()
+        if max_depth is not None and depth >= max_depth:
+            continue
+        node = nodes[key]
+        for other in node.deps_resolved if upstream else node.children:
+            if other not in seen:
+                seen.add(other)
+                queue.append((other, depth + 1))
+    return seen
+
+
+def select_nodes(
+    nodes: Dict[str, "TaskNode"],
+    groups: Optional[Iterable[str]] = None,
+    ancestors_of: Optional[str] = None,
+    descendants_of: Optional[str] = None,
+    max_depth: Optional[int] = None,
+) -> Selection:
+    """
+    Predicate for the nodes to export. Filters combine: groups keeps
+    tasks in one of the groups, ancestors_of / descendants_of (task
+    references, see find_node) keep the task and what it depends on /
+    what depends on it, so both together keep the paths between two
+    tasks. Raises KeyError for a reference matching no task.
+    """
+    tests = []
+    if groups:
+        wanted = set(groups)
+        tests.append(lambda key: nodes[key].group in wanted)
+    for ref, upstream in ((ancestors_of, True), (descendants_of, False)):
+        if ref is None:
+            continue
+        start = find_node(nodes, ref)
+        if start is None:
+            raise KeyError(ref)
+        tests.append(reachable(nodes, start, upstream, max_depth).__contains__)
+
+    if not tests:
+        return lambda key: True
+    if len(tests) == 1:
+        return tests[0]
+    return lambda key: all(test(key) for test in tests)
+
+
+def selected_nodes(nodes: Dict[str, "TaskNode"], selection: Selection) -> Iterator["TaskNode"]:
+    for key, node in nodes.items():
+        if selection(key):
+            yield node
+
+
+def selected_edges(nodes: Dict[str, "TaskNode"], selection: Selection) -> Iterator[Tuple[str, str]]:
+    """(dependency, dependent) pairs with both ends selected."""
+    for key, node in nodes.items():
+        if not selection(key):
+            continue
+        for dep_key in node.deps_resolved:
+            if selection(dep_key):
+                yield dep_key, key
+
+
+def node_fields(node: "TaskNode", positions: Optional[Positions] = None) -> Dict:
+    """NODE_FIELDS (and x / y) of one task."""
+    fields = {
+        "key": node.key,
+        "label": node.label,
+        "group": node.group,
+        "id": node.id,
+        "status": node.status,
+        "level": node.level,
+    }
+    if positions is not None:
+        fields["x"], fields["y"] = positions.get(node.key, (None, None))
+    return fields
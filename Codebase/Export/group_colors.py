@@ -0,0 +1,17 @@
+from typing import Dict
+
+from Codebase.GUI.GUI.Style.generate_color_for_group import generate_color_for_group
+
+
+def collect_group_colors(nodes: Dict[str, "TaskNode"]) -> Dict[str, str]:
+    """
+    Tk-free twin of init_group_styles: group -> color for every
+    non-empty node.group, using the same colors as the canvas.
+    """
+    groups = set()
+    for node in nodes.values():
+        g = getattr(node, "group", None)
+        if g:
+            groups.add(g)
+
+    return {g: generate_color_for_group(None, g) for g in sorted(groups)}
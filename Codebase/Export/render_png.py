@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Rasterise the DAG to a PNG without Tk.
+
+Uses Pillow when installed. The image is drawn directly (no intermediate
+SVG / DOM), so memory is bounded by the image size, which is itself
+capped by ``max_size``.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:
+    Image = None
+
+from Codebase.Export.group_colors import collect_group_colors
+from Codebase.Export.render_svg import DEFAULT_FILL
+from Codebase.GUI.Logic.layout import NODE_HEIGHT, NODE_WIDTH, layout_extent
+
+DEFAULT_MAX_SIZE = 16384  # px, longest side
+
+
+def fit_scale(max_x: float, max_y: float, scale: float, max_size: int) -> float:
+    """
+    Shrink ``scale`` if needed so the longest image side fits in max_size.
+    """
+    longest = max(max_x, max_y, 1.0) * scale
+    if longest > max_size:
+        scale *= max_size / longest
+    return scale
+
+
+def render_png(
+    nodes: Dict[str, "TaskNode"],
+    positions: Dict[str, Tuple[float, float]],
+    out_path: Path,
+    groups: Optional[Iterable[str]] = None,
+    scale: float = 1.0,
+    max_size: int = DEFAULT_MAX_SIZE,
+    viewport: Optional[Tuple[float, float, float, float]] = None,
+) -> Path:
+    """
+    Draw ``nodes`` at ``positions`` into a PNG at out_path.
+
+    viewport:
+        Optional (x, y, width, height) area in layout coordinates; only
+        that window of the graph is drawn (e.g. the viewer's first frame).
+
+    Labels are skipped once nodes get too small to read.
+    """
+    if Image is None:
+        raise RuntimeError(
+            "[render_png] Pillow is not installed; run 'pip install pillow' "
+            "or export to SVG instead."
+        )
+
+    visible_groups = set(groups) if groups is not None else None
+    group_colors = collect_group_colors(nodes)
+    if viewport is None:
+        ox = oy = 0.0
+        max_x, max_y = layout_extent(positions)
+    else:
+        ox, oy, max_x, max_y = viewport
+    scale = fit_scale(max_x, max_y, scale, max_size)
+
+    width = max(1, int(max_x * scale))
+    height = max(1, int(max_y * scale))
+    img = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(img)
+    font = ImageFont.load_default()
+
+    def visible(node) -> bool:
+        g = getattr(node, "group", None)
+        return visible_groups is None or not g or g in visible_groups
+
+    def in_view(x1: float, y1: float, x2: float, y2: float) -> bool:
+        return x2 >= ox and x1 <= ox + max_x and y2 >= oy and y1 <= oy + max_y
+
+    half_w = NODE_WIDTH / 2 * scale
+    half_h = NODE_HEIGHT / 2 * scale
+    line_w = max(1, round(2 * scale))
+    draw_labels = scale >= 0.5
+
+    for key, (x, y) in positions.items():
+        node = nodes[key]
+        if not visible(node):
+            continue
+        if not in_view(x - NODE_WIDTH / 2, y - NODE_HEIGHT / 2, x + NODE_WIDTH / 2, y + NODE_HEIGHT / 2):
+            continue
+        cx, cy = (x - ox) * scale, (y - oy) * scale
+        fill = group_colors.get(getattr(node, "group", None) or "", DEFAULT_FILL)
+        draw.rectangle(
+            (cx - half_w, cy - half_h, cx + half_w, cy + half_h),
+            fill=fill,
+            outline="black",
+            width=line_w,
+        )
+        if draw_labels:
+            draw.text((cx, cy), str(node.label), fill="black", font=font, anchor="mm")
+
+    for key, node in nodes.items():
+        if key not in positions or not visible(node):
+            continue
+        x2, y2 = positions[key]
+        for dep_key in node.deps_resolved:
+            if dep_key not in positions or not visible(nodes[dep_key]):
+                continue
+            x1, y1 = positions[dep_key]
+            if not in_view(min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)):
+                continue
+            draw.line(
+                ((x1 - ox) * scale, (y1 - oy) * scale, (x2 - ox) * scale, (y2 - oy) * scale),
+                fill="black",
+                width=line_w,
+            )
+
+    out_path = Path(out_path)
+    img.save(out_path, format="PNG", optimize=False)
+    return out_path
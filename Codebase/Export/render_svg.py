@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Stream the DAG as an SVG document without Tk.
+
+Elements are written straight to the output stream one node / edge at a
+time, so memory stays flat no matter how many tasks are rendered.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Optional, TextIO, Tuple
+from xml.sax.saxutils import escape
+
+from Codebase.Export.group_colors import collect_group_colors
+from Codebase.GUI.Logic.layout import NODE_HEIGHT, NODE_WIDTH, layout_extent
+
+DEFAULT_FILL = "#f0f0ff"  # same as draw_graph for ungrouped nodes
+
+
+def _is_visible(node, groups: Optional[set]) -> bool:
+    if groups is None:
+        return True
+    g = getattr(node, "group", None)
+    return not g or g in groups
+
+
+def render_svg(
+    nodes: Dict[str, "TaskNode"],
+    positions: Dict[str, Tuple[float, float]],
+    out: TextIO,
+    groups: Optional[Iterable[str]] = None,
+) -> None:
+    """
+    Write an SVG rendering of ``nodes`` (as returned by build_dag) to ``out``.
+
+    positions:
+        key -> (x, y) node centre, e.g. from compute_grid_layout().
+    groups:
+        Optional set of groups to draw; ungrouped nodes are always drawn.
+    """
+    visible_groups = set(groups) if groups is not None else None
+    group_colors = collect_group_colors(nodes)
+    max_x, max_y = layout_extent(positions)
+
+    out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    out.write(
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{max_x:g}" height="{max_y:g}" '
+        f'viewBox="0 0 {max_x:g} {max_y:g}">\n'
+    )
+    out.write(
+        "<defs><marker id=\"a\" viewBox=\"0 0 10 10\" refX=\"10\" refY=\"5\" "
+        "markerWidth=\"6\" markerHeight=\"6\" orient=\"auto\">"
+        "<path d=\"M0,0L10,5L0,10z\"/></marker></defs>\n"
+    )
+    out.write(
+        "<style>"
+        "rect{stroke:#000;stroke-width:2}"
+        "text{font:12px sans-serif;text-anchor:middle;dominant-baseline:central}"
+        "line{stroke:#000;stroke-width:2;marker-end:url(#a)}"
+        "</style>\n"
+        '<rect width="100%" height="100%" fill="white" style="stroke:none"/>\n'
+    )
+
+    # Nodes first, edges on top (same stacking order as the canvas)
+    half_w = NODE_WIDTH / 2
+    half_h = NODE_HEIGHT / 2
+    for key, (x, y) in positions.items():
+        node = nodes[key]
+        if not _is_visible(node, visible_groups):
+            continue
+        fill = group_colors.get(getattr(node, "group", None) or "", DEFAULT_FILL)
+        out.write(
+            f'<rect x="{x - half_w:g}" y="{y - half_h:g}" width="{NODE_WIDTH}" '
+            f'height="{NODE_HEIGHT}" fill="{fill}"/>'
+            f'<text x="{x:g}" y="{y:g}">{escape(str(node.label))}</text>\n'
+        )
+
+    for key, node in nodes.items():
+        if key not in positions or not _is_visible(node, visible_groups):
+            continue
+        x2, y2 = positions[key]
+        for dep_key in node.deps_resolved:
+            if dep_key not in positions or not _is_visible(nodes[dep_key], visible_groups):
+                continue
+            x1, y1 = positions[dep_key]
+            out.write(f'<line x1="{x1:g}" y1="{y1:g}" x2="{x2:g}" y2="{y2:g}"/>\n')
+
+    out.write("</svg>\n")
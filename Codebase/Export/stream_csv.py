@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Stream the DAG as a CSV adjacency list: a header, then one row per task
+with its fields and, last, the keys it depends on separated by spaces.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+from typing import Dict, Iterator, Optional
+
+from Codebase.Export.graph_selection import (
+    NODE_FIELDS,
+    POSITION_FIELDS,
+    Positions,
+    Selection,
+    node_fields,
+    selected_nodes,
+)
+
+
+def stream_csv(
+    nodes: Dict[str, "TaskNode"],
+    selection: Selection,
+    positions: Optional[Positions] = None,
+) -> Iterator[str]:
+    """Lines of the CSV export of the selected part of ``nodes``."""
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n")
+
+    def line(row) -> str:
+        buf.seek(0)
+        buf.truncate()
+        writer.writerow(row)
+        return buf.getvalue()
+
+    columns = NODE_FIELDS + (POSITION_FIELDS if positions is not None else ())
+    yield line(columns + ("depends_on",))
+    for node in selected_nodes(nodes, selection):
+        fields = node_fields(node, positions)
+        deps = " ".join(dep for dep in node.deps_resolved if selection(dep))
+        yield line([fields[c] for c in columns] + [deps])
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Stream the DAG as a Graphviz digraph: every task as a node statement
+with its fields as attributes, then an edge dependency -> task for each
+resolved depends_on entry.
+
+With positions, nodes get pos="x,y!" in points (y negated, since
+Graphviz counts upwards), for "neato -n" to keep the viewer's layout.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterator, Optional
+
+from Codebase.Export.graph_selection import Positions, Selection, node_fields, selected_edges, selected_nodes
+
+
+def _quote(value) -> str:
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{text}"'
+
+
+def stream_dot(
+    nodes: Dict[str, "TaskNode"],
+    selection: Selection,
+    positions: Optional[Positions] = None,
+) -> Iterator[str]:
+    """Lines of the DOT export of the selected part of ``nodes``."""
+    yield "digraph DAG {\n"
+    yield "  node [shape=box];\n"
+    for node in selected_nodes(nodes, selection):
+        fields = node_fields(node, positions)
+        key = fields.pop("key")
+        x, y = fields.pop("x", None), fields.pop("y", None)
+        attrs = [f"{name}={_quote(value)}" for name, value in fields.items() if value is not None]
+        if x is not None:
+            attrs.append(f'pos="{x:g},{-y:g}!"')
+        yield f"  {_quote(key)} [{', '.join(attrs)}];\n"
+    for source, target in selected_edges(nodes, selection):
+        yield f"  {_quote(source)} -> {_quote(target)};\n"
+    yield "}\n"
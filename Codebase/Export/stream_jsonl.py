@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Stream the DAG as JSON Lines: one record per task, then one per edge.
+
+    {"type": "node", "key": "AAAA2", "label": "...", "group": "AAAA", ...}
+    {"type": "edge", "source": "AAAA1", "target": "AAAA2"}      AAAA2 depends on AAAA1
+
+Import/read_jsonl.py reads this back.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Dict, Iterator, Optional
+
+from Codebase.Export.graph_selection import Positions, Selection, node_fields, selected_edges, selected_nodes
+
+
+def stream_jsonl(
+    nodes: Dict[str, "TaskNode"],
+    selection: Selection,
+    positions: Optional[Positions] = None,
+) -> Iterator[str]:
+    """Lines of the JSONL export of the selected part of ``nodes``."""
+    for node in selected_nodes(nodes, selection):
+        yield json.dumps({"type": "node", **node_fields(node, positions)}) + "\n"
+    for source, target in selected_edges(nodes, selection):
+        yield json.dumps({"type": "edge", "source": source, "target": target}) + "\n"
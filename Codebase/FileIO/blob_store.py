@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Codebase/FileIO/blob_store.py
+
+Content-addressed storage for attachment bodies.
+
+Blobs live next to the task files:
+
+    Tasks/.blobs/<first 2 hex chars>/<sha256 hex>      (zlib-compressed)
+
+Task JSON only keeps a reference in place of the attachment content:
+
+    {"name": "notes.txt", "type": "text/plain", "format": "",
+     "blob": "sha256:9f86d0...", "size": 1234}
+
+Identical content is stored once no matter how many tasks attach it.
+Blob files are never rewritten: the name is the hash of the content,
+so an existing file already holds the right bytes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+BLOB_DIR_NAME = ".blobs"
+REF_PREFIX = "sha256:"
+
+
+class BlobStore:
+    def __init__(self, tasks_dir: Path, compress: bool = True):
+        self.root = Path(tasks_dir) / BLOB_DIR_NAME
+        self.compress = compress
+
+    # ---- addressing ----
+
+    def path_for(self, ref: str) -> Path:
+        if not ref.startswith(REF_PREFIX):
+            raise ValueError(f"Not a blob reference: {ref!r}")
+        digest = ref[len(REF_PREFIX):]
+        return self.root / digest[:2] / digest
+
+    def exists(self, ref: str) -> bool:
+        return self.path_for(ref).is_file()
+
+    # ---- read / write ----
+
+    def put(self, content: str | bytes) -> str:
+        """Store content (UTF-8 for str) and return its reference."""
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        ref = REF_PREFIX + hashlib.sha256(data).hexdigest()
+        path = self.path_for(ref)
+        if path.is_file():
+            return ref  # dedup: same hash, same bytes
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Stored form: 1 flag byte (z = zlib, r = raw) + payload
+        stored = b"z" + zlib.compress(data, 6) if self.compress else b"r" + data
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(stored)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        logger.debug("Stored blob %s (%d bytes)", ref, len(data))
+        return ref
+
+    def get(self, ref: str) -> bytes:
+        stored = self.path_for(ref).read_bytes()
+        flag, payload = stored[:1], stored[1:]
+        data = zlib.decompress(payload) if flag == b"z" else payload
+        if REF_PREFIX + hashlib.sha256(data).hexdigest() != ref:
+            raise ValueError(f"Blob {ref} is corrupt")
+        return data
+
+    def get_text(self, ref: str) -> str:
+        return self.get(ref).decode("utf-8")
+
+
+# ============================
+# Task document helpers
+# ============================
+
+def externalize_attachments(data: Dict[str, Any], store: BlobStore) -> int:
+    """
+    Move inline attachment contents of a task document (or Task context)
+    into the store, replacing them with references. Returns how many
+    attachments were moved. Works on dicts in place.
+    """
+    moved = 0
+    for update in data.get("updates", []) or []:
+        for attachment in update.get("attachments", []) or []:
+            if "content" not in attachment or attachment.get("blob"):
+                continue
+            content = attachment.pop("content")
+            content = content if isinstance(content, str) else str(content)
+            attachment["blob"] = store.put(content)
+            attachment["size"] = len(content.encode("utf-8"))
+            moved += 1
+    return moved
+
+
+def fetch_attachment(attachment: Dict[str, Any], store: BlobStore) -> str:
+    """Attachment text, read from the store only when it is asked for."""
+    if attachment.get("blob"):
+        return store.get_text(attachment["blob"])
+    return attachment.get("content", "")
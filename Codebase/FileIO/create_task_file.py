@@ -7,20 +7,25 @@ Create a task JSON file from a Jinja2 template.
 - This file lives at: Codebase/FileIO/create_task_file.py
 - Template lives at:  Codebase/Template/task_template.json.j2
 - Output lives at:    <project_root>/Tasks/<group><id>.json   (e.g. AAAA1.json)
+- Attachment bodies:  <project_root>/Tasks/.blobs/   (see blob_store.py)
 """
 
 from __future__ import annotations
 
 from dataclasses import is_dataclass, asdict
 from pathlib import Path
-from datetime import datetime
+import json
+import logging
 import re
 from typing import Any, Dict
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
 # Import the ID generator (expects: get_new_task_id(group: str) -> int)
+from Codebase.FileIO.blob_store import BlobStore, externalize_attachments
 from Codebase.FileIO.get_new_task_id import get_new_task_id
+from Codebase.Core.IPC.task_channel import publish_task_created
+from Codebase.Core.Tracing.tracer import span, traced
 
 
 # Determine paths relative to this file
@@ -30,10 +35,10 @@ PROJECT_ROOT = CODEBASE_DIR.parent                     # .../
 TEMPLATE_DIR = CODEBASE_DIR / "Template"               # .../Codebase/Template
 DEFAULT_OUTPUT_DIR = PROJECT_ROOT / "Tasks"            # .../Tasks
 
+logger = logging.getLogger(__name__)
 
-def _now_str() -> str:
-    """Simple ISO-like timestamp for logs."""
-    return datetime.now().isoformat(timespec="seconds")
+# IDs tried when concurrent writers keep taking the next free one
+MAX_ID_ATTEMPTS = 16
 
 
 def _slugify(text: str) -> str:
@@ -71,17 +76,17 @@ def _task_to_context(task: Any) -> dict:
     # Prefer the Task.to_dict() method if it exists
     if hasattr(task, "to_dict") and callable(getattr(task, "to_dict")):
         data = task.to_dict()
-        print(f"[{_now_str()}] [create_task_file] Using task.to_dict() for context.")
+        logger.debug("Using task.to_dict() for context.")
     elif is_dataclass(task):
         data = asdict(task)
-        print(f"[{_now_str()}] [create_task_file] Using asdict() on dataclass Task.")
+        logger.debug("Using asdict() on dataclass Task.")
     elif isinstance(task, dict):
         data = dict(task)
-        print(f"[{_now_str()}] [create_task_file] Using dict Task context.")
+        logger.debug("Using dict Task context.")
     else:
         # Generic object with attributes
         data = {k: v for k, v in vars(task).items() if not k.startswith("_")}
-        print(f"[{_now_str()}] [create_task_file] Using vars() on generic Task object.")
+        logger.debug("Using vars() on generic Task object.")
 
     # Ensure reasonable defaults
     data.setdefault("depends_on", [])
@@ -105,6 +110,7 @@ def _task_to_context(task: Any) -> dict:
     return data
 
 
+@traced()
 def create_task_file(task: Any, output_dir: str | Path | None = None) -> Path:
     """
     Render Codebase/Template/task_template.json.j2 using `task`
@@ -146,29 +152,51 @@ def create_task_file(task: Any, output_dir: str | Path | None = None) -> Path:
     group = group.strip().upper()
     context["group"] = group  # normalize group in context
 
-    # Get a new unique numeric task ID for this group and force it into the context
+    task_name = context.get("task", "task")
+
+    # Attachment bodies go to Tasks/.blobs; the JSON only keeps references.
+    # Only once the task is known to be valid, so no orphan blobs are left.
+    with span("create_task_file.blobs"):
+        externalize_attachments(context, BlobStore(output_dir))
+
+    # Get a new unique numeric task ID for this group and force it into the
+    # context. Files are created exclusively: if another writer took the
+    # same ID first, move on to the next one instead of overwriting it.
     new_task_id = get_new_task_id(group)
-    context["id"] = new_task_id
+    for _attempt in range(MAX_ID_ATTEMPTS):
+        context["id"] = new_task_id
 
-    # Combined task identifier: EEEEID (e.g. AAAA1)
-    task_id_str = f"{group}{new_task_id}"
+        # Filename is "<group><id>.json" (e.g. AAAA1.json)
+        output_path = output_dir / f"{group}{new_task_id}.json"
 
-    # Filename is "<group><id>.json" (e.g. AAAA1.json)
-    filename = f"{task_id_str}.json"
-    output_path = output_dir / filename
+        logger.debug(
+            "Rendering task %r (group=%s, id=%s) to: %s",
+            task_name, group, new_task_id, output_path,
+        )
 
-    task_name = context.get("task", "task")
+        # Render and write
+        with span("create_task_file.render"):
+            rendered = template.render(**context)
+        try:
+            with span("create_task_file.write"):
+                with output_path.open("x", encoding="utf-8") as f:
+                    f.write(rendered + "\n")
+            break
+        except FileExistsError:
+            logger.debug("%s was taken meanwhile, trying the next ID", output_path.name)
+            new_task_id = max(get_new_task_id(group), new_task_id + 1)
+    else:
+        raise FileExistsError(f"[create_task_file] No free {group} task ID after {MAX_ID_ATTEMPTS} attempts")
 
-    print(
-        f"[{_now_str()}] [create_task_file] Rendering task '{task_name}' "
-        f"(group={group}, id={new_task_id}) to: {output_path}"
-    )
+    logger.info("Wrote task file: %s", output_path)
 
-    # Render and write
-    rendered = template.render(**context)
-    output_path.write_text(rendered + "\n", encoding="utf-8")
+    # Let running viewers add the node without rescanning Tasks/
+    try:
+        with span("create_task_file.publish"):
+            publish_task_created(output_path, json.loads(rendered))
+    except ValueError as e:
+        logger.warning("Task not published: %s", e)
 
-    print(f"[{_now_str()}] [create_task_file] Wrote task file: {output_path}")
     return output_path
 
 
@@ -186,5 +214,8 @@ if __name__ == "__main__":
             self.depends_on = ["clean_data"]
             self.updates = []
 
+    from Codebase.Core.Tracing.log_config import configure_logging
+
+    configure_logging()
     path = create_task_file(MockTask())
     print(f"Created task file at: {path}")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Codebase/FileIO/migrate_attachments.py
+
+Move inline attachment contents of existing task files into the blob
+store (see blob_store.py). Files without inline attachments are left
+untouched; running it twice is harmless.
+
+    python -m Codebase.FileIO.migrate_attachments [--tasks DIR] [--dry-run] [--no-compress]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import sys
+from pathlib import Path
+
+from Codebase.Core.Pathing.project_paths import ProjectPaths
+from Codebase.Core.Tracing.log_config import configure_logging
+from Codebase.FileIO.blob_store import REF_PREFIX, BlobStore, externalize_attachments
+from Codebase.FileIO.task_document import render_task_document, update_task_document
+
+logger = logging.getLogger(__name__)
+
+
+class _HashOnlyStore:
+    """Dry-run stand-in for BlobStore: computes references, writes nothing."""
+
+    def put(self, content: str | bytes) -> str:
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        return REF_PREFIX + hashlib.sha256(data).hexdigest()
+
+
+def migrate_tasks_dir(tasks_dir: Path, dry_run: bool = False, compress: bool = True) -> dict:
+    store = _HashOnlyStore() if dry_run else BlobStore(tasks_dir, compress=compress)
+    stats = {"files": 0, "migrated_files": 0, "attachments": 0, "bytes_before": 0, "bytes_after": 0}
+
+    for json_file in sorted(tasks_dir.glob("*.json")):
+        stats["files"] += 1
+        text = json_file.read_text(encoding="utf-8")
+        try:
+            data = json.loads(text)
+        except ValueError as e:
+            logger.warning("Skipping %s: %s", json_file.name, e)
+            continue
+
+        moved = externalize_attachments(data, store)
+        if not moved:
+            continue
+
+        new_text = render_task_document(data)
+        stats["migrated_files"] += 1
+        stats["attachments"] += moved
+        stats["bytes_before"] += len(text.encode("utf-8"))
+        stats["bytes_after"] += len(new_text.encode("utf-8"))
+        if not dry_run:
+            # Re-applied to the current file if it changed since we read it
+            update_task_document(
+                json_file, lambda d: externalize_attachments(d, store) > 0, publish=False
+            )
+
+    return stats
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Move inline attachments into the blob store.")
+    parser.add_argument("--tasks", type=Path, default=None, help="Tasks directory (default: ProjectPaths.tasks)")
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--no-compress", action="store_true")
+    args = parser.parse_args(argv)
+    configure_logging()
+
+    tasks_dir = args.tasks or ProjectPaths.tasks
+    if not tasks_dir.is_dir():
+        print(f"[migrate_attachments] Tasks directory not found at:\n  {tasks_dir}")
+        return 1
+
+    stats = migrate_tasks_dir(tasks_dir, args.dry_run, not args.no_compress)
+    verb = "Would migrate" if args.dry_run else "Migrated"
+    print(
+        f"[migrate_attachments] {verb} {stats['attachments']} attachments in "
+        f"{stats['migrated_files']}/{stats['files']} files "
+        f"({stats['bytes_before']} -> {stats['bytes_after']} bytes of JSON)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
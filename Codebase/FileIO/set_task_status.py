@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Codebase/FileIO/set_task_status.py
+
+Write a task's "status" field (see Object/task_status.py), with a
+compare-and-swap write so concurrent edits of other fields are kept.
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+from Codebase.FileIO.task_document import update_task_document
+from Codebase.Object.task_status import normalize_status
+
+logger = logging.getLogger(__name__)
+
+
+def set_task_status(task_file: Path, status: str, publish: bool = True) -> str:
+    """Set "status" in the task JSON and return the stored value."""
+    status = normalize_status(status)
+
+    def edit(data: dict) -> bool:
+        if data.get("status") == status:
+            return False
+        data["status"] = status
+        return True
+
+    update_task_document(Path(task_file), edit, publish=publish)
+    logger.info("Set status of %s to %s", task_file, status)
+    return status
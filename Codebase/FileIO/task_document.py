@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Codebase/FileIO/task_document.py
+
+Compare-and-swap writes for task JSON files.
+
+Several processes edit Tasks/ at once (viewers, the create-task window,
+scripts). Instead of blind read-modify-write, writers go through
+update_task_document():
+
+    data, changed = update_task_document(task_file, lambda d: d.update(status="done"))
+
+The edit function is applied to a fresh read of the document; the result
+is only written if the file still holds exactly the bytes that were read
+(its version, a content hash). If someone else wrote in between, the
+edit is re-applied to their version and tried again. Edits should
+therefore be written as "make it so" steps (set a field, append a
+dependency if missing), which makes concurrent edits merge instead of
+overwrite each other. An edit returning False means "nothing to do" and
+skips the write.
+
+Every successful write bumps the document's "rev" counter and is
+announced on the task channel (task_updated), so running viewers can
+apply it without reloading.
+
+The check-and-replace itself holds a short per-file lock
+(Tasks/.locks/<name>.lock); there is no lock across files or while the
+edit runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import random
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from Codebase.Core.IPC.task_channel import publish_task_updated
+
+logger = logging.getLogger(__name__)
+
+LOCK_DIR_NAME = ".locks"
+
+# Seconds update_task_document keeps retrying a busy file before giving
+# up (edits are re-applied, so a conflict alone is never a reason to fail)
+UPDATE_TIMEOUT = 60.0
+# Longest back-off between two attempts, in seconds
+MAX_BACKOFF = 0.05
+
+
+class VersionConflict(RuntimeError):
+    """The task file changed since it was read."""
+
+
+def document_version(raw: bytes) -> str:
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def read_task_document(task_file: Path) -> Tuple[Dict[str, Any], str]:
+    """The parsed task JSON and its version."""
+    raw = Path(task_file).read_bytes()
+    return json.loads(raw), document_version(raw)
+
+
+def render_task_document(data: Dict[str, Any]) -> str:
+    return json.dumps(data, indent=2) + "\n"
+
+
+@contextmanager
+def file_lock(path: Path, shared: bool = False) -> Iterator[None]:
+    """
+    Advisory lock on ``path`` (.locks/<name>.lock next to it); shared
+    locks exclude only exclusive ones (Windows: always exclusive).
+    """
+    path = Path(path)
+    lock_dir = path.parent / LOCK_DIR_NAME
+    lock_dir.mkdir(exist_ok=True)
+    with open(lock_dir / (path.name + ".lock"), "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def write_task_document(
+    task_file: Path, data: Dict[str, Any], expected_version: Optional[str]
+) -> str:
+    """
+    Replace the task file with ``data`` if its version is still
+    ``expected_version`` (None: the file must not exist yet).
+    Bumps data["rev"]. Returns the new version; raises VersionConflict.
+    """
+    task_file = Path(task_file)
+    with file_lock(task_file):
+        try:
+            current: Optional[str] = document_version(task_file.read_bytes())
+        except FileNotFoundError:
+            current = None
+        if current != expected_version:
+            raise VersionConflict(f"{task_file} was changed by another writer")
+
+        data["rev"] = int(data.get("rev") or 0) + 1
+        raw = render_task_document(data).encode("utf-8")
+        fd, tmp = tempfile.mkstemp(dir=task_file.parent, prefix=f".{task_file.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(raw)
+            os.replace(tmp, task_file)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    return document_version(raw)
+
+
+def update_task_document(
+    task_file: Path,
+    edit: Callable[[Dict[str, Any]], Optional[bool]],
+    publish: bool = True,
+) -> Tuple[Dict[str, Any], bool]:
+    """
+    Apply ``edit`` (mutates the document in place) and write it with
+    compare-and-swap, re-reading and re-applying on conflicts (with
+    random back-off, for up to UPDATE_TIMEOUT seconds).
+    Returns (document as stored, whether it was written).
+    """
+    task_file = Path(task_file)
+    deadline = time.monotonic() + UPDATE_TIMEOUT
+    attempt = 0
+    while True:
+        data, version = read_task_document(task_file)
+        if edit(data) is False:
+            return data, False
+        try:
+            write_task_document(task_file, data, version)
+        except VersionConflict:
+            attempt += 1
+            if time.monotonic() >= deadline:
+                raise VersionConflict(
+                    f"{task_file} kept changing; gave up after {attempt} attempts"
+                ) from None
+            logger.debug("Conflict writing %s (attempt %d), retrying", task_file, attempt)
+            time.sleep(random.uniform(0, min(MAX_BACKOFF, 0.005 * 2 ** min(attempt, 16))))
+            continue
+        if publish:
+            publish_task_updated(task_file, data)
+        return data, True
+
+
+def append_dependency(
+    task_file: Path, dep: str, publish: bool = True
+) -> Tuple[Dict[str, Any], bool]:
+    """Add ``dep`` to "depends_on" unless it is already there."""
+
+    def edit(data: Dict[str, Any]) -> bool:
+        depends_on = data.get("depends_on")
+        if not isinstance(depends_on, list):
+            depends_on = data["depends_on"] = []
+        if dep in depends_on:
+            return False
+        depends_on.append(dep)
+        return True
+
+    return update_task_document(task_file, edit, publish)
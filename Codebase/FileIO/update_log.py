@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Codebase/FileIO/update_log.py
+
+Append-only update log per task.
+
+New updates are appended as one JSON line to a sidecar next to the task
+file instead of re-rendering the whole document:
+
+    Tasks/AAAA1.json               base document
+    Tasks/AAAA1.updates.jsonl      updates added since the last compaction
+
+Readers see base "updates" followed by the log (load_task_document);
+read_updates(..., tail=n) only reads the end of the log. Once the log
+passes COMPACT_BYTES it is folded into the base document.
+
+Compaction renames the log to AAAA1.updates.<token>.compacting, folds
+that into the base document and records the token there ("compacted_log"),
+then deletes it. It runs under the log's lock (Tasks/.locks), which
+readers take shared, so they never see the log half-moved; a pending
+file whose token the document already has (a compactor died after its
+write) is never folded twice.
+
+    python -m Codebase.FileIO.update_log add Tasks/AAAA1.json --author me --note "done"
+    python -m Codebase.FileIO.update_log compact [--tasks DIR]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from Codebase.FileIO.blob_store import BlobStore, externalize_attachments
+from Codebase.FileIO.task_document import file_lock, update_task_document
+
+logger = logging.getLogger(__name__)
+
+LOG_SUFFIX = ".updates.jsonl"
+PENDING_SUFFIX = ".compacting"
+
+# Document field: token of the last pending log folded in
+COMPACTED_KEY = "compacted_log"
+
+# Fold the log into the base document once it grows past this
+COMPACT_BYTES = 64 * 1024
+
+# Block size for reading the log backwards (tail reads)
+_TAIL_BLOCK = 8192
+
+
+def log_path(task_file: Path) -> Path:
+    task_file = Path(task_file)
+    return task_file.with_name(task_file.stem + LOG_SUFFIX)
+
+
+def pending_logs(task_file: Path) -> List[Path]:
+    """Logs taken over by a compaction that has not finished, oldest first."""
+    task_file = Path(task_file)
+    return sorted(task_file.parent.glob(f"{task_file.stem}.updates.*{PENDING_SUFFIX}"))
+
+
+def _pending_token(path: Path) -> str:
+    return path.name[: -len(PENDING_SUFFIX)].rsplit(".", 1)[-1]
+
+
+def _to_dict(update: Any) -> Dict[str, Any]:
+    if hasattr(update, "to_dict") and callable(getattr(update, "to_dict")):
+        update = update.to_dict()
+    data = dict(update)
+    data["attachments"] = [
+        a.to_dict() if hasattr(a, "to_dict") else dict(a) for a in data.get("attachments", [])
+    ]
+    return data
+
+
+def append_update(task_file: Path, update: Any, compact_bytes: int = COMPACT_BYTES) -> Path:
+    """
+    Append one update (Update object or dict) to the task's log.
+    Attachment bodies go to the blob store first, so the line stays small.
+    Returns the log path.
+    """
+    task_file = Path(task_file)
+    entry = _to_dict(update)
+    externalize_attachments({"updates": [entry]}, BlobStore(task_file.parent))
+
+    path = log_path(task_file)
+    line = json.dumps(entry, separators=(",", ":")) + "\n"
+    # O_APPEND: concurrent writers never interleave within a line. The
+    # shared lock keeps compact() from taking the log away between our
+    # open and our write (appenders still run side by side).
+    with file_lock(path, shared=True):
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, line.encode("utf-8"))
+            size = os.fstat(fd).st_size
+        finally:
+            os.close(fd)
+    logger.debug("Appended update to %s (%d bytes)", path, size)
+
+    if size >= compact_bytes:
+        compact(task_file, min_bytes=compact_bytes)
+    return path
+
+
+def _parse_lines(lines: List[bytes], source: Path) -> List[Dict[str, Any]]:
+    out = []
+    for raw in lines:
+        if not raw.strip():
+            continue
+        try:
+            out.append(json.loads(raw))
+        except ValueError:
+            # A torn last line from a crashed writer; skip it
+            logger.warning("Skipping unreadable line in %s", source)
+    return out
+
+
+def _read_log(path: Path, tail: Optional[int] = None) -> List[Dict[str, Any]]:
+    if not path.is_file():
+        return []
+    if tail is None:
+        return _parse_lines(path.read_bytes().splitlines(), path)
+
+    # Read blocks from the end until we have ``tail`` complete lines
+    with path.open("rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        buf = b""
+        while pos > 0 and buf.count(b"\n") <= tail:
+            step = min(_TAIL_BLOCK, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+    lines = buf.splitlines()
+    if pos > 0:
+        lines = lines[1:]  # first line may be partial
+    return _parse_lines(lines, path)[-tail:] if tail else []
+
+
+def _pending_updates(task_file: Path, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Updates of pending logs not yet folded into ``data``."""
+    out: List[Dict[str, Any]] = []
+    for pending in pending_logs(task_file):
+        if _pending_token(pending) != data.get(COMPACTED_KEY):
+            out.extend(_read_log(pending))
+    return out
+
+
+def read_updates(task_file: Path, tail: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Updates of a task in order (base document, then log).
+    With ``tail`` only the last ``tail`` updates; the base document is
+    only read if the log alone does not have enough.
+    """
+    task_file = Path(task_file)
+    path = log_path(task_file)
+    with file_lock(path, shared=True):
+        logged = _read_log(path, tail)
+        if tail is not None and len(logged) >= tail:
+            return logged
+        data = json.loads(task_file.read_text(encoding="utf-8"))
+        merged = list(data.get("updates", []) or []) + _pending_updates(task_file, data) + logged
+    return merged[-tail:] if tail is not None else merged
+
+
+def load_task_document(task_file: Path) -> Dict[str, Any]:
+    """Task JSON with logged updates merged into "updates"."""
+    task_file = Path(task_file)
+    path = log_path(task_file)
+    with file_lock(path, shared=True):
+        data = json.loads(task_file.read_text(encoding="utf-8"))
+        logged = _pending_updates(task_file, data) + _read_log(path)
+    if logged:
+        data["updates"] = list(data.get("updates", []) or []) + logged
+    return data
+
+
+def compact(task_file: Path, min_bytes: int = 0) -> int:
+    """
+    Fold the log into the base document. Returns how many updates were
+    moved. The log is renamed away first, so updates appended while we
+    work start a fresh log instead of being lost. With ``min_bytes``,
+    a log that another compactor already emptied is left alone.
+    """
+    task_file = Path(task_file)
+    path = log_path(task_file)
+    moved = 0
+    with file_lock(path):
+        # Left over by a compactor that died half-way; finish those first
+        pending = pending_logs(task_file)
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if size and size >= min_bytes:
+            taken = path.with_name(f"{task_file.stem}.updates.{time.time_ns():020d}{PENDING_SUFFIX}")
+            os.replace(path, taken)
+            pending.append(taken)
+
+        for source in pending:
+            token = _pending_token(source)
+            logged = _read_log(source)
+
+            def edit(data: Dict[str, Any], token=token, logged=logged) -> bool:
+                if data.get(COMPACTED_KEY) == token:
+                    return False  # already folded in before a crash
+                data["updates"] = list(data.get("updates", []) or []) + logged
+                data[COMPACTED_KEY] = token
+                return True
+
+            # Compare-and-swap: other fields edited meanwhile are kept
+            _, written = update_task_document(task_file, edit, publish=False)
+            if written:
+                moved += len(logged)
+            source.unlink(missing_ok=True)
+
+    if moved:
+        logger.info("Compacted %d updates into %s", moved, task_file)
+    return moved
+
+
+def main(argv: list[str] | None = None) -> int:
+    from Codebase.Core.Pathing.project_paths import ProjectPaths
+    from Codebase.Core.Tracing.log_config import configure_logging
+    from Codebase.Object.update import Update
+
+    parser = argparse.ArgumentParser(description="Task update log.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    add = sub.add_parser("add", help="Append an update to a task")
+    add.add_argument("task_file", type=Path)
+    add.add_argument("--author", required=True)
+    add.add_argument("--note", default="")
+
+    comp = sub.add_parser("compact", help="Fold update logs into their task files")
+    comp.add_argument("--tasks", type=Path, default=None, help="Tasks directory (default: ProjectPaths.tasks)")
+
+    args = parser.parse_args(argv)
+    configure_logging()
+
+    if args.command == "add":
+        if not args.task_file.is_file():
+            print(f"[update_log] Task file not found: {args.task_file}")
+            return 1
+        append_update(args.task_file, Update.new(args.author, args.note))
+        return 0
+
+    tasks_dir = args.tasks or ProjectPaths.tasks
+    moved = sum(
+        compact(p.with_name(p.name[: -len(LOG_SUFFIX)] + ".json"))
+        for p in sorted(tasks_dir.glob("*" + LOG_SUFFIX))
+    )
+    print(f"[update_log] Compacted {moved} updates")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
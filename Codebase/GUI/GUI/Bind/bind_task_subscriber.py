@@ -0,0 +1,29 @@
+import tkinter as tk
+from typing import Optional
+
+from Codebase.Core.IPC.task_channel import TaskSubscriber
+from Codebase.GUI.GUI.Draw.insert_task_node import insert_task_node
+from Codebase.GUI.GUI.JsonUpdate.apply_task_update import apply_task_update
+
+
+def bind_task_subscriber(root: tk.Tk, canvas) -> Optional[TaskSubscriber]:
+    """
+    Subscribe 'canvas' to the local task channel so tasks created elsewhere
+    (Create Task window, scripts) appear immediately, and edits made
+    elsewhere (status, new dependencies) are applied in place.
+
+    Returns the subscriber (close it on exit), or None if unsupported.
+    """
+    subscriber = TaskSubscriber.open()
+    if subscriber is None:
+        return None
+
+    def _on_readable(*_args) -> None:
+        for message in subscriber.receive():
+            if message.get("event") == "task_created":
+                insert_task_node(canvas, message)
+            elif message.get("event") == "task_updated":
+                apply_task_update(canvas, message)
+
+    root.tk.createfilehandler(subscriber.sock, tk.READABLE, _on_readable)
+    return subscriber
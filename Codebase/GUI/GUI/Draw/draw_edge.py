@@ -0,0 +1,30 @@
+import tkinter as tk
+
+from Codebase.GUI.GUI.Draw.get_node_center import get_node_center
+from Codebase.GUI.GUI.Draw.update_edges import update_edges
+
+
+def draw_edge(self, src_key: str, dst_key: str, width: float = 2) -> dict:
+    """
+    Create the arrow item for one src -> dst edge and record it in edge_items.
+    The path comes from the canvas' EdgeRouter (straight/polyline/...).
+    Returns the edge_items entry.
+    """
+    router = self.edge_router
+    points = router.route(
+        src_key,
+        dst_key,
+        get_node_center(self, src_key),
+        get_node_center(self, dst_key),
+    )
+    line = self.create_line(
+        *points,
+        arrow=tk.LAST,
+        width=width,
+        smooth=router.smooth,
+    )
+    edge = {"src": src_key, "dst": dst_key, "line": line}
+    self.edge_items.append(edge)
+    # A new long edge can push others aside in the dummy slots it takes
+    update_edges(self, ())
+    return edge
@@ -1,11 +1,11 @@
-import tkinter as tk
-
+from Codebase.GUI.GUI.Draw.draw_edge import draw_edge
 from Codebase.GUI.GUI.Draw.get_node_center import get_node_center
 from Codebase.GUI.GUI.Style.is_group_visable_for_key import is_group_visible_for_key
 
 
 def draw_edges(self) -> None:
     self.edge_items.clear()
+    edges = []
     for key, node in self.nodes.items():
         # edges from dep -> node.key
         for dep_key in node.deps_resolved:
@@ -18,13 +18,11 @@ def draw_edges(self) -> None:
             if not is_group_visible_for_key(self, key):
                 continue
 
-            src_center = get_node_center(self, dep_key)
-            dst_center = get_node_center(self, key)
+            edges.append((dep_key, key))
 
-            line = self.create_line(
-                *src_center,
-                *dst_center,
-                arrow=tk.LAST,
-                width=2,
-            )
-            self.edge_items.append({"src": dep_key, "dst": key, "line": line})
\ No newline at end of file
+    # Dummy slots for every edge first, so drawing doesn't shift them
+    self.edge_router.plan(
+        (src, dst, get_node_center(self, src), get_node_center(self, dst)) for src, dst in edges
+    )
+    for src, dst in edges:
+        draw_edge(self, src, dst)
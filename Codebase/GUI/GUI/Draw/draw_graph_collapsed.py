@@ -0,0 +1,70 @@
+import math
+from time import perf_counter
+
+from Codebase.Core.Tracing.tracer import traced
+from Codebase.GUI.GUI.Draw.draw_edge import draw_edge
+from Codebase.GUI.GUI.Draw.draw_group_node import draw_group_node
+from Codebase.GUI.GUI.Draw.draw_node import draw_node
+from Codebase.GUI.GUI.Draw.get_node_center import get_node_center
+from Codebase.GUI.GUI.Style.is_group_visable_for_key import is_group_visible_for_key
+from Codebase.GUI.Logic.edge_routing import route_midpoint
+from Codebase.GUI.Logic.group_quotient import super_key_group
+from Codebase.GUI.Logic.layout import compute_level_layout, layout_extent
+
+# Merged edges get thicker with the number of task edges, up to this width
+MAX_EDGE_WIDTH = 8
+
+
+@traced()
+def draw_graph_collapsed(self) -> None:
+    """
+    draw_graph for when some groups are collapsed: each collapsed group is
+    one super-node, edges between drawn nodes are merged and labelled with
+    how many task edges they stand for (see Logic/group_quotient.py).
+    Always uses canvas items; the view is small by construction.
+    """
+    t0 = perf_counter() if self.perf.enabled else None
+    self.delete("all")
+    self.node_items.clear()
+    self.edge_items.clear()
+    # Tiles (if the full graph uses them) are gone with delete("all")
+    self.tile_items.clear()
+    self.tile_cache.clear()
+    self._hover_item = None
+
+    view = self.group_quotient.view(self.collapsed_groups)
+    positions = compute_level_layout(view.levels)
+    self.node_positions = positions
+
+    for key, (x, y) in positions.items():
+        group = super_key_group(key)
+        if group is None:
+            draw_node(self, key, x, y)
+        elif self.group_visible.get(group, True):
+            draw_group_node(self, group, view.sizes[key], x, y)
+
+    edges = [
+        (src, dst, count)
+        for (src, dst), count in view.edges.items()
+        if src in self.node_items and dst in self.node_items
+        and is_group_visible_for_key(self, src) and is_group_visible_for_key(self, dst)
+    ]
+    self.edge_router.plan(
+        (src, dst, get_node_center(self, src), get_node_center(self, dst)) for src, dst, _ in edges
+    )
+    for src, dst, count in edges:
+        edge = draw_edge(self, src, dst, width=min(2 + math.log2(count), MAX_EDGE_WIDTH))
+        if count > 1:
+            edge["label"] = self.create_text(
+                *route_midpoint(self.coords(edge["line"])),
+                text=str(count),
+                fill="#333333",
+                font=("TkDefaultFont", 9, "bold"),
+                tags=("edge_count",),
+            )
+
+    max_x, max_y = layout_extent(positions)
+    self.config(scrollregion=(0, 0, max_x, max_y))
+
+    if t0 is not None:
+        self.perf.record("draw_graph", perf_counter() - t0)
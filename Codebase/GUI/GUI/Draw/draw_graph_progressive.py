@@ -0,0 +1,165 @@
+"""
+Progressive (time-sliced) variant of draw_graph for large graphs.
+
+Nodes are drawn nearest-to-viewport first in small chunks scheduled with
+``after``, so the window paints and reacts to input right away; edges are
+filled in once every node exists. A progress label sits in the viewport
+corner until rendering finishes.
+"""
+
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+from Codebase.Core.Tracing.tracer import traced
+from Codebase.GUI.GUI.Draw.draw_edge import draw_edge
+from Codebase.GUI.GUI.Draw.draw_node import draw_node
+from Codebase.GUI.GUI.Draw.get_node_center import get_node_center
+from Codebase.GUI.GUI.Draw.update_edges import update_edges
+from Codebase.GUI.GUI.Style.is_group_visable_for_key import is_group_visible_for_key
+from Codebase.GUI.Logic.layout import compute_grid_layout, layout_extent
+
+# redraw_all switches to progressive rendering from this many nodes
+PROGRESSIVE_MIN_NODES = 1000
+
+# Max time spent creating items per slice before yielding to the event loop
+SLICE_BUDGET_S = 0.012
+
+
+def _viewport(self) -> Tuple[float, float, float, float]:
+    """(x, y, width, height) of the visible area, using the configured
+    size while the widget is not mapped yet."""
+    w = self.winfo_width()
+    h = self.winfo_height()
+    if w <= 1 or h <= 1:
+        w = int(self.cget("width"))
+        h = int(self.cget("height"))
+    return self.canvasx(0), self.canvasy(0), max(w, 1), max(h, 1)
+
+
+def _priority_order(positions: Dict[str, Tuple[float, float]], viewport) -> List[str]:
+    """
+    Keys ordered by ring distance from the viewport: ring 0 is what is on
+    screen, ring 1 the band of viewport-sized cells around it, and so on.
+    A bucket pass, not a full sort.
+    """
+    vx, vy, vw, vh = viewport
+    cx = vx + vw / 2
+    cy = vy + vh / 2
+    rings: Dict[int, List[str]] = {}
+    for key, (x, y) in positions.items():
+        ring = int(max(abs(x - cx) / vw, abs(y - cy) / vh) + 0.5)
+        rings.setdefault(ring, []).append(key)
+
+    order: List[str] = []
+    for ring in sorted(rings):
+        order.extend(rings[ring])
+    return order
+
+
+def cancel_progressive_render(self) -> None:
+    job = getattr(self, "_render_job", None)
+    if job is not None:
+        self.after_cancel(job)
+        self._render_job = None
+
+
+def _show_progress(self, text: str) -> None:
+    x = self.canvasx(10)
+    y = self.canvasy(10)
+    if self._progress_item is None:
+        self._progress_item = self.create_text(
+            x, y, text=text, anchor="nw", fill="#444444",
+            font=("TkDefaultFont", 10, "bold"), tags=("progress",),
+        )
+    else:
+        self.coords(self._progress_item, x, y)
+        self.itemconfigure(self._progress_item, text=text)
+    self.tag_raise(self._progress_item)
+
+
+@traced()
+def draw_graph_progressive(self) -> None:
+    """
+    Same result as draw_graph, but spread over many event-loop turns.
+    """
+    # Wall time until the last edge is drawn, including event-loop turns
+    t0 = perf_counter() if self.perf.enabled else None
+    cancel_progressive_render(self)
+    self.delete("all")
+    self.node_items.clear()
+    self.edge_items.clear()
+    self._progress_item = None
+
+    positions = compute_grid_layout(self.nodes)
+    self.node_positions = positions
+
+    max_x, max_y = layout_extent(positions)
+    self.config(scrollregion=(0, 0, max_x, max_y))
+
+    order = _priority_order(positions, _viewport(self))
+    total = len(order)
+    state = {"i": 0, "edges": None, "e": 0}
+
+    def _node_slice() -> None:
+        deadline = perf_counter() + SLICE_BUDGET_S
+        i = state["i"]
+        while i < total:
+            key = order[i]
+            draw_node(self, key, *positions[key])
+            i += 1
+            if i % 32 == 0 and perf_counter() >= deadline:
+                break
+        state["i"] = i
+
+        if i < total:
+            _show_progress(self, f"Rendering nodes {i}/{total}")
+            self._render_job = self.after(1, _node_slice)
+            return
+
+        # All nodes exist: snapshot the edge list and fill edges in
+        drawn = {(e["src"], e["dst"]) for e in self.edge_items}
+        edges = [
+            (dep_key, key)
+            for key, node in self.nodes.items()
+            for dep_key in node.deps_resolved
+            if dep_key in self.node_items
+            and key in self.node_items
+            and is_group_visible_for_key(self, dep_key)
+            and is_group_visible_for_key(self, key)
+        ]
+        # Dummy slots for every edge up front (like draw_edges), so the
+        # slices don't keep shifting earlier edges; edges drawn meanwhile
+        # (live inserts) are re-routed into their planned slots
+        self.edge_router.plan(
+            (src, dst, get_node_center(self, src), get_node_center(self, dst)) for src, dst in edges
+        )
+        if drawn:
+            update_edges(self, list(self.edge_items))
+        state["edges"] = [edge for edge in edges if edge not in drawn]
+        _edge_slice()
+
+    def _edge_slice() -> None:
+        edges = state["edges"]
+        deadline = perf_counter() + SLICE_BUDGET_S
+        e = state["e"]
+        while e < len(edges):
+            draw_edge(self, *edges[e])
+            e += 1
+            if e % 64 == 0 and perf_counter() >= deadline:
+                break
+        state["e"] = e
+
+        if e < len(edges):
+            _show_progress(self, f"Rendering edges {e}/{len(edges)}")
+            self._render_job = self.after(1, _edge_slice)
+            return
+
+        self._render_job = None
+        if self._progress_item is not None:
+            self.delete(self._progress_item)
+            self._progress_item = None
+        if t0 is not None:
+            self.perf.record("draw_graph", perf_counter() - t0)
+
+    _show_progress(self, f"Rendering nodes 0/{total}")
+    self._render_job = self.after(0, _node_slice)
@@ -0,0 +1,34 @@
+from Codebase.GUI.Logic.group_quotient import super_key
+from Codebase.GUI.Logic.layout import NODE_HEIGHT, NODE_WIDTH
+
+# Collapsed groups are drawn a little larger than tasks, with a dashed border
+GROUP_NODE_PAD = 6
+
+
+def draw_group_node(self, group: str, size: int, x: float, y: float) -> None:
+    """
+    Create the items for a collapsed group's super-node centred at (x, y).
+    It lives in node_items under super_key(group), so dragging and edge
+    updates treat it like any other node.
+    """
+    key = super_key(group)
+    rect = self.create_rectangle(
+        x - NODE_WIDTH / 2 - GROUP_NODE_PAD,
+        y - NODE_HEIGHT / 2 - GROUP_NODE_PAD,
+        x + NODE_WIDTH / 2 + GROUP_NODE_PAD,
+        y + NODE_HEIGHT / 2 + GROUP_NODE_PAD,
+        outline="black",
+        fill=self.group_colors.get(group, "#f0f0ff"),
+        width=3,
+        dash=(6, 3),
+        tags=("node", "group_node", key),
+    )
+    text = self.create_text(
+        x,
+        y,
+        text=f"{group}\n{size} tasks",
+        justify="center",
+        font=("TkDefaultFont", 10, "bold"),
+        tags=("label", key),
+    )
+    self.node_items[key] = {"rect": rect, "text": text}
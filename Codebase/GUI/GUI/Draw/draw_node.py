@@ -0,0 +1,34 @@
+from Codebase.GUI.GUI.Style.get_node_fill import get_node_fill
+from Codebase.GUI.GUI.Style.get_node_outline import get_node_outline
+from Codebase.GUI.GUI.Style.is_group_visable_for_key import is_group_visible_for_key
+from Codebase.GUI.Logic.layout import NODE_HEIGHT, NODE_WIDTH
+
+
+def draw_node(self, key: str, x: float, y: float) -> None:
+    """
+    Create the rectangle + label items for one node centred at (x, y).
+    """
+    outline, width = get_node_outline(self, key)
+    rect = self.create_rectangle(
+        x - NODE_WIDTH / 2,
+        y - NODE_HEIGHT / 2,
+        x + NODE_WIDTH / 2,
+        y + NODE_HEIGHT / 2,
+        outline=outline,
+        fill=get_node_fill(self, key),
+        width=width,
+        tags=("node", key),
+    )
+    text = self.create_text(
+        x,
+        y,
+        text=self.nodes[key].label,
+        tags=("label", key),
+    )
+
+    self.node_items[key] = {"rect": rect, "text": text}
+
+    # Apply visibility based on group toggle
+    if not is_group_visible_for_key(self, key):
+        self.itemconfigure(rect, state="hidden")
+        self.itemconfigure(text, state="hidden")
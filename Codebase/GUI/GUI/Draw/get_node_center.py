@@ -2,6 +2,9 @@ from typing import Tuple
 
 
 def get_node_center(self, key: str) -> Tuple[float, float]:
-    rect_id = self.node_items[key]["rect"]
-    x1, y1, x2, y2 = self.coords(rect_id)
+    items = self.node_items.get(key)
+    if items is None:
+        # Tile backend: node is baked into the raster tiles, not a canvas item
+        return self.node_positions[key]
+    x1, y1, x2, y2 = self.coords(items["rect"])
     return (x1 + x2) / 2.0, (y1 + y2) / 2.0
\ No newline at end of file
@@ -0,0 +1,92 @@
+from pathlib import Path
+from typing import Any, Dict
+
+from Codebase.GUI.GUI.Draw.draw_edge import draw_edge
+from Codebase.GUI.GUI.Draw.draw_node import draw_node
+from Codebase.GUI.GUI.Style.generate_color_for_group import generate_color_for_group
+from Codebase.GUI.GUI.Style.is_group_visable_for_key import is_group_visible_for_key
+from Codebase.GUI.GUI.Style.redraw_all import redraw_all
+from Codebase.GUI.GUI.Tile.promote_node import add_tile_node
+from Codebase.GUI.IO.workspaces import qualify_key, workspace_for_directory
+from Codebase.GUI.Logic.dag_builder import resolve_node_dependencies
+from Codebase.GUI.Logic.layout import X_MARGIN, X_SPACING, Y_SPACING, Y_START, layout_extent
+from Codebase.Object.task_node import TaskNode
+
+
+def insert_task_node(self, header: Dict[str, Any]) -> None:
+    """
+    Add a task announced on the task channel (see Core/IPC/task_channel.py)
+    to the live graph: resolve its dependencies, place it at the end of its
+    level row and draw it, without rescanning Tasks/.
+
+    The task's directory picks its workspace (and key prefix) when
+    workspaces are loaded; tasks from directories that are not shown
+    (another project publishing on the same channel) are ignored.
+    """
+    stem = header.get("key")
+    if not stem or not header.get("file_path"):
+        return
+    file_path = Path(header["file_path"])
+
+    found, workspace = workspace_for_directory(self.nodes, str(file_path.parent))
+    if not found:
+        return
+    key = qualify_key(workspace, stem)
+    if key in self.nodes:
+        return
+
+    depends_on = header.get("depends_on") or []
+    if not isinstance(depends_on, list):
+        depends_on = []
+
+    node = TaskNode(
+        key=key,
+        label=header.get("task") or stem,
+        file_path=file_path,
+        depends_on_raw=depends_on,
+        group=header.get("group"),
+        id=header.get("id"),
+        status=header.get("status"),
+        workspace=workspace,
+    )
+    self.nodes[key] = node
+    resolve_node_dependencies(self.nodes, key)
+    self.status_rollup.add_node(key)
+
+    # New group: give it a color like init_group_styles would
+    if node.group and node.group not in self.group_colors:
+        self.group_colors[node.group] = generate_color_for_group(self, node.group)
+        self.group_visible[node.group] = True
+
+    # Collapsed view: counts and merged edges change, and it is small
+    # enough to simply redraw
+    self.group_quotient.add_node(key)
+    if self.collapsed_groups:
+        redraw_all(self)
+        for callback in self.node_added_callbacks:
+            callback(key)
+        return
+
+    column = sum(1 for n in self.nodes.values() if n.level == node.level) - 1
+    x = X_MARGIN + column * X_SPACING
+    y = Y_START + node.level * Y_SPACING
+    self.node_positions[key] = (x, y)
+
+    if self.backend == "tiles":
+        add_tile_node(self, key)
+    else:
+        draw_node(self, key, x, y)
+        # Same filter as draw_edges: no edges into or out of hidden groups
+        if is_group_visible_for_key(self, key):
+            for dep_key in node.deps_resolved:
+                if dep_key in self.node_items and is_group_visible_for_key(self, dep_key):
+                    draw_edge(self, dep_key, key)
+
+    # Grow the scroll region if the new node sits outside it
+    region = [float(v) for v in str(self.cget("scrollregion")).split()] or [0, 0, 0, 0]
+    max_x, max_y = layout_extent({key: (x, y)})
+    if max_x > region[2] or max_y > region[3]:
+        self.config(scrollregion=(0, 0, max(max_x, region[2]), max(max_y, region[3])))
+
+    for callback in self.node_added_callbacks:
+        callback(key)
@@ -0,0 +1,22 @@
+import logging
+
+from Codebase.GUI.GUI.Draw.update_edges import update_edges
+
+logger = logging.getLogger(__name__)
+
+
+def set_edge_routing(self, mode: str) -> None:
+    """
+    Switch edge routing mode ("straight", "polyline", "orthogonal",
+    "spline") and re-route the existing edge items in place.
+    """
+    if self.backend == "tiles":
+        # Tiles rasterise straight edges; routing only applies to item mode
+        logger.warning("Edge routing is not available with the tile backend.")
+        return
+
+    self.edge_router.set_mode(mode)
+    smooth = self.edge_router.smooth
+    for edge in self.edge_items:
+        self.itemconfigure(edge["line"], smooth=smooth)
+    update_edges(self)
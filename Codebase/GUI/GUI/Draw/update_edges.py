@@ -1,16 +1,44 @@
+from time import perf_counter
+from typing import Dict, Iterable, Optional
+
 from Codebase.GUI.GUI.Draw.get_node_center import get_node_center
+from Codebase.GUI.Logic.edge_routing import route_midpoint
 
 
-def update_edges(self) -> None:
+def update_edges(self, edges: Optional[Iterable[Dict[str, object]]] = None) -> None:
     """
-    Update all edge line coordinates based on node positions.
+    Update edge line coordinates based on node positions.
+
+    edges:
+        Only re-route these edge_items entries (e.g. the ones incident to
+        a dragged node), plus any whose dummy slot they pushed aside.
+        Defaults to every edge (with fresh dummy slots).
     """
-    for edge in self.edge_items:
+    t0 = perf_counter() if self.perf.enabled else None
+    router = self.edge_router
+    if edges is None:
+        edges = [e for e in self.edge_items if e["src"] in self.node_items and e["dst"] in self.node_items]
+        router.plan((e["src"], e["dst"], get_node_center(self, e["src"]), get_node_center(self, e["dst"])) for e in edges)
+    _reroute(self, edges)
+    displaced = router.take_displaced()
+    if displaced:
+        _reroute(self, [e for e in self.edge_items if (e["src"], e["dst"]) in displaced])
+
+    if t0 is not None:
+        self.perf.record("update_edges", perf_counter() - t0)
+
+
+def _reroute(self, edges: Iterable[Dict[str, object]]) -> None:
+    router = self.edge_router
+    for edge in edges:
         src = edge["src"]
         dst = edge["dst"]
         line_id = edge["line"]
         if src not in self.node_items or dst not in self.node_items:
             continue
-        x1, y1 = get_node_center(self, src)
-        x2, y2 = get_node_center(self, dst)
-        self.coords(line_id, x1, y1, x2, y2)
\ No newline at end of file
+        points = router.route(src, dst, get_node_center(self, src), get_node_center(self, dst))
+        self.coords(line_id, *points)
+        # Edge count badge of a merged (collapsed-group) edge
+        label = edge.get("label")
+        if label is not None:
+            self.coords(label, *route_midpoint(points))
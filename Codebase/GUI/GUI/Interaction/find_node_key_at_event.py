@@ -0,0 +1,19 @@
+from typing import Optional
+
+from Codebase.GUI.GUI.Interaction.find_node_key_from_item import find_node_key_from_item
+
+
+def find_node_key_at_event(self, event) -> Optional[str]:
+    """
+    Node key under the mouse for this event, or None.
+
+    The item backend asks Tk for the closest canvas item; the tile
+    backend has no per-node items, so it asks the spatial index.
+    """
+    if self.backend == "tiles":
+        return self.tile_index.key_at(self.canvasx(event.x), self.canvasy(event.y))
+
+    item = self.find_closest(event.x, event.y)
+    if not item:
+        return None
+    return find_node_key_from_item(self, item[0])
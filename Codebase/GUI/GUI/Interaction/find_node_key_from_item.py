@@ -4,6 +4,7 @@ from typing import Optional
 def find_node_key_from_item(self, item_id: int) -> Optional[str]:
     tags = self.gettags(item_id)
     for t in tags:
-        if t in self.nodes:
+        # node_items also holds collapsed-group super-nodes
+        if t in self.nodes or t in self.node_items:
             return t
     return None
\ No newline at end of file
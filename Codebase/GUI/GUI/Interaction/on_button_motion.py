@@ -17,4 +17,9 @@ def on_button_motion(self, event):
     self.move(rect_id, dx, dy)
     self.move(text_id, dx, dy)
 
-    update_edges(self)
\ No newline at end of file
+    x, y = self.node_positions[key]
+    self.node_positions[key] = (x + dx, y + dy)
+    for callback in self.node_moved_callbacks:
+        callback(key)
+
+    update_edges(self, self._drag_data.get("edges"))
\ No newline at end of file
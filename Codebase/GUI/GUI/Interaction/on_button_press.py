@@ -1,16 +1,19 @@
-from Codebase.GUI.GUI.Interaction.find_node_key_from_item import find_node_key_from_item
+from Codebase.GUI.GUI.Interaction.find_node_key_at_event import find_node_key_at_event
+from Codebase.GUI.GUI.Tile.promote_node import promote_node
 
 
 def on_button_press(self, event):
-    item = self.find_closest(event.x, event.y)
-    if not item:
-        return
-    item_id = item[0]
-
-    key = find_node_key_from_item(self, item_id)
+    key = find_node_key_at_event(self, event)
     if key is None:
         return
 
+    if self.backend == "tiles":
+        promote_node(self, key)
+
     self._drag_data["node_key"] = key
+    # Only edges touching the dragged node need re-routing during motion
+    self._drag_data["edges"] = [
+        e for e in self.edge_items if e["src"] == key or e["dst"] == key
+    ]
     self._drag_data["x"] = event.x
-    self._drag_data["y"] = event.y
\ No newline at end of file
+    self._drag_data["y"] = event.y
@@ -1,2 +1,10 @@
+from Codebase.GUI.GUI.Tile.promote_node import demote_node
+
+
 def on_button_release(self, event):
-    self._drag_data["node_key"] = None
\ No newline at end of file
+    key = self._drag_data["node_key"]
+    self._drag_data["node_key"] = None
+    self._drag_data["edges"] = None
+
+    if key is not None and self.backend == "tiles":
+        demote_node(self, key)
\ No newline at end of file
@@ -1,26 +1,47 @@
 from tkinter import messagebox
 
-from Codebase.GUI.GUI.Interaction.find_node_key_from_item import find_node_key_from_item
+from Codebase.GUI.GUI.Interaction.find_node_key_at_event import find_node_key_at_event
+from Codebase.GUI.GUI.Style.set_groups_collapsed import set_groups_collapsed
+from Codebase.GUI.GUI.Tool.show_attachments import list_attachments, show_attachments
+from Codebase.GUI.Logic.group_quotient import super_key_group
 
 
 def on_double_click(self, event):
-    item = self.find_closest(event.x, event.y)
-    if not item:
-        return
-    item_id = item[0]
-    key = find_node_key_from_item(self, item_id)
+    key = find_node_key_at_event(self, event)
     if key is None:
         return
 
+    # Collapsed group: expand it in place
+    group = super_key_group(key)
+    if group is not None:
+        set_groups_collapsed(self, [group], False)
+        return
+
     node = self.nodes[key]
+    rollup = self.status_rollup
+    up = rollup.ancestor_counts[key]
+    down = rollup.descendant_counts[key]
     info = [
         f"Key: {node.key}",
         f"Label: {node.label}",
         f"File: {node.file_path.name}",
         f"Group: {node.group}",
         f"ID: {node.id}",
+        f"Status: {node.status} ({rollup.states[key]})",
         "",
         f"Depends on: {', '.join(node.deps_resolved) if node.deps_resolved else '(none)'}",
         f"Children: {', '.join(node.children) if node.children else '(none)'}",
+        "",
+        f"Upstream:   {up['done']} done, {up['ready']} ready, {up['blocked']} blocked",
+        f"Downstream: {down['done']} done, {down['ready']} ready, {down['blocked']} blocked",
     ]
-    messagebox.showinfo("Task info", "\n".join(info))
\ No newline at end of file
+
+    # Attachment bodies stay in the blob store until one is opened
+    attachments = list_attachments(node.file_path)
+    if not attachments:
+        messagebox.showinfo("Task info", "\n".join(info))
+        return
+
+    info += ["", f"Attachments: {len(attachments)}", "", "View attachments?"]
+    if messagebox.askyesno("Task info", "\n".join(info)):
+        show_attachments(self, node.file_path, node.label)
@@ -0,0 +1,24 @@
+from Codebase.GUI.Logic.layout import NODE_HEIGHT, NODE_WIDTH
+
+
+def on_hover_motion(self, event):
+    """
+    Tile backend only: outline the node under the cursor with a single
+    live canvas item (tiles themselves are never redrawn for hover).
+    """
+    if self.backend != "tiles":  # collapsed groups are drawn with items
+        return
+    key = self.tile_index.key_at(self.canvasx(event.x), self.canvasy(event.y))
+    if key is None:
+        if self._hover_item is not None:
+            self.itemconfigure(self._hover_item, state="hidden")
+        return
+
+    x, y = self.node_positions[key]
+    box = (x - NODE_WIDTH / 2, y - NODE_HEIGHT / 2, x + NODE_WIDTH / 2, y + NODE_HEIGHT / 2)
+    if self._hover_item is None:
+        self._hover_item = self.create_rectangle(*box, outline="#3a7bd5", width=3, tags=("hover",))
+    else:
+        self.coords(self._hover_item, *box)
+        self.itemconfigure(self._hover_item, state="normal")
+    self.tag_raise(self._hover_item)
@@ -0,0 +1,29 @@
+from tkinter import messagebox
+
+from Codebase.FileIO.set_task_status import set_task_status
+from Codebase.GUI.GUI.Interaction.find_node_key_at_event import find_node_key_at_event
+from Codebase.GUI.GUI.Style.restyle_nodes import restyle_nodes
+from Codebase.Object.task_status import next_status
+
+
+def on_middle_click(self, event):
+    """Cycle the status of the node under the cursor (todo -> in_progress -> done -> blocked)."""
+    key = find_node_key_at_event(self, event)
+    if key is None or key not in self.nodes or self.read_only:  # nothing, a collapsed group, or no task file
+        return
+
+    node = self.nodes[key]
+    try:
+        status = set_task_status(node.file_path, next_status(node.status), publish=self.publish_edits)
+    except Exception as e:
+        messagebox.showerror(
+            "Error writing task file",
+            f"Could not update status in:\n{node.file_path}\n\n{e}",
+        )
+        return
+
+    changed = self.status_rollup.set_status(key, status)
+    # The node itself always changes shade, even if its state did not flip
+    restyle_nodes(self, {key, *changed})
+    for callback in self.status_changed_callbacks:
+        callback(key)
@@ -1,5 +1,11 @@
+from Codebase.GUI.GUI.Tile.refresh_visible_tiles import refresh_visible_tiles
+
+
 def on_mousewheel(self, event):
     if getattr(event, "num", None) == 4 or event.delta > 0:
         self.yview_scroll(-2, "units")
     else:
-        self.yview_scroll(2, "units")
\ No newline at end of file
+        self.yview_scroll(2, "units")
+
+    if self.backend == "tiles":
+        refresh_visible_tiles(self)
\ No newline at end of file
@@ -1,16 +1,11 @@
 from Codebase.GUI.GUI.Draw.get_node_center import get_node_center
-from Codebase.GUI.GUI.Interaction.find_node_key_from_item import find_node_key_from_item
+from Codebase.GUI.GUI.Interaction.find_node_key_at_event import find_node_key_at_event
 
 
 def on_right_button_press(self, event):
     """Start a connection drag from the node under the cursor (right-click)."""
-    item = self.find_closest(event.x, event.y)
-    if not item:
-        return
-    item_id = item[0]
-
-    key = find_node_key_from_item(self, item_id)
-    if key is None:
+    key = find_node_key_at_event(self, event)
+    if key is None or self.read_only:
         return
 
     # Start connection from this node
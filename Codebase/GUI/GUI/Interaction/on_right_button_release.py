@@ -1,4 +1,4 @@
-from Codebase.GUI.GUI.Interaction.find_node_key_from_item import find_node_key_from_item
+from Codebase.GUI.GUI.Interaction.find_node_key_at_event import find_node_key_at_event
 from Codebase.GUI.GUI.JsonUpdate.connect_nodes import connect_nodes
 
 
@@ -20,10 +20,7 @@ def on_right_button_release(self, event):
         return
 
     # Node under the cursor on release
-    item = self.find_closest(event.x, event.y)
-    dst_key = None
-    if item:
-        dst_key = find_node_key_from_item(self, item[0])
+    dst_key = find_node_key_at_event(self, event)
 
     self._connect_data["src_key"] = None
 
@@ -0,0 +1,50 @@
+from pathlib import Path
+from typing import Any, Dict
+
+from Codebase.GUI.GUI.JsonUpdate.link_nodes import link_nodes
+from Codebase.GUI.GUI.Style.restyle_nodes import restyle_nodes
+from Codebase.GUI.IO.workspaces import qualify_key, workspace_for_directory
+from Codebase.GUI.Logic.dag_builder import resolve_reference
+from Codebase.Object.task_status import normalize_status
+
+
+def apply_task_update(self, header: Dict[str, Any]) -> None:
+    """
+    Apply a task_updated message (see FileIO/task_document.py) to the live
+    graph: status changes and newly added dependencies, without rereading
+    Tasks/. Removed dependencies and label/group changes only show after a
+    reload. Our own writes come back here too and are no-ops by then.
+
+    The channel is shared by every viewer, so writes to task files outside
+    the loaded tasks directories (another checkout, a scratch copy) are
+    ignored.
+    """
+    stem = header.get("key")
+    if not stem or not header.get("file_path"):
+        return
+
+    found, workspace = workspace_for_directory(self.nodes, str(Path(header["file_path"]).parent))
+    if not found:
+        return
+    key = qualify_key(workspace, stem)
+    node = self.nodes.get(key)
+    if node is None:
+        return
+
+    status = normalize_status(header.get("status"))
+    if status != node.status:
+        changed = self.status_rollup.set_status(key, status)
+        restyle_nodes(self, {key, *changed})
+        for callback in self.status_changed_callbacks:
+            callback(key)
+
+    depends_on = header.get("depends_on")
+    if not isinstance(depends_on, list):
+        return
+    for raw_dep in depends_on:
+        if raw_dep in node.depends_on_raw:
+            continue
+        node.depends_on_raw.append(raw_dep)
+        dep_key = resolve_reference(self.nodes, node, raw_dep)
+        if dep_key is not None and dep_key != key:
+            link_nodes(self, dep_key, key)
@@ -1,15 +1,19 @@
-import json
 from pathlib import Path
 from tkinter import messagebox
 
-from Codebase.GUI.GUI.JsonUpdate.create_edge_line import create_edge_line
+from Codebase.Core.Tracing.tracer import traced
+from Codebase.FileIO.task_document import append_dependency
+from Codebase.GUI.GUI.JsonUpdate.link_nodes import link_nodes
+from Codebase.GUI.IO.workspaces import qualify_key
 
 
+@traced()
 def connect_nodes(self, parent_key: str, child_key: str) -> None:
     """
     Connect parent -> child in-memory and on disk.
 
-    - Adds the parent's ID/key to the child's ``depends_on`` list in its JSON file.
+    - Adds the parent's ID/key to the child's ``depends_on`` list in its JSON
+      file (compare-and-swap, see FileIO/task_document.py).
     - Updates the in-memory TaskNode objects.
     - Draws a new edge on the canvas.
     """
@@ -35,13 +39,16 @@ def connect_nodes(self, parent_key: str, child_key: str) -> None:
         return
 
     # Determine dependency string to write into JSON.
-    # Preferred: group + id (e.g. "EEEE1"), fallback: key.
+    # Preferred: group + id (e.g. "EEEE1"), fallback: filename stem.
+    # Parents in another workspace are prefixed with its name ("infra:EEEE1").
     parent_group = getattr(parent, "group", None)
     parent_id = getattr(parent, "id", None)
     if parent_group is not None and parent_id is not None:
         dep_str = f"{parent_group}{parent_id}"
     else:
-        dep_str = parent_key
+        dep_str = parent.local_key
+    if parent.workspace != child.workspace:
+        dep_str = qualify_key(parent.workspace, dep_str)
 
     # --- Update JSON on disk ---
     child_path = getattr(child, "file_path", None)
@@ -53,60 +60,22 @@ def connect_nodes(self, parent_key: str, child_key: str) -> None:
         )
         return
 
+    # Compare-and-swap append: merges with concurrent edits of the file
     try:
-        data = json.loads(child_path.read_text(encoding="utf-8"))
+        append_dependency(child_path, dep_str, publish=self.publish_edits)
     except Exception as e:
         messagebox.showerror(
-            "Error reading task file",
-            f"Could not read JSON file:\n{child_path}\n\n{e}",
+            "Error writing task file",
+            f"Could not update JSON file:\n{child_path}\n\n{e}",
         )
         return
 
-    depends_on = data.get("depends_on", [])
-    if not isinstance(depends_on, list):
-        depends_on = []
-
-    if dep_str not in depends_on:
-        depends_on.append(dep_str)
-        data["depends_on"] = depends_on
-        try:
-            child_path.write_text(
-                json.dumps(data, indent=2, sort_keys=False),
-                encoding="utf-8",
-            )
-        except Exception as e:
-            messagebox.showerror(
-                "Error writing task file",
-                f"Could not write JSON file:\n{child_path}\n\n{e}",
-            )
-            return
-
     # --- Update in-memory structures for this session ---
 
-    # Raw dependency strings (what dag_builder originally reads)
+    # Raw dependency strings (what dag_builder originally reads); other
+    # writers' edits arrive through apply_task_update
     dep_raw = getattr(child, "depends_on_raw", None)
     if isinstance(dep_raw, list) and dep_str not in dep_raw:
         dep_raw.append(dep_str)
 
-    # Resolved dependency keys (what DAGCanvas uses for edges/info)
-    if isinstance(existing_deps, list) and parent_key not in existing_deps:
-        existing_deps.append(parent_key)
-
-    # Parent children list (may store keys or TaskNode objects)
-    children_list = getattr(parent, "children", None)
-    if isinstance(children_list, list):
-        if children_list:
-            first = children_list[0]
-            if isinstance(first, str):
-                if child_key not in children_list:
-                    children_list.append(child_key)
-            else:
-                # Assume TaskNode instances
-                if child not in children_list:
-                    children_list.append(child)
-        else:
-            # Empty list: use keys (matches DAGCanvas' info rendering)
-            children_list.append(child_key)
-
-    # Finally, draw the new edge visually
-    create_edge_line(self, parent_key, child_key)
\ No newline at end of file
+    link_nodes(self, parent_key, child_key)
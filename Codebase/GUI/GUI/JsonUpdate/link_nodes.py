@@ -0,0 +1,28 @@
+from Codebase.GUI.GUI.JsonUpdate.create_edge_line import create_edge_line
+from Codebase.GUI.GUI.Style.restyle_nodes import restyle_nodes
+
+
+def link_nodes(self, parent_key: str, child_key: str) -> None:
+    """
+    Add the edge parent -> child to the in-memory graph (the dependency
+    is already on disk): node lists, roll-ups, styling and the drawn edge.
+    """
+    parent = self.nodes[parent_key]
+    child = self.nodes[child_key]
+
+    # Resolved dependency keys (what DAGCanvas uses for edges/info)
+    if parent_key in child.deps_resolved:
+        return
+    child.deps_resolved.append(parent_key)
+
+    # Parent children list (keys, see Object/task_node.py)
+    if child_key not in parent.children:
+        parent.children.append(child_key)
+
+    # Roll-ups: the child may stop being ready
+    self.status_rollup.add_edge(parent_key, child_key)
+    self.group_quotient.add_edge(parent_key, child_key)
+    restyle_nodes(self, [child_key])
+
+    # Finally, draw the new edge visually
+    create_edge_line(self, parent_key, child_key)
@@ -0,0 +1,34 @@
+from collections import deque
+from typing import Deque, Dict, Tuple
+
+# Samples kept per metric (a couple of seconds of motion events)
+WINDOW = 120
+
+
+class PerfStats:
+    """
+    Rolling timing samples for the performance HUD.
+
+    Hot paths check ``enabled`` before reading the clock, so the only
+    cost while the HUD is hidden is one attribute lookup.
+    """
+
+    def __init__(self):
+        self.enabled: bool = False
+        self.samples: Dict[str, Deque[float]] = {}
+
+    def record(self, name: str, seconds: float) -> None:
+        window = self.samples.get(name)
+        if window is None:
+            window = self.samples[name] = deque(maxlen=WINDOW)
+        window.append(seconds)
+
+    def summary(self, name: str) -> Tuple[float, float, float] | None:
+        """(last, mean, max) in seconds, or None if nothing was recorded."""
+        window = self.samples.get(name)
+        if not window:
+            return None
+        return window[-1], sum(window) / len(window), max(window)
+
+    def clear(self) -> None:
+        self.samples.clear()
@@ -0,0 +1,126 @@
+"""
+Performance HUD for DAGCanvas (toggled with F3).
+
+Shows frame time, press/motion/release handler latency, canvas item
+counts, the last draw_graph / update_edges durations and process memory.
+
+While hidden nothing here runs: the timed event handlers are only bound
+while the HUD is on, and draw_graph / update_edges just test
+``self.perf.enabled``.
+"""
+
+import os
+import sys
+from time import perf_counter
+
+from Codebase.GUI.GUI.Interaction.on_button_motion import on_button_motion
+from Codebase.GUI.GUI.Interaction.on_button_press import on_button_press
+from Codebase.GUI.GUI.Interaction.on_button_release import on_button_release
+
+# Event loop probe interval (~60 Hz) and HUD text refresh interval
+FRAME_PROBE_MS = 16
+HUD_REFRESH_MS = 500
+
+TIMED_EVENTS = (
+    ("press", "<ButtonPress-1>", on_button_press),
+    ("motion", "<B1-Motion>", on_button_motion),
+    ("release", "<ButtonRelease-1>", on_button_release),
+)
+
+
+def memory_mb() -> float:
+    """Resident set size in MiB (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # bytes on macOS, KiB elsewhere
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _timed(self, name, handler, event):
+    t0 = perf_counter()
+    try:
+        return handler(self, event)
+    finally:
+        self.perf.record(name, perf_counter() - t0)
+
+
+def _frame_probe(self, last: float) -> None:
+    """Reschedules itself every FRAME_PROBE_MS; the actual gap between
+    calls is how long the event loop took to come back around."""
+    now = perf_counter()
+    self.perf.record("frame", now - last)
+    self._perf_jobs["frame"] = self.after(FRAME_PROBE_MS, _frame_probe, self, now)
+
+
+def _fmt(self, name: str, label: str) -> str:
+    stats = self.perf.summary(name)
+    if stats is None:
+        return f"{label:<8}      -"
+    last, mean, worst = stats
+    return f"{label:<8}{last * 1000:7.1f} ms  avg {mean * 1000:6.1f}  max {worst * 1000:6.1f}"
+
+
+def _hud_text(self) -> str:
+    lines = [
+        _fmt(self, "frame", "frame"),
+        _fmt(self, "press", "press"),
+        _fmt(self, "motion", "motion"),
+        _fmt(self, "release", "release"),
+        _fmt(self, "draw_graph", "draw"),
+        _fmt(self, "update_edges", "edges"),
+        f"items   {len(self.find_all())}  "
+        f"(nodes {len(self.node_items)}, edges {len(self.edge_items)}, tiles {len(self.tile_items)})",
+        f"memory  {memory_mb():.1f} MiB",
+    ]
+    return "\n".join(lines)
+
+
+def _refresh_hud(self) -> None:
+    x = self.canvasx(max(self.winfo_width(), 1) - 10)
+    y = self.canvasy(10)
+    text = _hud_text(self)
+
+    item = self._perf_hud_item
+    # draw_graph deletes "all", so the overlay may have to be recreated
+    if item is None or not self.type(item):
+        item = self._perf_hud_item = self.create_text(
+            x, y, text=text, anchor="ne", fill="#202020",
+            font=("TkFixedFont", 9), tags=("perf_hud",),
+        )
+    else:
+        self.coords(item, x, y)
+        self.itemconfigure(item, text=text)
+    self.tag_raise(item)
+
+    self._perf_jobs["hud"] = self.after(HUD_REFRESH_MS, _refresh_hud, self)
+
+
+def toggle_perf_hud(self) -> None:
+    """Show or hide the HUD and switch the timers on or off with it."""
+    if not self.perf.enabled:
+        self.perf.clear()
+        self.perf.enabled = True
+        for name, sequence, handler in TIMED_EVENTS:
+            # Keep the plain binding script so it can be put back verbatim
+            self._perf_saved_bindings[sequence] = self.bind(sequence)
+            self.bind(sequence, lambda e, n=name, h=handler: _timed(self, n, h, e))
+        self._perf_jobs["frame"] = self.after(FRAME_PROBE_MS, _frame_probe, self, perf_counter())
+        _refresh_hud(self)
+        return
+
+    self.perf.enabled = False
+    for sequence, script in self._perf_saved_bindings.items():
+        self.bind(sequence, script)
+    self._perf_saved_bindings.clear()
+    for job in self._perf_jobs.values():
+        self.after_cancel(job)
+    self._perf_jobs.clear()
+    if self._perf_hud_item is not None:
+        self.delete(self._perf_hud_item)
+        self._perf_hud_item = None
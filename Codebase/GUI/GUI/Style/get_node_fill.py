@@ -0,0 +1,41 @@
+from Codebase.GUI.Logic.group_quotient import super_key_group
+from Codebase.Object.task_status import BLOCKED, DONE, IN_PROGRESS
+
+# Status shading of the group color: done = light, ongoing = dark
+# (blend factor towards white / black)
+DONE_LIGHTEN = 0.6
+IN_PROGRESS_DARKEN = 0.3
+BLOCKED_GREY = 0.5
+
+
+def _blend(color: str, target: tuple, t: float) -> str:
+    if not (color.startswith("#") and len(color) == 7):
+        return color
+    rgb = [int(color[i:i + 2], 16) for i in (1, 3, 5)]
+    mixed = [round(c + (g - c) * t) for c, g in zip(rgb, target)]
+    return "#" + "".join(f"{c:02x}" for c in mixed)
+
+
+def get_node_fill(self, key: str) -> str:
+    """
+    Fill color for a node: its group color, or the default for ungrouped
+    nodes, shaded by the task's status. Collapsed-group super-nodes get
+    the plain group color.
+    """
+    node = self.nodes.get(key)
+    if node is None:
+        return self.group_colors.get(super_key_group(key), "#f0f0ff")
+    group = getattr(node, "group", None)
+    if group and group in self.group_colors:
+        color = self.group_colors[group]
+    else:
+        color = "#f0f0ff"  # default for ungrouped
+
+    status = node.status
+    if status == DONE:
+        return _blend(color, (255, 255, 255), DONE_LIGHTEN)
+    if status == IN_PROGRESS:
+        return _blend(color, (0, 0, 0), IN_PROGRESS_DARKEN)
+    if status == BLOCKED:
+        return _blend(color, (160, 160, 160), BLOCKED_GREY)
+    return color
@@ -0,0 +1,14 @@
+from typing import Tuple
+
+READY_OUTLINE = ("#00a040", 3)
+DEFAULT_OUTLINE = ("black", 2)
+
+
+def get_node_outline(self, key: str) -> Tuple[str, int]:
+    """
+    (color, width) of a node's border. Tasks on the "ready to start"
+    frontier (see Logic/status_rollup.py) get a green border.
+    """
+    if key in self.status_rollup.ready:
+        return READY_OUTLINE
+    return DEFAULT_OUTLINE
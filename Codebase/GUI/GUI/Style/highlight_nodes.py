@@ -0,0 +1,46 @@
+from typing import Iterable, Optional
+
+from Codebase.GUI.GUI.Style.is_group_visable_for_key import is_group_visible_for_key
+from Codebase.GUI.Logic.layout import NODE_HEIGHT, NODE_WIDTH
+
+# Outline drawn this far outside the node rectangle
+HIGHLIGHT_PAD = 5
+HIGHLIGHT_COLOR = "#ffb000"
+SELECTED_COLOR = "#ff3000"
+
+
+def _box(x: float, y: float):
+    return (
+        x - NODE_WIDTH / 2 - HIGHLIGHT_PAD,
+        y - NODE_HEIGHT / 2 - HIGHLIGHT_PAD,
+        x + NODE_WIDTH / 2 + HIGHLIGHT_PAD,
+        y + NODE_HEIGHT / 2 + HIGHLIGHT_PAD,
+    )
+
+
+def highlight_nodes(self, keys: Iterable[str], selected: Optional[str] = None) -> None:
+    """
+    Outline the given nodes (e.g. search hits), replacing any previous
+    highlight; ``selected`` gets a stronger outline. Works with both
+    rendering backends since the outlines are separate canvas items.
+    """
+    self.delete("highlight")
+    self.highlight_items.clear()
+
+    for key in keys:
+        if key not in self.node_positions or not is_group_visible_for_key(self, key):
+            continue
+        chosen = key == selected
+        self.highlight_items[key] = self.create_rectangle(
+            *_box(*self.node_positions[key]),
+            outline=SELECTED_COLOR if chosen else HIGHLIGHT_COLOR,
+            width=4 if chosen else 3,
+            tags=("highlight",),
+        )
+
+
+def move_highlight(self, key: str) -> None:
+    """Keep a node's outline on it while it is dragged (node_moved_callbacks)."""
+    item = self.highlight_items.get(key)
+    if item is not None:
+        self.coords(item, *_box(*self.node_positions[key]))
@@ -1,11 +1,16 @@
+from Codebase.GUI.Logic.group_quotient import super_key_group
+
+
 def is_group_visible_for_key(self, key: str) -> bool:
     """
     Check whether the node with this key is visible based on its group.
-    Ungrouped nodes are always visible.
+    Ungrouped nodes are always visible. Also accepts collapsed-group
+    super-node keys.
     """
     node = self.nodes.get(key)
     if node is None:
-        return True
+        group = super_key_group(key)
+        return group is None or self.group_visible.get(group, True)
     g = getattr(node, "group", None)
     if not g:
         return True  # no group -> can't be toggled off
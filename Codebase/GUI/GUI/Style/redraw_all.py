@@ -1,8 +1,39 @@
 from Codebase.GUI.GUI.Draw.draw_graph import draw_graph
+from Codebase.GUI.GUI.Draw.draw_graph_collapsed import draw_graph_collapsed
+from Codebase.GUI.GUI.Draw.draw_graph_progressive import (
+    PROGRESSIVE_MIN_NODES,
+    cancel_progressive_render,
+    draw_graph_progressive,
+)
+from Codebase.GUI.GUI.Tile.draw_graph_tiled import draw_graph_tiled
 
 
 def redraw_all(self) -> None:
     """
-    Convenience wrapper so external code can force a redraw.
+    Convenience wrapper so external code can force a redraw
+    with whichever rendering backend the canvas uses.
+
+    Large item-backend graphs are drawn progressively so the window
+    stays responsive while items are created. While any group is
+    collapsed the (small) collapsed view is drawn with items, whatever
+    backend the full graph uses.
     """
-    draw_graph(self)
\ No newline at end of file
+    if self.collapsed_groups:
+        self.backend = "items"
+        cancel_progressive_render(self)
+        draw_graph_collapsed(self)
+        for callback in self.redraw_callbacks:
+            callback()
+        return
+
+    self.backend = self.full_backend
+    if self.backend == "tiles":
+        draw_graph_tiled(self)
+    elif len(self.nodes) >= PROGRESSIVE_MIN_NODES:
+        draw_graph_progressive(self)
+    else:
+        cancel_progressive_render(self)
+        draw_graph(self)
+
+    for callback in self.redraw_callbacks:
+        callback()
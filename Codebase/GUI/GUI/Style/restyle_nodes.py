@@ -0,0 +1,19 @@
+from typing import Iterable
+
+from Codebase.GUI.GUI.Style.get_node_fill import get_node_fill
+from Codebase.GUI.GUI.Style.get_node_outline import get_node_outline
+from Codebase.GUI.GUI.Tile.refresh_visible_tiles import invalidate_tiles
+
+
+def restyle_nodes(self, keys: Iterable[str]) -> None:
+    """
+    Re-apply fill/border to these nodes after a status change, without
+    redrawing the graph.
+    """
+    for key in keys:
+        items = self.node_items.get(key)
+        if items is not None:
+            outline, width = get_node_outline(self, key)
+            self.itemconfigure(items["rect"], fill=get_node_fill(self, key), outline=outline, width=width)
+        elif self.backend == "tiles":
+            invalidate_tiles(self, self.tile_index.node_bbox(key))
@@ -0,0 +1,41 @@
+from typing import Iterable
+
+from Codebase.GUI.GUI.Style.redraw_all import redraw_all
+from Codebase.GUI.Logic.group_quotient import super_key
+
+
+def set_groups_collapsed(self, groups: Iterable[str], collapsed: bool) -> None:
+    """
+    Collapse groups into super-nodes (or expand them) and redraw.
+
+    Expanding keeps the view anchored: the group's first task lands where
+    its super-node was on screen.
+    """
+    groups = [g for g in groups if g in self.group_colors]
+    anchor = None
+    if not collapsed and len(groups) == 1:
+        pos = self.node_positions.get(super_key(groups[0]))
+        if pos is not None:
+            anchor = (groups[0], pos[0] - self.canvasx(0), pos[1] - self.canvasy(0))
+
+    if collapsed:
+        self.collapsed_groups.update(groups)
+    else:
+        self.collapsed_groups.difference_update(groups)
+    redraw_all(self)
+
+    if anchor is None:
+        return
+    group, screen_x, screen_y = anchor
+    members = [
+        self.node_positions[key]
+        for key in self.group_quotient.members.get(group, ())
+        if key in self.node_positions
+    ]
+    region = [float(v) for v in str(self.cget("scrollregion")).split()]
+    if not members or len(region) != 4:
+        return
+    x, y = min(members, key=lambda p: (p[1], p[0]))
+    x0, y0, x1, y1 = region
+    self.xview_moveto(max(0.0, (x - screen_x - x0) / max(x1 - x0, 1.0)))
+    self.yview_moveto(max(0.0, (y - screen_y - y0) / max(y1 - y0, 1.0)))
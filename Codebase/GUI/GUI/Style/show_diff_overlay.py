@@ -0,0 +1,91 @@
+from typing import TYPE_CHECKING, Optional
+
+from Codebase.GUI.GUI.Style.is_group_visable_for_key import is_group_visible_for_key
+from Codebase.GUI.Logic.layout import NODE_HEIGHT, NODE_WIDTH
+
+if TYPE_CHECKING:
+    from Codebase.Query.graph_snapshot import GraphDiff
+
+# Outline drawn this far outside the node rectangle (inside search highlights)
+DIFF_PAD = 3
+ADDED_COLOR = "#1a9e1a"
+MODIFIED_COLOR = "#2a6fdb"
+REMOVED_COLOR = "#d62020"
+
+
+def _box(x: float, y: float):
+    return (
+        x - NODE_WIDTH / 2 - DIFF_PAD,
+        y - NODE_HEIGHT / 2 - DIFF_PAD,
+        x + NODE_WIDTH / 2 + DIFF_PAD,
+        y + NODE_HEIGHT / 2 + DIFF_PAD,
+    )
+
+
+def _edge_coords(self, src: str, dst: str):
+    (x1, y1), (x2, y2) = self.node_positions[src], self.node_positions[dst]
+    return x1, y1 + NODE_HEIGHT / 2, x2, y2 - NODE_HEIGHT / 2
+
+
+def show_diff_overlay(self, diff: Optional["GraphDiff"]) -> None:
+    """
+    Mark what changed since a snapshot (Query/graph_snapshot.py): added
+    tasks and edges in green, modified tasks in blue, removed edges dashed
+    red between tasks that still exist. Removed tasks have nothing to draw
+    on. ``None`` clears the overlay. The overlay is kept in
+    self.diff_overlay and drawn again after redraws; drags only move the
+    dragged node's items (move_diff_overlay).
+    """
+    self.diff_overlay = diff
+    self.delete("diff")
+    self.diff_box_items.clear()
+    self.diff_edge_items.clear()
+    if diff is None:
+        return
+
+    def drawn(key: str) -> bool:
+        return key in self.node_positions and is_group_visible_for_key(self, key)
+
+    for keys, color in ((diff.added, ADDED_COLOR), (diff.modified, MODIFIED_COLOR)):
+        for key in keys:
+            if drawn(key):
+                self.diff_box_items[key] = self.create_rectangle(
+                    *_box(*self.node_positions[key]),
+                    outline=color,
+                    width=3,
+                    tags=("diff",),
+                )
+
+    for edges, color, dash in (
+        (diff.edges_added, ADDED_COLOR, ()),
+        (diff.edges_removed, REMOVED_COLOR, (4, 3)),
+    ):
+        for src, dst in edges:
+            if drawn(src) and drawn(dst):
+                item = self.create_line(
+                    *_edge_coords(self, src, dst),
+                    fill=color,
+                    width=3,
+                    dash=dash,
+                    arrow="last",
+                    tags=("diff",),
+                )
+                for key in (src, dst):
+                    self.diff_edge_items.setdefault(key, []).append((item, src, dst))
+    self.tag_raise("node")
+    self.tag_raise("label")
+
+
+def refresh_diff_overlay(self) -> None:
+    """Redraw the current overlay (redraw_callbacks)."""
+    if self.diff_overlay is not None:
+        show_diff_overlay(self, self.diff_overlay)
+
+
+def move_diff_overlay(self, key: str) -> None:
+    """Keep a dragged node's outline and edges on it (node_moved_callbacks)."""
+    item = self.diff_box_items.get(key)
+    if item is not None:
+        self.coords(item, *_box(*self.node_positions[key]))
+    for item, src, dst in self.diff_edge_items.get(key, ()):
+        self.coords(item, *_edge_coords(self, src, dst))
@@ -0,0 +1,44 @@
+from time import perf_counter
+
+from Codebase.Core.Tracing.tracer import traced
+from Codebase.GUI.GUI.Tile.refresh_visible_tiles import refresh_visible_tiles
+from Codebase.GUI.GUI.Tile.tile_index import TileIndex
+from Codebase.GUI.GUI.Style.is_group_visable_for_key import is_group_visible_for_key
+from Codebase.GUI.Logic.layout import compute_grid_layout, layout_extent
+
+
+@traced()
+def draw_graph_tiled(self) -> None:
+    """
+    Tile-backend counterpart of draw_graph: lay out the graph, index it
+    and show the tiles for the current viewport. No per-node canvas items
+    are created; tiles outside the viewport are rendered on demand.
+    """
+    t0 = perf_counter() if self.perf.enabled else None
+    self.delete("all")
+    self.node_items.clear()
+    self.edge_items.clear()
+    self.tile_items.clear()
+    self.tile_cache.clear()
+    self._hover_item = None
+
+    positions = compute_grid_layout(self.nodes)
+    self.node_positions = positions
+
+    edges = [
+        (dep_key, key)
+        for key, node in self.nodes.items()
+        for dep_key in node.deps_resolved
+    ]
+    self.tile_index = TileIndex(positions, edges)
+    for key in positions:
+        if not is_group_visible_for_key(self, key):
+            self.tile_index.hidden[self.tile_index.row[key]] = True
+
+    max_x, max_y = layout_extent(positions)
+    self.config(scrollregion=(0, 0, max_x, max_y))
+
+    refresh_visible_tiles(self)
+
+    if t0 is not None:
+        self.perf.record("draw_graph", perf_counter() - t0)
@@ -0,0 +1,87 @@
+from Codebase.GUI.GUI.Draw.draw_edge import draw_edge
+from Codebase.GUI.GUI.Draw.draw_node import draw_node
+from Codebase.GUI.GUI.Style.is_group_visable_for_key import is_group_visible_for_key
+from Codebase.GUI.GUI.Tile.refresh_visible_tiles import invalidate_tiles
+
+
+def _union(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])
+
+
+def promote_node(self, key: str) -> None:
+    """
+    Lift a node (and its incident edges) out of the raster tiles into
+    live canvas items so the regular drag handlers can move it.
+    """
+    idx = self.tile_index
+    if idx.live[idx.row[key]]:
+        return
+
+    edges = idx.incident_edges(key)
+    dirty = _union(idx.node_bbox(key), idx.edges_bbox(edges))
+    idx.set_live(key, True)
+
+    draw_node(self, key, *self.node_positions[key])
+
+    for e in edges:
+        src = idx.keys[int(idx.src[e])]
+        dst = idx.keys[int(idx.dst[e])]
+        if not (is_group_visible_for_key(self, src) and is_group_visible_for_key(self, dst)):
+            continue
+        draw_edge(self, src, dst)
+
+    invalidate_tiles(self, dirty)
+
+
+def demote_node(self, key: str) -> None:
+    """
+    Bake a live node back into the tiles at its current position and
+    delete its canvas items. Only tiles it touches are re-rendered.
+    """
+    idx = self.tile_index
+    if not idx.live[idx.row[key]]:
+        return
+
+    items = self.node_items.pop(key, None)
+    if items is not None:
+        self.delete(items["rect"])
+        self.delete(items["text"])
+
+    remaining = []
+    for edge in self.edge_items:
+        if edge["src"] == key or edge["dst"] == key:
+            self.delete(edge["line"])
+        else:
+            remaining.append(edge)
+    self.edge_items[:] = remaining
+
+    x, y = self.node_positions[key]
+    idx.move(key, x, y)
+    idx.set_live(key, False)
+    invalidate_tiles(self, _union(idx.node_bbox(key), idx.edges_bbox(idx.incident_edges(key))))
+
+
+def add_tile_edge(self, src_key: str, dst_key: str) -> None:
+    """Add a new edge to the tile index and re-render the tiles it crosses."""
+    idx = self.tile_index
+    if src_key not in idx.row or dst_key not in idx.row:
+        return
+    idx.add_edge(src_key, dst_key)
+    x1, y1 = self.node_positions[src_key]
+    x2, y2 = self.node_positions[dst_key]
+    invalidate_tiles(self, (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)))
+
+
+def add_tile_node(self, key: str) -> None:
+    """Add a newly inserted node (and its dependency edges) to the tiles."""
+    idx = self.tile_index
+    x, y = self.node_positions[key]
+    idx.add_node(key, x, y, hidden=not is_group_visible_for_key(self, key))
+    for dep_key in self.nodes[key].deps_resolved:
+        if dep_key in idx.row:
+            idx.add_edge(dep_key, key)
+    invalidate_tiles(self, _union(idx.node_bbox(key), idx.edges_bbox(idx.incident_edges(key))))
@@ -0,0 +1,85 @@
+import math
+from typing import Iterable, Optional, Tuple
+
+from Codebase.GUI.GUI.Tile.render_tile import TILE_SIZE, render_tile
+
+# Rings of tiles around the viewport kept cached for scrolling back
+PREFETCH_RING = 2
+MIN_CACHED_TILES = 128
+
+
+def show_tile(self, tx: int, ty: int) -> None:
+    """Make sure tile (tx, ty) is rendered (cache hit or fresh) and on the canvas."""
+    key = (tx, ty)
+    image = self.tile_cache.get(key)
+    if image is None:
+        image = render_tile(self, tx, ty)
+        self.tile_cache.put(key, image)
+
+    item = self.tile_items.get(key)
+    if item is None:
+        self.tile_items[key] = self.create_image(
+            tx * TILE_SIZE, ty * TILE_SIZE, anchor="nw", image=image, tags=("tile",)
+        )
+    else:
+        self.itemconfigure(item, image=image)
+
+
+def drop_tile_item(self, key: Tuple[int, int]) -> None:
+    """TileCache eviction callback: remove the canvas image for that tile."""
+    item = self.tile_items.pop(key, None)
+    if item is not None:
+        self.delete(item)
+
+
+def _tile_range(x1: float, y1: float, x2: float, y2: float) -> Iterable[Tuple[int, int]]:
+    for ty in range(max(0, int(y1 // TILE_SIZE)), int(y2 // TILE_SIZE) + 1):
+        for tx in range(max(0, int(x1 // TILE_SIZE)), int(x2 // TILE_SIZE) + 1):
+            yield tx, ty
+
+
+def refresh_visible_tiles(self) -> None:
+    """
+    Render / show the tiles covering the current viewport.
+    Cheap when everything visible is already cached.
+    """
+    if self.backend != "tiles":  # collapsed groups are drawn with items
+        return
+    x1 = self.canvasx(0)
+    y1 = self.canvasy(0)
+    x2 = x1 + max(self.winfo_width(), 1)
+    y2 = y1 + max(self.winfo_height(), 1)
+    visible = list(_tile_range(x1, y1, x2, y2))
+    # Tiles of this pass must not evict each other
+    self.tile_cache.pinned = set(visible)
+    for tx, ty in visible:
+        show_tile(self, tx, ty)
+    # Live items (selection / hover) always stay above the tiles
+    self.tag_lower("tile")
+
+
+def size_tile_cache(self) -> None:
+    """
+    Fit the tile cache to the viewport (<Configure>): every tile a view
+    of this size can touch, plus PREFETCH_RING rings around it.
+    """
+    cols = math.ceil(max(self.winfo_width(), 1) / TILE_SIZE) + 1
+    rows = math.ceil(max(self.winfo_height(), 1) / TILE_SIZE) + 1
+    ring = 2 * PREFETCH_RING
+    self.tile_cache.resize(max(MIN_CACHED_TILES, (cols + ring) * (rows + ring)))
+
+
+def invalidate_tiles(self, bbox: Optional[Tuple[float, float, float, float]]) -> None:
+    """
+    Mark tiles overlapping bbox dirty. Tiles currently on the canvas are
+    re-rendered right away; the rest are just dropped from the cache.
+    """
+    if bbox is None:
+        return
+    pad = 12  # line width + arrow head
+    x1, y1, x2, y2 = bbox
+    for key in _tile_range(x1 - pad, y1 - pad, x2 + pad, y2 + pad):
+        self.tile_cache.discard((key,))
+        if key in self.tile_items:
+            show_tile(self, *key)
+    self.tag_lower("tile")
@@ -0,0 +1,74 @@
+import math
+
+try:
+    from PIL import Image, ImageDraw, ImageFont, ImageTk
+except ImportError:
+    Image = None
+
+from Codebase.GUI.GUI.Style.get_node_fill import get_node_fill
+from Codebase.GUI.GUI.Style.get_node_outline import get_node_outline
+from Codebase.GUI.GUI.Tile.tile_index import np
+from Codebase.GUI.Logic.layout import NODE_HEIGHT, NODE_WIDTH
+
+TILE_SIZE = 256
+
+_font = None
+
+
+def tiles_available() -> bool:
+    """The tile backend needs both NumPy and Pillow (with ImageTk)."""
+    return Image is not None and np is not None
+
+
+def _arrow_head(x1: float, y1: float, x2: float, y2: float, length: float = 10.0, half_width: float = 5.0):
+    """Triangle at (x2, y2) pointing along the segment, like Tk's arrow=LAST."""
+    dx, dy = x2 - x1, y2 - y1
+    dist = math.hypot(dx, dy) or 1.0
+    ux, uy = dx / dist, dy / dist
+    bx, by = x2 - ux * length, y2 - uy * length
+    return [(x2, y2), (bx - uy * half_width, by + ux * half_width), (bx + uy * half_width, by - ux * half_width)]
+
+
+def render_tile(self, tx: int, ty: int):
+    """
+    Rasterise the static part of the graph that falls inside tile (tx, ty)
+    and return it as a Tk image.
+
+    Live nodes (being dragged) and their edges are skipped; they are drawn
+    as normal canvas items on top of the tiles.
+    """
+    global _font
+    if _font is None:
+        _font = ImageFont.load_default()
+
+    idx = self.tile_index
+    ox, oy = tx * TILE_SIZE, ty * TILE_SIZE
+    box = (ox, oy, ox + TILE_SIZE, oy + TILE_SIZE)
+
+    img = Image.new("RGB", (TILE_SIZE, TILE_SIZE), "white")
+    draw = ImageDraw.Draw(img)
+
+    half_w = NODE_WIDTH / 2
+    half_h = NODE_HEIGHT / 2
+    for i in idx.nodes_in_box(*box):
+        key = idx.keys[i]
+        x = float(idx.xs[i]) - ox
+        y = float(idx.ys[i]) - oy
+        outline, width = get_node_outline(self, key)
+        draw.rectangle(
+            (x - half_w, y - half_h, x + half_w, y + half_h),
+            fill=get_node_fill(self, key),
+            outline=outline,
+            width=width,
+        )
+        draw.text((x, y), str(self.nodes[key].label), fill="black", font=_font, anchor="mm")
+
+    # Edges on top of nodes (same stacking order as draw_graph)
+    for e in idx.edges_in_box(*box):
+        s, d = idx.src[e], idx.dst[e]
+        x1, y1 = float(idx.xs[s]) - ox, float(idx.ys[s]) - oy
+        x2, y2 = float(idx.xs[d]) - ox, float(idx.ys[d]) - oy
+        draw.line((x1, y1, x2, y2), fill="black", width=2)
+        draw.polygon(_arrow_head(x1, y1, x2, y2), fill="black")
+
+    return ImageTk.PhotoImage(img, master=self)
@@ -0,0 +1,66 @@
+from collections import OrderedDict
+from typing import Callable, Hashable, Iterable, Optional, Set
+
+
+class TileCache:
+    """
+    Size-bounded LRU cache of rendered tile images.
+
+    - key:   (tx, ty) tile coordinates
+    - value: the Tk image shown for that tile
+
+    When a tile is evicted, ``on_evict(key)`` is called so the owner can
+    drop the matching canvas image item (Tk needs the image kept alive
+    for as long as it is displayed). Tiles in ``pinned`` (the current
+    viewport) are never evicted, even if that means going over max_tiles.
+    """
+
+    def __init__(self, max_tiles: int = 128, on_evict: Optional[Callable[[Hashable], None]] = None):
+        self.max_tiles = max(1, max_tiles)
+        self.on_evict = on_evict
+        self.pinned: Set[Hashable] = set()
+        self._tiles: "OrderedDict[Hashable, object]" = OrderedDict()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._tiles
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    def get(self, key: Hashable):
+        image = self._tiles.get(key)
+        if image is not None:
+            self._tiles.move_to_end(key)
+        return image
+
+    def put(self, key: Hashable, image) -> None:
+        self._tiles[key] = image
+        self._tiles.move_to_end(key)
+        self._evict()
+
+    def resize(self, max_tiles: int) -> None:
+        self.max_tiles = max(1, max_tiles)
+        self._evict()
+
+    def _evict(self) -> None:
+        excess = len(self._tiles) - self.max_tiles
+        if excess <= 0:
+            return
+        victims = []
+        for key in self._tiles:  # least recently used first
+            if key not in self.pinned:
+                victims.append(key)
+                if len(victims) == excess:
+                    break
+        for key in victims:
+            del self._tiles[key]
+            if self.on_evict is not None:
+                self.on_evict(key)
+
+    def discard(self, keys: Iterable[Hashable]) -> None:
+        """Forget tiles so they get re-rendered next time they are shown."""
+        for key in keys:
+            self._tiles.pop(key, None)
+
+    def clear(self) -> None:
+        self._tiles.clear()
@@ -0,0 +1,118 @@
+"""
+NumPy-backed spatial index over node centres and edges for the tile backend.
+
+Node positions live in two float arrays so "which nodes / edges touch this
+tile" is a single vectorised mask instead of a Python loop over the graph.
+Edges are stored as (src_row, dst_row) so they follow their nodes for free.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from Codebase.GUI.Logic.layout import NODE_HEIGHT, NODE_WIDTH
+
+
+class TileIndex:
+    def __init__(self, positions: Dict[str, Tuple[float, float]], edges: Iterable[Tuple[str, str]]):
+        self.keys: List[str] = list(positions.keys())
+        self.row: Dict[str, int] = {k: i for i, k in enumerate(self.keys)}
+
+        n = len(self.keys)
+        self.xs = np.fromiter((positions[k][0] for k in self.keys), dtype=np.float64, count=n)
+        self.ys = np.fromiter((positions[k][1] for k in self.keys), dtype=np.float64, count=n)
+        # Hidden by group toggle / currently drawn as live canvas items
+        self.hidden = np.zeros(n, dtype=bool)
+        self.live = np.zeros(n, dtype=bool)
+
+        pairs = [(self.row[s], self.row[d]) for s, d in edges if s in self.row and d in self.row]
+        self.src = np.array([p[0] for p in pairs], dtype=np.int64)
+        self.dst = np.array([p[1] for p in pairs], dtype=np.int64)
+
+    # ----------------------------
+    # Updates
+    # ----------------------------
+
+    def move(self, key: str, x: float, y: float) -> None:
+        i = self.row[key]
+        self.xs[i] = x
+        self.ys[i] = y
+
+    def add_node(self, key: str, x: float, y: float, hidden: bool = False) -> None:
+        self.row[key] = len(self.keys)
+        self.keys.append(key)
+        self.xs = np.append(self.xs, x)
+        self.ys = np.append(self.ys, y)
+        self.hidden = np.append(self.hidden, hidden)
+        self.live = np.append(self.live, False)
+
+    def add_edge(self, src: str, dst: str) -> None:
+        self.src = np.append(self.src, self.row[src])
+        self.dst = np.append(self.dst, self.row[dst])
+
+    def set_live(self, key: str, live: bool) -> None:
+        self.live[self.row[key]] = live
+
+    # ----------------------------
+    # Queries
+    # ----------------------------
+
+    def node_bbox(self, key: str) -> Tuple[float, float, float, float]:
+        i = self.row[key]
+        x, y = float(self.xs[i]), float(self.ys[i])
+        return x - NODE_WIDTH / 2, y - NODE_HEIGHT / 2, x + NODE_WIDTH / 2, y + NODE_HEIGHT / 2
+
+    def incident_edges(self, key: str):
+        """Return an index array of edges touching ``key``."""
+        i = self.row[key]
+        return np.nonzero((self.src == i) | (self.dst == i))[0]
+
+    def edges_bbox(self, edge_idx) -> Optional[Tuple[float, float, float, float]]:
+        if len(edge_idx) == 0:
+            return None
+        xs = np.concatenate((self.xs[self.src[edge_idx]], self.xs[self.dst[edge_idx]]))
+        ys = np.concatenate((self.ys[self.src[edge_idx]], self.ys[self.dst[edge_idx]]))
+        return float(xs.min()), float(ys.min()), float(xs.max()), float(ys.max())
+
+    def nodes_in_box(self, x1: float, y1: float, x2: float, y2: float):
+        """Static (not hidden, not live) node rows whose box overlaps the area."""
+        mask = (
+            (self.xs + NODE_WIDTH / 2 >= x1)
+            & (self.xs - NODE_WIDTH / 2 <= x2)
+            & (self.ys + NODE_HEIGHT / 2 >= y1)
+            & (self.ys - NODE_HEIGHT / 2 <= y2)
+            & ~self.hidden
+            & ~self.live
+        )
+        return np.nonzero(mask)[0]
+
+    def edges_in_box(self, x1: float, y1: float, x2: float, y2: float):
+        """Static edge indices whose bounding box overlaps the area."""
+        sx, sy = self.xs[self.src], self.ys[self.src]
+        dx, dy = self.xs[self.dst], self.ys[self.dst]
+        mask = (
+            (np.maximum(sx, dx) >= x1)
+            & (np.minimum(sx, dx) <= x2)
+            & (np.maximum(sy, dy) >= y1)
+            & (np.minimum(sy, dy) <= y2)
+            & ~self.hidden[self.src]
+            & ~self.hidden[self.dst]
+            & ~self.live[self.src]
+            & ~self.live[self.dst]
+        )
+        return np.nonzero(mask)[0]
+
+    def key_at(self, x: float, y: float) -> Optional[str]:
+        """Top-most visible node whose box contains (x, y)."""
+        mask = (
+            (np.abs(self.xs - x) <= NODE_WIDTH / 2)
+            & (np.abs(self.ys - y) <= NODE_HEIGHT / 2)
+            & ~self.hidden
+        )
+        hits = np.nonzero(mask)[0]
+        if len(hits) == 0:
+            return None
+        return self.keys[int(hits[-1])]
@@ -1,8 +1,3 @@
-try:
-    from screeninfo import get_monitors
-except ImportError:
-    get_monitors = None
-
 import tkinter as tk
 
 def center_on_current_monitor(root: tk.Tk) -> None:
@@ -12,6 +7,12 @@ def center_on_current_monitor(root: tk.Tk) -> None:
     - If screeninfo is available, use it to find the primary monitor.
     - Otherwise fallback to Tk's screen size and approximate center.
     """
+    # Imported lazily: screeninfo is slow to import and only needed here
+    try:
+        from screeninfo import get_monitors
+    except ImportError:
+        get_monitors = None
+
     root.update_idletasks()  # ensure size info is current
 
     width = root.winfo_width()
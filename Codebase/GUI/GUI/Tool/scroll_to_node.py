@@ -0,0 +1,25 @@
+from Codebase.GUI.GUI.Style.set_groups_collapsed import set_groups_collapsed
+from Codebase.GUI.GUI.Tile.refresh_visible_tiles import refresh_visible_tiles
+
+
+def scroll_to_node(self, key: str) -> None:
+    """Scroll the canvas so the node sits in the middle of the view,
+    expanding its group first if it is collapsed."""
+    node = self.nodes.get(key)
+    if node is not None and node.group in self.collapsed_groups:
+        set_groups_collapsed(self, [node.group], False)
+    if key not in self.node_positions:
+        return
+    x, y = self.node_positions[key]
+    region = [float(v) for v in str(self.cget("scrollregion")).split()]
+    if len(region) != 4:
+        return
+    x0, y0, x1, y1 = region
+    width = max(x1 - x0, 1.0)
+    height = max(y1 - y0, 1.0)
+
+    self.xview_moveto(max(0.0, (x - x0 - self.winfo_width() / 2) / width))
+    self.yview_moveto(max(0.0, (y - y0 - self.winfo_height() / 2) / height))
+
+    if self.backend == "tiles":
+        refresh_visible_tiles(self)
@@ -0,0 +1,63 @@
+import logging
+import tkinter as tk
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from Codebase.FileIO.blob_store import BlobStore, fetch_attachment
+from Codebase.FileIO.update_log import load_task_document
+
+logger = logging.getLogger(__name__)
+
+
+def list_attachments(task_file: Path) -> List[Tuple[str, Dict[str, Any]]]:
+    """(update timestamp, attachment dict) for every attachment of a task,
+    including logged updates. Blob contents are not touched."""
+    try:
+        data = load_task_document(task_file)
+    except Exception as e:
+        logger.warning("Could not read %s: %s", task_file, e)
+        return []
+    return [
+        (update.get("timestamp", ""), attachment)
+        for update in data.get("updates", []) or []
+        for attachment in update.get("attachments", []) or []
+    ]
+
+
+def show_attachments(master: tk.Misc, task_file: Path, title: str) -> None:
+    """
+    Attachment browser for one task: list on the left, content on the
+    right. Each attachment's content is fetched from the blob store only
+    when it is selected.
+    """
+    attachments = list_attachments(task_file)
+    store = BlobStore(task_file.parent)
+
+    win = tk.Toplevel(master)
+    win.title(f"Attachments – {title}")
+    win.geometry("700x400")
+
+    listbox = tk.Listbox(win, width=32, exportselection=False)
+    listbox.pack(side="left", fill="y", padx=(8, 4), pady=8)
+    text = tk.Text(win, wrap="word")
+    text.pack(side="right", fill="both", expand=True, padx=(4, 8), pady=8)
+
+    for timestamp, attachment in attachments:
+        size = attachment.get("size")
+        suffix = f" ({size} B)" if size is not None else ""
+        listbox.insert("end", f"{timestamp}  {attachment.get('name', '?')}{suffix}")
+
+    def on_select(_event=None) -> None:
+        selection = listbox.curselection()
+        if not selection:
+            return
+        _, attachment = attachments[selection[0]]
+        try:
+            content = fetch_attachment(attachment, store)
+        except (OSError, ValueError) as e:
+            content = f"Could not load attachment: {e}"
+        text.delete("1.0", "end")
+        text.insert("1.0", content)
+
+    listbox.bind("<<ListboxSelect>>", on_select)
+    win.bind("<Escape>", lambda e: win.destroy())
@@ -0,0 +1,54 @@
+import logging
+import threading
+import tkinter as tk
+from pathlib import Path
+from typing import Optional
+
+from Codebase.Export.render_png import render_png
+
+logger = logging.getLogger(__name__)
+
+
+def load_snapshot(root: tk.Misc, snapshot_file: Path) -> Optional[tk.PhotoImage]:
+    """
+    Load the cached first-frame image, or None if there is none (or Tk
+    cannot read it). Tk 8.6 reads PNG natively, so no Pillow is needed here.
+    """
+    try:
+        if snapshot_file.is_file():
+            return tk.PhotoImage(master=root, file=str(snapshot_file))
+    except Exception as e:
+        logger.warning("Could not load snapshot from %s: %s", snapshot_file, e)
+    return None
+
+
+def save_snapshot(canvas, snapshot_file: Path) -> None:
+    """
+    Render what the canvas currently shows into snapshot_file, in a
+    background thread so the UI is not held up. Needs Pillow; silently
+    skipped without it.
+    """
+    # Copy everything we need while on the Tk thread
+    nodes = dict(canvas.nodes)
+    positions = dict(canvas.node_positions)
+    hidden = {g for g, visible in canvas.group_visible.items() if not visible}
+    groups = None if not hidden else [g for g in canvas.group_colors if g not in hidden]
+    viewport = (
+        canvas.canvasx(0),
+        canvas.canvasy(0),
+        max(canvas.winfo_width(), 1),
+        max(canvas.winfo_height(), 1),
+    )
+
+    def _worker() -> None:
+        try:
+            snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = snapshot_file.with_suffix(".tmp")
+            render_png(nodes, positions, tmp, groups=groups, viewport=viewport)
+            tmp.replace(snapshot_file)
+        except RuntimeError:
+            pass  # Pillow not installed: no snapshot, plain loading screen next time
+        except Exception as e:
+            logger.warning("Could not save snapshot to %s: %s", snapshot_file, e)
+
+    threading.Thread(target=_worker, name="dag-snapshot", daemon=True).start()
@@ -1,50 +1,41 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import logging
 import tkinter as tk
-from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from Codebase.Object.task_node import TaskNode
 
 # ============================
 # Relative imports (within Codebase.GUI.GUI)
 # ============================
 
-from .Draw.draw_graph import draw_graph
 from .Interaction.on_button_motion import on_button_motion
 from .Interaction.on_button_press import on_button_press
 from .Interaction.on_button_release import on_button_release
 from .Interaction.on_double_click import on_double_click
+from .Interaction.on_hover_motion import on_hover_motion
+from .Interaction.on_middle_click import on_middle_click
 from .Interaction.on_mousewheel import on_mousewheel
 from .Interaction.on_right_button_motion import on_right_button_motion
 from .Interaction.on_right_button_press import on_right_button_press
 from .Interaction.on_right_button_release import on_right_button_release
+from .Perf.perf_stats import PerfStats
+from .Perf.toggle_perf_hud import toggle_perf_hud
 from .Style.init_group_styles import init_group_styles
+from .Style.redraw_all import redraw_all
+from .Tile.refresh_visible_tiles import drop_tile_item, refresh_visible_tiles, size_tile_cache
+from .Tile.render_tile import tiles_available
+from .Tile.tile_cache import TileCache
+from ..Logic.edge_routing import EdgeRouter
+from ..Logic.group_quotient import GroupQuotient
+from ..Logic.status_rollup import StatusRollup
 
+logger = logging.getLogger(__name__)
 
-# ============================
-# Data model
-# ============================
-
-@dataclass
-class TaskNode:
-    """
-    In-memory representation of a task JSON file.
-
-    - key:   unique key, usually filename stem, e.g. "EEEE1"
-    - label: display label, from "task" field in the JSON
-    """
-    key: str
-    label: str
-    file_path: Path
-    depends_on_raw: List[str] = field(default_factory=list)
-    group: Optional[str] = None
-    id: Optional[int] = None
-
-    # Resolved DAG fields (filled after loading)
-    deps_resolved: List[str] = field(default_factory=list)   # keys this node depends on
-    children: List[str] = field(default_factory=list)        # outgoing edges (this -> child)
-    level: int = 0                                           # layout layer
+# Above this many nodes, backend="auto" rasterises the graph into tiles
+TILE_BACKEND_MIN_NODES = 20000
 
 
 # ============================
@@ -63,14 +54,68 @@ class DAGCanvas(tk.Canvas):
     This class also renders a group legend in the top-right corner:
       - Colored square + group name
       - Clicking the square toggles visibility of that group
+
+    Rendering backends (``backend=``):
+      - "items": one canvas rectangle/text/line per node and edge
+      - "tiles": static graph rasterised into cached image tiles
+                 (GUI/Tile, needs NumPy + Pillow); only the dragged node
+                 and the hover outline are live canvas items
+      - "auto":  "tiles" for very large graphs when available, else "items"
+
+    Groups in ``collapsed_groups`` are drawn as one super-node each, with
+    merged, counted edges (Logic/group_quotient.py); double-click one to
+    expand it. That view always uses items.
+
+    Edge paths come from ``edge_routing`` (see Logic/edge_routing.py).
     """
 
-    def __init__(self, master, nodes: Dict[str, TaskNode], **kwargs):
+    def __init__(
+        self,
+        master,
+        nodes: Dict[str, TaskNode],
+        backend: str = "auto",
+        edge_routing: str = "straight",
+        status_rollup: Optional[StatusRollup] = None,
+        collapsed_groups: Iterable[str] = (),
+        read_only: bool = False,
+        publish_edits: bool = True,
+        **kwargs,
+    ):
         super().__init__(master, **kwargs)
 
         # Core DAG data
         self.nodes: Dict[str, TaskNode] = nodes
 
+        # Done/ready/blocked roll-ups (Logic/status_rollup.py); pass one in
+        # to build it off the Tk thread
+        self.status_rollup = status_rollup or StatusRollup(nodes)
+
+        if backend == "auto":
+            use_tiles = len(nodes) >= TILE_BACKEND_MIN_NODES and tiles_available()
+            backend = "tiles" if use_tiles else "items"
+        elif backend == "tiles" and not tiles_available():
+            logger.warning("Tile backend needs numpy + pillow; falling back to items.")
+            backend = "items"
+        # Backend for the full graph; redraw_all switches self.backend to
+        # "items" while groups are collapsed
+        self.full_backend: str = backend
+        self.backend: str = backend
+
+        # No task files behind the nodes (e.g. an imported graph): no
+        # status changes or new edges
+        self.read_only = read_only
+        # Announce our task file writes to other viewers (task channel);
+        # off for scratch copies such as the interaction replay
+        self.publish_edits = publish_edits
+
+        # Collapsed groups (drawn as super-nodes) + the group quotient
+        # graph they are drawn from
+        self.collapsed_groups: Set[str] = set(collapsed_groups)
+        self.group_quotient = GroupQuotient(nodes)
+
+        # Node centres (canvas coords), kept current while dragging
+        self.node_positions: Dict[str, Tuple[float, float]] = {}
+
         # Group color + visibility (by task "group" string)
         # Filled by init_group_styles(self)
         self.group_colors: Dict[str, str] = {}
@@ -82,6 +127,41 @@ class DAGCanvas(tk.Canvas):
         #   list of edges: {'src': key, 'dst': key, 'line': int}
         self.edge_items: List[Dict[str, object]] = []
 
+        # Cached edge routes; tiles always rasterise straight edges
+        self.edge_router = EdgeRouter(edge_routing if backend != "tiles" else "straight")
+
+        # Tile backend state (see GUI/Tile)
+        self.tile_index = None
+        self.tile_items: Dict[Tuple[int, int], int] = {}
+        self.tile_cache = TileCache(on_evict=lambda key: drop_tile_item(self, key))
+        self._hover_item: Optional[int] = None
+
+        # Progressive rendering state (see Draw/draw_graph_progressive)
+        self._render_job: Optional[str] = None
+        self._progress_item: Optional[int] = None
+
+        # Observers (e.g. the minimap): called with the key of a moved or
+        # live-inserted node, and after every full redraw
+        self.node_moved_callbacks: List[Callable[[str], None]] = []
+        self.node_added_callbacks: List[Callable[[str], None]] = []
+        self.redraw_callbacks: List[Callable[[], None]] = []
+        # Called with the key whose status was changed in the viewer
+        self.status_changed_callbacks: List[Callable[[str], None]] = []
+
+        # Performance HUD (F3); see GUI/Perf
+        self.perf = PerfStats()
+        self._perf_hud_item: Optional[int] = None
+        self._perf_jobs: Dict[str, str] = {}
+        self._perf_saved_bindings: Dict[str, str] = {}
+
+        # Outlines from highlight_nodes (e.g. search hits): key -> item id
+        self.highlight_items: Dict[str, int] = {}
+        # Changes since a snapshot shown by show_diff_overlay (or None)
+        self.diff_overlay = None
+        # Its items by node: outline, and (item, src, dst) per incident edge
+        self.diff_box_items: Dict[str, int] = {}
+        self.diff_edge_items: Dict[str, List[Tuple[int, str, str]]] = {}
+
         # Legend items: group -> {'rect': item_id, 'text': item_id}
         self.group_legend_items: Dict[str, Dict[str, int]] = {}
 
@@ -90,6 +170,7 @@ class DAGCanvas(tk.Canvas):
             "node_key": None,
             "x": 0,
             "y": 0,
+            "edges": None,
         }
 
         # State for right-button edge creation (used by Interaction helpers)
@@ -116,14 +197,25 @@ class DAGCanvas(tk.Canvas):
             self.bind("<B3-Motion>", lambda e: on_right_button_motion(self, e))
         self.bind("<ButtonRelease-3>", lambda e: on_right_button_release(self, e))
 
+        # Middle-click: cycle task status
+        self.bind("<ButtonPress-2>", lambda e: on_middle_click(self, e))
+
         # Optional scroll wheel (vertical)
         self.bind("<MouseWheel>", lambda e: on_mousewheel(self, e))
         self.bind("<Button-4>", lambda e: on_mousewheel(self, e))  # some Linux
         self.bind("<Button-5>", lambda e: on_mousewheel(self, e))
 
+        # F3 toggles the performance HUD (bound on the toplevel so the
+        # canvas does not need keyboard focus)
+        self.winfo_toplevel().bind("<F3>", lambda e: toggle_perf_hud(self), add="+")
+
+        if self.backend == "tiles":
+            self.bind("<Motion>", lambda e: on_hover_motion(self, e))
+            self.bind("<Configure>", lambda e: (size_tile_cache(self), refresh_visible_tiles(self)))
+
         # Initialize group styles and draw the graph
         init_group_styles(self)
-        draw_graph(self)
+        redraw_all(self)
         # If you have a legend helper, you can call it here after draw_graph
 
 __all__ = ["DAGCanvas", "TaskNode"]
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import tkinter as tk
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+from .Style.get_node_fill import get_node_fill
+from .Style.is_group_visable_for_key import is_group_visible_for_key
+from .Tile.refresh_visible_tiles import refresh_visible_tiles
+from ..Logic.layout import layout_extent
+
+Cell = Tuple[int, int]
+
+
+class MinimapCanvas(tk.Canvas):
+    """
+    Small overview of a DAGCanvas.
+
+    Nodes are downsampled into a grid of ``cell`` x ``cell`` pixel cells;
+    each occupied cell is one rectangle colored by the most common group
+    in it, so the item count is bounded by the minimap size, not the graph
+    size. A red outline shows the main canvas viewport. Click or drag to
+    move the viewport.
+
+    Updates are incremental:
+      - a node move touches at most two cells, an insert one
+      - a view change only moves the viewport rectangle
+      - the cells are rebuilt only when the DAG canvas redraws
+    """
+
+    def __init__(self, master, dag_canvas, width: int = 200, height: int = 150, cell: int = 3, **kwargs):
+        super().__init__(master, width=width, height=height, background="white",
+                         highlightthickness=1, highlightbackground="#999999", **kwargs)
+        self.dag_canvas = dag_canvas
+        self.map_width = width
+        self.map_height = height
+        self.cell = cell
+
+        self.scale = 1.0
+        self.extent = (1.0, 1.0)
+        # cell -> Counter(fill color -> node count), cell -> rect item
+        self.cell_counts: Dict[Cell, Counter] = {}
+        self.cell_items: Dict[Cell, int] = {}
+        # key -> (cell, color) the node currently contributes to
+        self.node_cells: Dict[str, Tuple[Cell, str]] = {}
+        self.viewport_item: Optional[int] = None
+
+        dag_canvas.node_moved_callbacks.append(self.on_node_moved)
+        dag_canvas.node_added_callbacks.append(self.on_node_added)
+        dag_canvas.redraw_callbacks.append(self.rebuild)
+        dag_canvas.configure(
+            xscrollcommand=lambda *_: self.update_viewport(),
+            yscrollcommand=lambda *_: self.update_viewport(),
+        )
+
+        self.bind("<ButtonPress-1>", self._on_navigate)
+        self.bind("<B1-Motion>", self._on_navigate)
+
+        self.rebuild()
+
+    # ----------------------------
+    # Cells
+    # ----------------------------
+
+    def _cell_for(self, x: float, y: float) -> Cell:
+        cx = int(min(max(x * self.scale, 0), self.map_width - 1) // self.cell)
+        cy = int(min(max(y * self.scale, 0), self.map_height - 1) // self.cell)
+        return cx, cy
+
+    def _refresh_cell(self, cell: Cell) -> None:
+        counts = self.cell_counts.get(cell)
+        item = self.cell_items.get(cell)
+        if not counts:
+            self.cell_counts.pop(cell, None)
+            if item is not None:
+                self.delete(item)
+                del self.cell_items[cell]
+            return
+
+        color = counts.most_common(1)[0][0]
+        if item is None:
+            x0, y0 = cell[0] * self.cell, cell[1] * self.cell
+            self.cell_items[cell] = self.create_rectangle(
+                x0, y0, x0 + self.cell, y0 + self.cell, fill=color, width=0, tags=("cell",)
+            )
+        else:
+            self.itemconfigure(item, fill=color)
+
+    def rebuild(self) -> None:
+        """Recompute all cells from the DAG canvas' node positions."""
+        self.delete("all")
+        self.cell_counts.clear()
+        self.cell_items.clear()
+        self.node_cells.clear()
+        self.viewport_item = None
+
+        positions = self.dag_canvas.node_positions
+        max_x, max_y = layout_extent(positions)
+        self.extent = (max(max_x, 1.0), max(max_y, 1.0))
+        self.scale = min(self.map_width / self.extent[0], self.map_height / self.extent[1])
+
+        for key, (x, y) in positions.items():
+            if not is_group_visible_for_key(self.dag_canvas, key):
+                continue
+            cell = self._cell_for(x, y)
+            color = get_node_fill(self.dag_canvas, key)
+            self.cell_counts.setdefault(cell, Counter())[color] += 1
+            self.node_cells[key] = (cell, color)
+
+        for cell in self.cell_counts:
+            self._refresh_cell(cell)
+
+        self.update_viewport()
+
+    def on_node_added(self, key: str) -> None:
+        """Count a live-inserted node into its cell."""
+        if key in self.node_cells or not is_group_visible_for_key(self.dag_canvas, key):
+            return
+        cell = self._cell_for(*self.dag_canvas.node_positions[key])
+        color = get_node_fill(self.dag_canvas, key)
+        self.cell_counts.setdefault(cell, Counter())[color] += 1
+        self.node_cells[key] = (cell, color)
+        self._refresh_cell(cell)
+        if self.viewport_item is not None:
+            self.tag_raise(self.viewport_item)
+
+    def on_node_moved(self, key: str) -> None:
+        """Move one node between cells; touches at most two rectangles."""
+        entry = self.node_cells.get(key)
+        if entry is None:
+            return
+        old_cell, color = entry
+        new_cell = self._cell_for(*self.dag_canvas.node_positions[key])
+        if new_cell == old_cell:
+            return
+
+        self.cell_counts[old_cell][color] -= 1
+        if self.cell_counts[old_cell][color] <= 0:
+            del self.cell_counts[old_cell][color]
+        self.cell_counts.setdefault(new_cell, Counter())[color] += 1
+        self.node_cells[key] = (new_cell, color)
+
+        self._refresh_cell(old_cell)
+        self._refresh_cell(new_cell)
+        if self.viewport_item is not None:
+            self.tag_raise(self.viewport_item)
+
+    # ----------------------------
+    # Viewport
+    # ----------------------------
+
+    def update_viewport(self) -> None:
+        """Move the viewport rectangle to match the DAG canvas view."""
+        x_lo, x_hi = self.dag_canvas.xview()
+        y_lo, y_hi = self.dag_canvas.yview()
+        w = self.extent[0] * self.scale
+        h = self.extent[1] * self.scale
+        box = (x_lo * w, y_lo * h, x_hi * w, y_hi * h)
+        if self.viewport_item is None:
+            self.viewport_item = self.create_rectangle(*box, outline="red", width=2, tags=("viewport",))
+        else:
+            self.coords(self.viewport_item, *box)
+        self.tag_raise(self.viewport_item)
+
+    def _on_navigate(self, event) -> None:
+        """Center the DAG canvas view on the clicked minimap point."""
+        x_lo, x_hi = self.dag_canvas.xview()
+        y_lo, y_hi = self.dag_canvas.yview()
+        fx = event.x / (self.extent[0] * self.scale)
+        fy = event.y / (self.extent[1] * self.scale)
+        self.dag_canvas.xview_moveto(max(0.0, fx - (x_hi - x_lo) / 2))
+        self.dag_canvas.yview_moveto(max(0.0, fy - (y_hi - y_lo) / 2))
+        if self.dag_canvas.backend == "tiles":
+            refresh_visible_tiles(self.dag_canvas)
+
+
+__all__ = ["MinimapCanvas"]
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import threading
+import tkinter as tk
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from .Style.highlight_nodes import highlight_nodes, move_highlight
+from .Tool.scroll_to_node import scroll_to_node
+from ..IO.search_index import SearchIndex, WorkspaceSearchIndex, open_search_index
+
+# Matches listed / outlined on the canvas
+MAX_RESULTS = 50
+
+
+class SearchPanel(tk.Frame):
+    """
+    Sidebar search box for a DAGCanvas.
+
+    Results are ranked as you type (see IO/search_index.py), every hit is
+    outlined on the canvas and selecting a result scrolls to that node.
+    The index is opened/refreshed on a worker thread; queries wait for it.
+    tasks_dir may be {workspace: tasks_dir} for a federated graph.
+    """
+
+    def __init__(self, master, dag_canvas, tasks_dir: Union[Path, Dict[str, Path]], **kwargs):
+        super().__init__(master, **kwargs)
+        self.dag_canvas = dag_canvas
+        self.tasks_dir = tasks_dir
+        self.index: Optional[Union[SearchIndex, WorkspaceSearchIndex]] = None
+        # Held by the worker while it changes the index
+        self._lock = threading.Lock()
+        self.results: List[str] = []
+        self.selected: Optional[str] = None
+
+        self.query_var = tk.StringVar()
+        entry = tk.Entry(self, textvariable=self.query_var, width=24)
+        entry.pack(fill="x")
+        self.status = tk.Label(self, text="Indexing…", anchor="w", foreground="#666666")
+        self.status.pack(fill="x")
+        self.listbox = tk.Listbox(self, height=8, exportselection=False)
+        self.listbox.pack(fill="x")
+
+        self.query_var.trace_add("write", lambda *_: self.run_query())
+        self.listbox.bind("<<ListboxSelect>>", self._on_select)
+        entry.bind("<Return>", lambda e: self._select(0))
+        entry.bind("<Escape>", lambda e: self.query_var.set(""))
+
+        dag_canvas.node_moved_callbacks.append(lambda key: move_highlight(dag_canvas, key))
+        dag_canvas.node_added_callbacks.append(lambda key: self._refresh_in_background())
+        # draw_graph clears every item, outlines included
+        dag_canvas.redraw_callbacks.append(self._rehighlight)
+
+        self._start_worker(lambda: open_search_index(self.tasks_dir))
+
+    # ---- index maintenance (worker thread) ----
+
+    def _start_worker(self, job) -> None:
+        result: dict = {}
+
+        def _run() -> None:
+            with self._lock:
+                result["index"] = job()
+
+        worker = threading.Thread(target=_run, name="search-index", daemon=True)
+        worker.start()
+
+        def _poll() -> None:
+            if worker.is_alive():
+                self.after(50, _poll)
+                return
+            if self.index is None:
+                self.index = result.get("index")
+                self.status.configure(text=f"{len(self.index)} tasks indexed" if self.index else "Index unavailable")
+            self.run_query()
+
+        self.after(50, _poll)
+
+    def _refresh_in_background(self) -> None:
+        index = self.index
+        if index is None:
+            return
+
+        def _job():
+            index.refresh()
+            index.save()
+            return index
+
+        self._start_worker(_job)
+
+    # ---- queries (Tk thread) ----
+
+    def run_query(self) -> None:
+        query = self.query_var.get()
+        if self.index is None or not self._lock.acquire(blocking=False):
+            # Index busy; the worker's poll re-runs the query when done
+            return
+        try:
+            hits = self.index.search(query, MAX_RESULTS) if query.strip() else []
+        finally:
+            self._lock.release()
+
+        nodes = self.dag_canvas.nodes
+        self.results = [key for key, _ in hits if key in nodes]
+        self.selected = None
+        self.listbox.delete(0, "end")
+        for key in self.results:
+            self.listbox.insert("end", f"{nodes[key].label}  ({key})")
+        if query.strip():
+            self.status.configure(text=f"{len(self.results)} matches")
+        highlight_nodes(self.dag_canvas, self.results)
+
+    def _select(self, row: int) -> None:
+        if row >= len(self.results):
+            return
+        self.listbox.selection_clear(0, "end")
+        self.listbox.selection_set(row)
+        self.selected = self.results[row]
+        highlight_nodes(self.dag_canvas, self.results, self.selected)
+        scroll_to_node(self.dag_canvas, self.selected)
+
+    def _on_select(self, _event=None) -> None:
+        selection = self.listbox.curselection()
+        if selection:
+            self._select(selection[0])
+
+    def _rehighlight(self) -> None:
+        if self.results:
+            highlight_nodes(self.dag_canvas, self.results, self.selected)
+
+
+__all__ = ["SearchPanel"]
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Persistent full-text index over task files.
+
+Indexed fields (with ranking weight):
+
+    task         3
+    description  2
+    update notes 1   (base document + update log, see FileIO/update_log.py)
+
+The index is saved to UserData/.search_index.json as a forward index
+(key -> file signature + term weights); the inverted index used for
+queries is rebuilt from it in memory. refresh() only re-reads task files
+whose mtime/size (or update log) changed since the last run.
+
+Queries match all words; the last word also matches as a prefix so
+results can update as the user types.
+
+With workspaces (see IO/workspaces.py) each root keeps its own index file
+(UserData/.search_index.<workspace>.json) and WorkspaceSearchIndex merges
+their results under "<workspace>:<stem>" keys.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import json
+import logging
+import math
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from Codebase.Core.Pathing.project_paths import ProjectPaths
+from Codebase.Core.Tracing.tracer import traced
+from Codebase.FileIO.update_log import LOG_SUFFIX, load_task_document
+from .workspaces import qualify_key
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = ProjectPaths.userdata / ".search_index.json"
+INDEX_VERSION = 1
+
+FIELD_WEIGHTS = (("task", 3), ("description", 2))
+NOTE_WEIGHT = 1
+
+# Words in at least this many tasks get their ranking precomputed by warm()
+WARM_MIN_DF = 1000
+
+# Max vocabulary terms a prefix may expand to (keeps 1-letter queries fast)
+MAX_PREFIX_TERMS = 64
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+Signature = Tuple[int, int, int]  # (json mtime_ns, json size, log mtime_ns)
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower()) if isinstance(text, str) else []
+
+
+def document_terms(data: dict) -> Dict[str, int]:
+    """term -> summed field weight for one task document."""
+    terms: Dict[str, int] = {}
+    for field_name, weight in FIELD_WEIGHTS:
+        for token in tokenize(data.get(field_name, "")):
+            terms[token] = terms.get(token, 0) + weight
+    for update in data.get("updates", []) or []:
+        for token in tokenize(update.get("note", "")):
+            terms[token] = terms.get(token, 0) + NOTE_WEIGHT
+    return terms
+
+
+class SearchIndex:
+    def __init__(self, tasks_dir: Path, index_file: Path | None = None):
+        self.tasks_dir = Path(tasks_dir)
+        self.index_file = index_file or INDEX_FILE
+        # Forward index: key -> (signature, {term: weight})
+        self.docs: Dict[str, Tuple[Signature, Dict[str, int]]] = {}
+        # Inverted index: term -> {key: weight}
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self._vocab: Optional[List[str]] = None  # sorted terms, for prefixes
+        # term -> postings ranked by weight, for one-word queries on
+        # very common words (cleared on any change)
+        self._ranked: Dict[str, List[Tuple[str, int]]] = {}
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    # ---- persistence ----
+
+    def load(self) -> None:
+        try:
+            data = json.loads(self.index_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("version") != INDEX_VERSION or data.get("tasks_dir") != str(self.tasks_dir):
+            return
+        for key, (sig, terms) in data.get("docs", {}).items():
+            self._add(key, tuple(sig), terms)
+        self._vocab = sorted(self.postings)
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        doc = {
+            "version": INDEX_VERSION,
+            "tasks_dir": str(self.tasks_dir),
+            "docs": {key: [list(sig), terms] for key, (sig, terms) in self.docs.items()},
+        }
+        tmp = self.index_file.with_name(self.index_file.name + ".tmp")
+        tmp.write_text(json.dumps(doc, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, self.index_file)
+        self._dirty = False
+
+    # ---- maintenance ----
+
+    def _add(self, key: str, sig: Signature, terms: Dict[str, int]) -> None:
+        self.docs[key] = (sig, terms)
+        for term, weight in terms.items():
+            self.postings.setdefault(term, {})[key] = weight
+        self._vocab = None
+        self._ranked.clear()
+
+    def _remove(self, key: str) -> None:
+        _, terms = self.docs.pop(key)
+        for term in terms:
+            posting = self.postings.get(term)
+            if posting is not None:
+                posting.pop(key, None)
+                if not posting:
+                    del self.postings[term]
+        self._vocab = None
+        self._ranked.clear()
+
+    @traced()
+    def refresh(self) -> int:
+        """Re-index new/changed task files, drop deleted ones. Returns changes."""
+        log_mtimes: Dict[str, int] = {}
+        files: Dict[str, os.DirEntry] = {}
+        with os.scandir(self.tasks_dir) as it:
+            for entry in it:
+                if entry.name.endswith(LOG_SUFFIX):
+                    log_mtimes[entry.name[: -len(LOG_SUFFIX)]] = entry.stat().st_mtime_ns
+                elif entry.name.endswith(".json") and entry.is_file():
+                    files[entry.name[:-5]] = entry
+
+        changed = 0
+        for key in [k for k in self.docs if k not in files]:
+            self._remove(key)
+            changed += 1
+
+        for key, entry in files.items():
+            st = entry.stat()
+            sig = (st.st_mtime_ns, st.st_size, log_mtimes.get(key, 0))
+            known = self.docs.get(key)
+            if known is not None and tuple(known[0]) == sig:
+                continue
+            try:
+                data = load_task_document(Path(entry.path))
+            except (OSError, ValueError) as e:
+                logger.warning("Could not index %s: %s", entry.path, e)
+                continue
+            if known is not None:
+                self._remove(key)
+            self._add(key, sig, document_terms(data))
+            changed += 1
+
+        if changed:
+            self._dirty = True
+            self._vocab = sorted(self.postings)
+            logger.info("Search index: %d tasks re-indexed", changed)
+        return changed
+
+    def warm(self) -> None:
+        """Pre-rank very common words so typing them stays instant."""
+        for term, posting in self.postings.items():
+            if len(posting) >= WARM_MIN_DF and term not in self._ranked:
+                self._ranked[term] = sorted(posting.items(), key=lambda kv: (-kv[1], kv[0]))
+
+    # ---- queries ----
+
+    def _expand(self, token: str, prefix: bool) -> List[str]:
+        if not prefix:
+            return [token] if token in self.postings else []
+        if self._vocab is None:
+            self._vocab = sorted(self.postings)
+        i = bisect.bisect_left(self._vocab, token)
+        out = []
+        while i < len(self._vocab) and self._vocab[i].startswith(token) and len(out) < MAX_PREFIX_TERMS:
+            out.append(self._vocab[i])
+            i += 1
+        return out
+
+    def search(self, query: str, limit: int = 50) -> List[Tuple[str, float]]:
+        """Best matches as (key, score), highest first."""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        prefix_last = not query[-1:].isspace()
+        n_docs = max(len(self.docs), 1)
+
+        scores: Optional[Dict[str, float]] = None
+        # Rarest words first so the candidate set shrinks quickly
+        per_token = []
+        for i, token in enumerate(tokens):
+            terms = self._expand(token, prefix_last and i == len(tokens) - 1)
+            if not terms:
+                return []
+            per_token.append(terms)
+        per_token.sort(key=lambda terms: sum(len(self.postings[t]) for t in terms))
+
+        if len(per_token) == 1 and len(per_token[0]) == 1:
+            # Single word: the order is just the posting's weights
+            term = per_token[0][0]
+            ranked = self._ranked.get(term)
+            if ranked is None:
+                ranked = self._ranked[term] = sorted(
+                    self.postings[term].items(), key=lambda kv: (-kv[1], kv[0])
+                )
+            idf = math.log(1 + n_docs / len(ranked))
+            return [(key, weight * idf) for key, weight in ranked[:limit]]
+
+        for terms in per_token:
+            hits: Dict[str, float] = {}
+            for term in terms:
+                posting = self.postings[term]
+                idf = math.log(1 + n_docs / len(posting))
+                if scores is None:
+                    for key, weight in posting.items():
+                        if weight * idf > hits.get(key, 0.0):
+                            hits[key] = weight * idf
+                else:
+                    # Only look at documents still in the running
+                    for key in scores:
+                        weight = posting.get(key)
+                        if weight is not None and weight * idf > hits.get(key, 0.0):
+                            hits[key] = weight * idf
+            if scores is None:
+                scores = hits
+            else:
+                scores = {key: scores[key] + s for key, s in hits.items()}
+            if not scores:
+                return []
+
+        return heapq.nsmallest(limit, scores.items(), key=lambda kv: (-kv[1], kv[0]))
+
+
+class WorkspaceSearchIndex:
+    """
+    One SearchIndex per workspace, queried together. Same interface as
+    SearchIndex for the viewer; keys are namespaced like the graph's.
+    """
+
+    def __init__(self, roots: Dict[str, Path]):
+        self.indexes = {
+            name: SearchIndex(tasks_dir, index_file_for(name))
+            for name, tasks_dir in roots.items()
+        }
+
+    def __len__(self) -> int:
+        return sum(len(index) for index in self.indexes.values())
+
+    def load(self) -> None:
+        for index in self.indexes.values():
+            index.load()
+
+    def save(self) -> None:
+        for index in self.indexes.values():
+            index.save()
+
+    def refresh(self) -> int:
+        return sum(index.refresh() for index in self.indexes.values())
+
+    def warm(self) -> None:
+        for index in self.indexes.values():
+            index.warm()
+
+    def search(self, query: str, limit: int = 50) -> List[Tuple[str, float]]:
+        hits = [
+            (qualify_key(name, key), score)
+            for name, index in self.indexes.items()
+            for key, score in index.search(query, limit)
+        ]
+        return heapq.nsmallest(limit, hits, key=lambda kv: (-kv[1], kv[0]))
+
+
+def index_file_for(workspace: str) -> Path:
+    return INDEX_FILE.with_name(f".search_index.{workspace}.json")
+
+
+def open_search_index(
+    tasks_dir: Path | Dict[str, Path], index_file: Path | None = None
+) -> SearchIndex | WorkspaceSearchIndex:
+    """Load the saved index, bring it up to date, save it back and warm it.
+    Takes a while on big workspaces; the viewer calls it off the Tk thread.
+    Pass {workspace: tasks_dir} to search several workspaces at once."""
+    if isinstance(tasks_dir, dict):
+        index = WorkspaceSearchIndex(tasks_dir)
+    else:
+        index = SearchIndex(tasks_dir, index_file)
+    index.load()
+    index.refresh()
+    index.save()
+    index.warm()
+    return index
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of loaded task nodes, one file per tasks directory.
+
+load_task_nodes() parses every JSON file; for a directory that has not
+changed since the last run that work can be skipped. Each directory is
+summarised by a cheap signature taken with one scandir pass (file count,
+total size, newest mtime and the directory's own mtime, which moves when
+files are added, removed or renamed). If the signature matches the one
+saved next to the pickled nodes, the pickle is used; otherwise the
+directory is loaded normally and the cache rewritten.
+
+Cached nodes are unresolved (no deps_resolved / children / level), just
+like load_task_nodes() returns them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from Codebase.Core.Pathing.project_paths import ProjectPaths
+from Codebase.Core.Tracing.tracer import traced
+from Codebase.Object.task_node import TaskNode
+from .task_loader import load_task_nodes
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = ProjectPaths.userdata / ".task_cache"
+CACHE_VERSION = 1
+
+Signature = Tuple[int, int, int, int]  # (files, total bytes, newest mtime_ns, dir mtime_ns)
+
+
+def dir_signature(tasks_dir: Path) -> Signature:
+    """Signature of the *.json files in tasks_dir (one scandir, no reads)."""
+    count = total = newest = 0
+    with os.scandir(tasks_dir) as it:
+        for entry in it:
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
+            st = entry.stat()
+            count += 1
+            total += st.st_size
+            newest = max(newest, st.st_mtime_ns)
+    return count, total, newest, os.stat(tasks_dir).st_mtime_ns
+
+
+def _cache_key(tasks_dir: Path, workspace: str | None) -> str:
+    return f"{workspace or ''}|{Path(tasks_dir).resolve()}"
+
+
+def cache_file_for(
+    tasks_dir: Path, workspace: str | None = None, cache_dir: Path | None = None
+) -> Path:
+    digest = hashlib.sha1(_cache_key(tasks_dir, workspace).encode("utf-8")).hexdigest()[:16]
+    return (cache_dir or CACHE_DIR) / f"{digest}.pickle"
+
+
+class TaskCache:
+    """
+    Signature-checked node cache for any number of tasks directories.
+
+    Keeps the last result per directory in memory as well, so a long-lived
+    process reloading several roots only re-reads the ones that changed.
+    Unchanged roots return the same node objects as last time.
+    """
+
+    def __init__(self, cache_dir: Path | None = None, persist: bool = True):
+        self.cache_dir = cache_dir or CACHE_DIR
+        self.persist = persist
+        self._memory: Dict[str, Tuple[Signature, Dict[str, TaskNode]]] = {}
+        self._lock = threading.Lock()
+
+    def _read(self, path: Path, sig: Signature) -> Optional[Dict[str, TaskNode]]:
+        try:
+            with path.open("rb") as f:
+                version, cached_sig, nodes = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Ignoring unreadable task cache %s: %s", path, e)
+            return None
+        if version != CACHE_VERSION or tuple(cached_sig) != sig:
+            return None
+        return nodes
+
+    def _write(self, path: Path, sig: Signature, nodes: Dict[str, TaskNode]) -> None:
+        tmp = path.with_suffix(".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp.open("wb") as f:
+                pickle.dump((CACHE_VERSION, sig, nodes), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("Could not write task cache %s: %s", path, e)
+
+    @traced()
+    def load(
+        self, tasks_dir: Path, workspace: str | None = None
+    ) -> Tuple[Dict[str, TaskNode], bool]:
+        """
+        Nodes for tasks_dir (keys namespaced by workspace, as with
+        load_task_nodes), plus whether they were re-read from the JSON
+        files (False means a cache hit).
+        """
+        tasks_dir = Path(tasks_dir)
+        sig = dir_signature(tasks_dir)
+        key = _cache_key(tasks_dir, workspace)
+
+        with self._lock:
+            hit = self._memory.get(key)
+        if hit is not None and hit[0] == sig:
+            return hit[1], False
+
+        path = cache_file_for(tasks_dir, workspace, self.cache_dir)
+        nodes = self._read(path, sig) if self.persist else None
+        reloaded = nodes is None
+        if reloaded:
+            nodes = load_task_nodes(tasks_dir, workspace)
+            if self.persist:
+                self._write(path, sig, nodes)
+        else:
+            logger.info("Loaded %d tasks from cache for %s", len(nodes), tasks_dir)
+
+        with self._lock:
+            self._memory[key] = (sig, nodes)
+        return nodes, reloaded
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Workspace federation: several task roots viewed as one graph.
+
+Teams keep their own tasks directories; UserData/workspaces.json lists
+them by name (relative paths are taken from the project root):
+
+    {
+      "workspaces": {
+        "core":  "Tasks",
+        "infra": "/srv/infra/Tasks"
+      }
+    }
+
+Every node from a workspace gets the key "<workspace>:<stem>" (e.g.
+"core:AAAA1"), so the same <GROUP><ID> in two roots no longer collides.
+A depends_on entry is looked up in the node's own workspace unless it is
+prefixed with another workspace's name ("infra:BBBB3").
+
+Roots are loaded concurrently through a TaskCache (see task_cache.py),
+so only roots whose files changed are re-read.
+
+Without a workspaces.json the single ProjectPaths.tasks directory is used
+and keys stay un-prefixed, as before.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Collection, Dict, Iterable, List, Optional, Tuple
+
+from Codebase.Core.Pathing.project_paths import ProjectPaths
+from Codebase.Core.Tracing.tracer import traced
+from Codebase.Object.task_node import TaskNode
+from .task_cache import TaskCache
+
+logger = logging.getLogger(__name__)
+
+WORKSPACES_FILE = ProjectPaths.userdata / "workspaces.json"
+
+# Separator between workspace name and filename stem in node keys
+SEPARATOR = ":"
+
+_NAME_RE = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+# Upper bound on loader threads (JSON parsing is mostly I/O bound here)
+MAX_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class Workspace:
+    name: str
+    tasks_dir: Path
+
+
+def load_workspace_config(path: Path | None = None) -> List[Workspace]:
+    """
+    Workspaces listed in workspaces.json, in file order.
+    Returns [] if the file does not exist.
+    """
+    path = path or WORKSPACES_FILE
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return []
+
+    entries = data.get("workspaces", {})
+    if not isinstance(entries, dict):
+        raise ValueError(f"{path}: 'workspaces' must map names to task directories")
+
+    workspaces: List[Workspace] = []
+    for name, tasks_dir in entries.items():
+        if not _NAME_RE.match(name):
+            raise ValueError(
+                f"{path}: workspace name {name!r} may only use letters, digits, '_', '-' and '.'"
+            )
+        tasks_path = Path(tasks_dir).expanduser()
+        if not tasks_path.is_absolute():
+            tasks_path = ProjectPaths.project_root / tasks_path
+        workspaces.append(Workspace(name, tasks_path.resolve()))
+    return workspaces
+
+
+def select_workspaces(workspaces: List[Workspace], names: Iterable[str]) -> List[Workspace]:
+    """The named workspaces (config order); all of them if names is empty."""
+    wanted = list(names)
+    if not wanted:
+        return list(workspaces)
+    known = {ws.name for ws in workspaces}
+    unknown = [n for n in wanted if n not in known]
+    if unknown:
+        raise ValueError(
+            f"Unknown workspace(s): {', '.join(unknown)} (configured: {', '.join(sorted(known))})"
+        )
+    return [ws for ws in workspaces if ws.name in wanted]
+
+
+def qualify_key(workspace: Optional[str], ref: str) -> str:
+    return ref if workspace is None else f"{workspace}{SEPARATOR}{ref}"
+
+
+def qualify_reference(ref: str, workspace: Optional[str], known: Collection[str]) -> str:
+    """
+    Turn a depends_on entry written in `workspace` into the namespaced
+    form used for lookups: "AAAA1" -> "core:AAAA1"; "infra:BBBB3" is kept
+    when "infra" is a known workspace.
+    """
+    if workspace is None:
+        return ref
+    prefix, sep, _ = ref.partition(SEPARATOR)
+    if sep and prefix in known:
+        return ref
+    return qualify_key(workspace, ref)
+
+
+def workspace_for_directory(nodes: Dict[str, TaskNode], directory: str) -> Tuple[bool, Optional[str]]:
+    """
+    (found, workspace) for a tasks directory among the loaded nodes.
+    found is False when no loaded node comes from that directory (paths
+    are compared resolved, so "Tasks" matches "/abs/Tasks").
+    """
+    roots: Dict[str, Optional[str]] = {}
+    for node in nodes.values():
+        roots.setdefault(node.directory, node.workspace)
+    if directory in roots:
+        return True, roots[directory]
+    resolved = os.path.realpath(directory)
+    for root, workspace in roots.items():
+        if os.path.realpath(root) == resolved:
+            return True, workspace
+    return False, None
+
+
+@traced()
+def load_workspaces(
+    workspaces: List[Workspace],
+    cache: TaskCache | None = None,
+    max_workers: int | None = None,
+) -> Tuple[Dict[str, TaskNode], List[str]]:
+    """
+    Load every workspace concurrently and merge their (namespaced) nodes.
+    Returns (nodes, names of the workspaces that were re-read from disk).
+    Missing directories are skipped with a warning.
+    """
+    cache = cache or TaskCache()
+    present = []
+    for ws in workspaces:
+        if ws.tasks_dir.is_dir():
+            present.append(ws)
+        else:
+            logger.warning("Workspace %s: tasks directory not found at %s", ws.name, ws.tasks_dir)
+
+    nodes: Dict[str, TaskNode] = {}
+    reloaded: List[str] = []
+    if not present:
+        return nodes, reloaded
+
+    workers = max_workers or min(MAX_WORKERS, len(present))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="workspace-loader") as pool:
+        results = pool.map(lambda ws: cache.load(ws.tasks_dir, ws.name), present)
+        for ws, (ws_nodes, was_reloaded) in zip(present, results):
+            nodes.update(ws_nodes)
+            if was_reloaded:
+                reloaded.append(ws.name)
+
+    logger.info(
+        "Loaded %d tasks from %d workspace(s); re-read: %s",
+        len(nodes), len(present), ", ".join(reloaded) or "none",
+    )
+    return nodes, reloaded
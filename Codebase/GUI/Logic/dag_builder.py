@@ -1,34 +1,51 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import logging
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
 
 # This file is Codebase.GUI.Logic.dag_builder
 # so we import siblings via relative imports from Codebase.GUI
+from Codebase.Core.Tracing.tracer import traced
+from Codebase.Object.task_node import TaskNode
+from ..IO.task_cache import TaskCache
 from ..IO.task_loader import load_task_nodes
+from ..IO.workspaces import Workspace, load_workspaces, qualify_key, qualify_reference
 
+logger = logging.getLogger(__name__)
 
-def resolve_dependencies(nodes: Dict[str, TaskNode]) -> None:
+
+@traced()
+def resolve_dependencies(nodes: Dict[str, TaskNode]) -> Dict[str, List[str]]:
     """
     Map depends_on_raw strings to actual node keys,
     and populate deps_resolved / children.
 
+    Returns the dependency strings that matched nothing, per node key.
+
     Extracted from dag_viewer.py. :contentReference[oaicite:6]{index=6}
+
+    With workspaces (see IO/workspaces.py) labels and group+ids are only
+    matched within the node's own workspace unless the dependency names
+    another one ("infra:BBBB3").
     """
     label_to_keys: Dict[str, list[str]] = {}
     groupid_to_key: Dict[str, str] = {}
+    workspaces = {node.workspace for node in nodes.values()} - {None}
+    unresolved: Dict[str, List[str]] = {}
 
     # Build lookup maps
     for key, node in nodes.items():
-        label_to_keys.setdefault(node.label, []).append(key)
+        label_to_keys.setdefault(qualify_key(node.workspace, node.label), []).append(key)
         if node.group is not None and node.id is not None:
-            groupid_to_key[f"{node.group}{node.id}"] = key
+            groupid_to_key[qualify_key(node.workspace, f"{node.group}{node.id}")] = key
 
     # Resolve each node's dependencies
     for key, node in nodes.items():
         resolved: list[str] = []
-        for dep_str in node.depends_on_raw:
+        for raw_dep in node.depends_on_raw:
+            dep_str = qualify_reference(raw_dep, node.workspace, workspaces)
             dep_key: str | None = None
 
             # 1) direct key match (e.g. "EEEE1")
@@ -50,10 +67,10 @@ def resolve_dependencies(nodes: Dict[str, TaskNode]) -> None:
             if dep_key is not None and dep_key in nodes:
                 resolved.append(dep_key)
             else:
-                print(
-                    f"Warning: for node {key}, dependency '{dep_str}' "
-                    f"could not be resolved."
+                logger.warning(
+                    "For node %s, dependency %r could not be resolved.", key, raw_dep
                 )
+                unresolved.setdefault(key, []).append(raw_dep)
 
         node.deps_resolved = resolved
 
@@ -66,7 +83,67 @@ def resolve_dependencies(nodes: Dict[str, TaskNode]) -> None:
             if dep_key in nodes:
                 nodes[dep_key].children.append(key)
 
+    return unresolved
 
+
+def resolve_reference(
+    nodes: Dict[str, TaskNode], node: TaskNode, raw_dep: str, workspaces: set | None = None
+) -> str | None:
+    """
+    The key one depends_on entry of ``node`` points at, or None. Linear
+    in the number of nodes; for single live edits, not whole graphs.
+    """
+    if workspaces is None:
+        workspaces = {n.workspace for n in nodes.values()} - {None}
+    dep_str = qualify_reference(raw_dep, node.workspace, workspaces)
+    if dep_str in nodes:
+        return dep_str
+
+    dep_key = next(
+        (
+            k for k, n in nodes.items()
+            if n.group is not None and n.id is not None
+            and qualify_key(n.workspace, f"{n.group}{n.id}") == dep_str
+        ),
+        None,
+    )
+    if dep_key is None:
+        dep_key = next(
+            (k for k, n in nodes.items() if qualify_key(n.workspace, n.label) == dep_str),
+            None,
+        )
+    return dep_key
+
+
+@traced()
+def resolve_node_dependencies(nodes: Dict[str, TaskNode], key: str) -> None:
+    """
+    Resolve a single newly added node's depends_on_raw against the existing
+    nodes, link it in as their child and give it a level below its parents.
+
+    Used for live inserts so the rest of the graph is not re-resolved.
+    Same matching order (and workspace scoping) as resolve_dependencies
+    (key, group+id, label).
+    """
+    node = nodes[key]
+    workspaces = {n.workspace for n in nodes.values()} - {None}
+    resolved: list[str] = []
+    for raw_dep in node.depends_on_raw:
+        dep_key = resolve_reference(nodes, node, raw_dep, workspaces)
+        if dep_key is not None and dep_key != key:
+            resolved.append(dep_key)
+        else:
+            logger.warning(
+                "For node %s, dependency %r could not be resolved.", key, raw_dep
+            )
+
+    node.deps_resolved = resolved
+    for dep_key in resolved:
+        nodes[dep_key].children.append(key)
+    node.level = max((nodes[d].level + 1 for d in resolved), default=0)
+
+
+@traced()
 def compute_levels(nodes: Dict[str, TaskNode]) -> None:
     """
     Assign an integer 'level' to each node using a simple longest-path-from-sources
@@ -95,6 +172,7 @@ def compute_levels(nodes: Dict[str, TaskNode]) -> None:
                 queue.append(child)
 
 
+@traced()
 def build_dag(tasks_dir: Path | None = None) -> Dict[str, TaskNode]:
     """
     Convenience helper:
@@ -106,3 +184,21 @@ def build_dag(tasks_dir: Path | None = None) -> Dict[str, TaskNode]:
     resolve_dependencies(nodes)
     compute_levels(nodes)
     return nodes
+
+
+@traced()
+def build_workspace_dag(
+    workspaces: List[Workspace], cache: TaskCache | None = None
+) -> Dict[str, TaskNode]:
+    """
+    build_dag over several workspaces: load them concurrently (re-reading
+    only changed roots, see IO/task_cache.py), then resolve dependencies,
+    including cross-workspace ones, and compute levels on the merged graph.
+    """
+    nodes, _ = load_workspaces(workspaces, cache)
+    resolve_dependencies(nodes)
+    # Unchanged roots come back as the same objects, levels and all
+    for node in nodes.values():
+        node.level = 0
+    compute_levels(nodes)
+    return nodes
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Tk-free edge routing for the DAG layout.
+
+Modes:
+
+- "straight":   centre to centre (the original look)
+- "polyline":   leaves the bottom of the parent, enters the top of the
+                child, and passes every layer in between through a
+                "dummy node" slot in the gap between node columns
+- "orthogonal": horizontal / vertical segments only, running in the
+                channels between layers and the gaps between columns
+- "spline":     the polyline waypoints, meant to be drawn smoothed
+                (Tk ``smooth=True``)
+
+Routes are cached per (src, dst) together with the endpoint positions
+they were computed for, so a route is only recomputed when one of its
+endpoints has actually moved (e.g. edges incident to a dragged node).
+
+Dummy slots: every (layer, column gap) pair is a channel, and each long
+edge passing through it gets its own slot there. EdgeRouter spreads a
+channel's edges across the gap, ordered by where their straight line
+crosses the layer (ties by endpoints), so parallel long edges between
+the same columns run side by side instead of on top of each other.
+When an edge joins, leaves or reorders a channel, the other edges whose
+slot moved are reported by take_displaced() for re-routing.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .layout import NODE_HEIGHT, NODE_WIDTH, X_MARGIN, X_SPACING, Y_SPACING, Y_START
+
+ROUTING_MODES = ("straight", "polyline", "orthogonal", "spline")
+
+Point = Tuple[float, float]
+Edge = Tuple[str, str]
+# (layer, column gap index)
+Channel = Tuple[int, int]
+
+# Modes whose long edges take dummy slots
+SLOTTED_MODES = ("polyline", "spline")
+# Distance between neighbouring slots, squeezed when a gap gets crowded
+SLOT_SPACING = 8
+# Slots stay this far away from the node boxes either side of the gap
+SLOT_MARGIN = 4
+
+# Half of the vertical gap between two layers (channel centre offset)
+_CHANNEL = (Y_SPACING - NODE_HEIGHT) / 2
+
+
+def _gap_index(x: float) -> int:
+    """Nearest gap between two grid columns (gap k is right of column k)."""
+    return round((x - X_MARGIN) / X_SPACING - 0.5)
+
+
+def _gap_centre(k: int) -> float:
+    return X_MARGIN + (k + 0.5) * X_SPACING
+
+
+def _gap_x(x: float) -> float:
+    """Snap x to the centre of the nearest gap between two grid columns."""
+    return _gap_centre(_gap_index(x))
+
+
+def _layer_of(y: float) -> float:
+    return (y - Y_START) / Y_SPACING
+
+
+def _ports(src: Point, dst: Point) -> Tuple[Point, Point, int]:
+    """Exit / entry points on the node borders and the vertical direction."""
+    (x1, y1), (x2, y2) = src, dst
+    direction = 1 if y2 >= y1 else -1
+    return (x1, y1 + direction * NODE_HEIGHT / 2), (x2, y2 - direction * NODE_HEIGHT / 2), direction
+
+
+def route_straight(src: Point, dst: Point) -> List[float]:
+    return [src[0], src[1], dst[0], dst[1]]
+
+
+def _dummies(src: Point, dst: Point) -> List[Tuple[int, float]]:
+    """
+    (layer, x) for each layer strictly between the two nodes, in order
+    from src to dst; x is where the straight src -> dst line crosses it.
+    """
+    lo, hi = sorted((_layer_of(src[1]), _layer_of(dst[1])))
+    layers = list(range(int(lo) + 1, int(hi + 0.999999)))
+    if dst[1] < src[1]:
+        layers.reverse()
+    span = dst[1] - src[1]
+    dummies = []
+    for layer in layers:
+        y = Y_START + layer * Y_SPACING
+        t = (y - src[1]) / span if span else 0.5
+        dummies.append((layer, src[0] + t * (dst[0] - src[0])))
+    return dummies
+
+
+def route_polyline(src: Point, dst: Point, slots: Optional[Dict[int, float]] = None) -> List[float]:
+    """
+    One waypoint per layer in between, in a column gap. ``slots`` gives
+    the waypoint x per layer (see EdgeRouter); the gap centre otherwise.
+    """
+    (px, py), (qx, qy), _ = _ports(src, dst)
+    points = [px, py]
+    for layer, x in _dummies(src, dst):
+        x = slots[layer] if slots is not None else _gap_x(x)
+        points += [x, Y_START + layer * Y_SPACING]
+    points += [qx, qy]
+    return points
+
+
+def _slot_positions(k: int, members: Dict[Edge, Tuple]) -> Dict[Edge, float]:
+    """Spread a channel's edges (with their sort keys) across gap k."""
+    order = sorted(members, key=members.__getitem__)
+    n = len(order)
+    step = SLOT_SPACING
+    if n > 1:
+        step = min(step, (X_SPACING - NODE_WIDTH - 2 * SLOT_MARGIN) / (n - 1))
+    centre = _gap_centre(k)
+    return {edge: centre + (i - (n - 1) / 2) * step for i, edge in enumerate(order)}
+
+
+def route_orthogonal(src: Point, dst: Point) -> List[float]:
+    (px, py), (qx, qy), direction = _ports(src, dst)
+
+    # Channel just past the parent and just before the child
+    y_out = py + direction * _CHANNEL
+    y_in = qy - direction * _CHANNEL
+
+    if abs(dst[1] - src[1]) <= Y_SPACING * 1.01:
+        # Adjacent layers: a single horizontal hop in the shared channel
+        mid = (py + qy) / 2
+        return [px, py, px, mid, qx, mid, qx, qy]
+
+    # Longer edges drop down a column gap so they don't cross nodes
+    gx = _gap_x((src[0] + dst[0]) / 2)
+    return [px, py, px, y_out, gx, y_out, gx, y_in, qx, y_in, qx, qy]
+
+
+_ROUTERS = {
+    "straight": route_straight,
+    "polyline": route_polyline,
+    "orthogonal": route_orthogonal,
+    "spline": route_polyline,
+}
+
+
+def route_midpoint(points: List[float]) -> Point:
+    """Point halfway along a route's middle segment (for edge labels)."""
+    n = len(points) // 2
+    i = (n - 1) // 2 * 2
+    return (points[i] + points[i + 2]) / 2, (points[i + 1] + points[i + 3]) / 2
+
+
+class EdgeRouter:
+    """
+    Per-edge route cache.
+
+        router = EdgeRouter("orthogonal")
+        coords = router.route("AAAA1", "AAAA2", (100, 80), (280, 200))
+    """
+
+    def __init__(self, mode: str = "straight"):
+        self.mode = "straight"
+        self._cache: Dict[Edge, Tuple[Point, Point, List[float]]] = {}
+        # Dummy slots: channel -> {edge: sort key}, the slot x of each
+        # member, and the channels (with sort keys) each edge is in
+        self._channels: Dict[Channel, Dict[Edge, Tuple]] = {}
+        self._slot_x: Dict[Channel, Dict[Edge, float]] = {}
+        self._placed: Dict[Edge, Dict[Channel, Tuple]] = {}
+        self._displaced: Set[Edge] = set()
+        self.set_mode(mode)
+
+    @property
+    def smooth(self) -> bool:
+        """True when routes should be drawn as smoothed curves."""
+        return self.mode == "spline"
+
+    def set_mode(self, mode: str) -> None:
+        if mode not in _ROUTERS:
+            raise ValueError(f"Unknown edge routing mode {mode!r}; expected one of {ROUTING_MODES}")
+        if mode != self.mode:
+            self.mode = mode
+            self._cache.clear()
+            self._clear_slots()
+
+    # ---- dummy slots ----
+
+    def _clear_slots(self) -> None:
+        self._channels.clear()
+        self._slot_x.clear()
+        self._placed.clear()
+        self._displaced.clear()
+
+    @staticmethod
+    def _wanted(edge: Edge, src: Point, dst: Point) -> Dict[Channel, Tuple]:
+        """The channels an edge passes through, with its sort key in each."""
+        return {
+            (layer, _gap_index(x)): (x, src[0], dst[0], edge)
+            for layer, x in _dummies(src, dst)
+        }
+
+    def _place(self, edge: Edge, src: Point, dst: Point) -> None:
+        """Move edge into the channels it now passes; re-spread the ones that changed."""
+        old = self._placed.get(edge, {})
+        new = self._wanted(edge, src, dst)
+        if new == old:
+            return
+        changed = []
+        for channel, key in old.items():
+            if new.get(channel) != key:
+                members = self._channels[channel]
+                del members[edge]
+                if not members:
+                    del self._channels[channel]
+                changed.append(channel)
+        for channel, key in new.items():
+            if old.get(channel) != key:
+                self._channels.setdefault(channel, {})[edge] = key
+                changed.append(channel)
+        if new:
+            self._placed[edge] = new
+        else:
+            self._placed.pop(edge, None)
+
+        for channel in dict.fromkeys(changed):
+            before = self._slot_x.pop(channel, {})
+            members = self._channels.get(channel)
+            if not members:
+                continue
+            after = self._slot_x[channel] = _slot_positions(channel[1], members)
+            for other, x in after.items():
+                if other != edge and before.get(other) != x:
+                    self._cache.pop(other, None)
+                    self._displaced.add(other)
+
+    def plan(self, edges: Iterable[Tuple[str, str, Point, Point]]) -> None:
+        """
+        Assign every dummy slot up front from (src_key, dst_key, src, dst)
+        for all edges about to be drawn, so drawing them one at a time
+        does not keep shifting the earlier ones. Replaces previous slots.
+        """
+        self._cache.clear()
+        self._clear_slots()
+        if self.mode not in SLOTTED_MODES:
+            return
+        for src_key, dst_key, src, dst in edges:
+            edge = (src_key, dst_key)
+            wanted = self._wanted(edge, src, dst)
+            if wanted:
+                self._placed[edge] = wanted
+                for channel, key in wanted.items():
+                    self._channels.setdefault(channel, {})[edge] = key
+        for channel, members in self._channels.items():
+            self._slot_x[channel] = _slot_positions(channel[1], members)
+
+    def take_displaced(self) -> Set[Edge]:
+        """Edges whose slot moved because another edge was routed; clears the set."""
+        displaced, self._displaced = self._displaced, set()
+        return displaced
+
+    # ---- routes ----
+
+    def route(self, src_key: str, dst_key: str, src: Point, dst: Point) -> List[float]:
+        """Flat [x0, y0, x1, y1, ...] route, reused while neither end moves."""
+        edge = (src_key, dst_key)
+        cached = self._cache.get(edge)
+        if cached is not None and cached[0] == src and cached[1] == dst:
+            return cached[2]
+        if self.mode in SLOTTED_MODES:
+            self._place(edge, src, dst)
+            slots = {channel[0]: self._slot_x[channel][edge] for channel in self._placed.get(edge, ())}
+            points = route_polyline(src, dst, slots)
+        else:
+            points = _ROUTERS[self.mode](src, dst)
+        self._cache[edge] = (src, dst, points)
+        return points
+
+    def forget(self, keys: Optional[set] = None) -> None:
+        """Drop cached routes touching ``keys`` (all routes if None)."""
+        if keys is None:
+            self._cache.clear()
+            return
+        for edge in [e for e in self._cache if e[0] in keys or e[1] in keys]:
+            del self._cache[edge]
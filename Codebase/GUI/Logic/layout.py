@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tk-free grid layout for the DAG.
+
+Nodes are placed in rows by ``level`` (one row per DAG layer) and in
+columns by their order within that level. Both the Tk canvas and the
+headless exporters use this so they agree on where every node goes.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+# Simple grid layout
+X_SPACING = 180
+Y_SPACING = 120
+NODE_WIDTH = 140
+NODE_HEIGHT = 50
+Y_START = 80
+X_MARGIN = 100
+
+# Extra room around the outermost nodes for the scroll region / image size
+EXTENT_PADDING = 50
+
+
+def compute_grid_layout(nodes: Dict[str, "TaskNode"]) -> Dict[str, Tuple[float, float]]:
+    """
+    Return mapping: key -> (x, y) node centre.
+    """
+    return compute_level_layout({key: node.level for key, node in nodes.items()})
+
+
+def compute_level_layout(levels: Dict[str, int]) -> Dict[str, Tuple[float, float]]:
+    """
+    Grid layout from key -> level directly (e.g. for the collapsed-group
+    view, whose super-nodes are not TaskNodes).
+    """
+    level_to_keys: Dict[int, List[str]] = {}
+    for key, level in levels.items():
+        level_to_keys.setdefault(level, []).append(key)
+
+    positions: Dict[str, Tuple[float, float]] = {}
+    for level in sorted(level_to_keys.keys()):
+        y = Y_START + level * Y_SPACING
+        for i, key in enumerate(level_to_keys[level]):
+            positions[key] = (X_MARGIN + i * X_SPACING, y)
+    return positions
+
+
+def layout_extent(positions: Dict[str, Tuple[float, float]]) -> Tuple[float, float]:
+    """
+    Return (max_x, max_y) covering every node box plus padding.
+    """
+    max_x = 0.0
+    max_y = 0.0
+    for x, y in positions.values():
+        max_x = max(max_x, x + NODE_WIDTH / 2 + EXTENT_PADDING)
+        max_y = max(max_y, y + NODE_HEIGHT / 2 + EXTENT_PADDING)
+    return max_x, max_y
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Status roll-ups over the DAG.
+
+Every node has a derived state:
+
+    done     stored status is "done"
+    ready    not done, not marked blocked, every dependency done
+    blocked  anything else (marked blocked, or waiting on a dependency)
+
+and StatusRollup keeps, per node, how many of its ancestors and of its
+descendants are in each state. The "ready" set is the frontier of tasks
+that can be started now.
+
+The full computation runs once (bitsets in topological order). After
+that, set_status() only touches what a change can affect: the node's
+own state, its direct children's ready/blocked state, and the counters
+of the ancestors/descendants of every node whose state flipped.
+add_edge() adds only the ancestor/descendant pairs the new edge links
+for the first time.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, Iterable, List, Set
+
+from Codebase.Core.Tracing.tracer import traced
+from Codebase.Object.task_node import TaskNode
+from Codebase.Object.task_status import BLOCKED, DONE, normalize_status
+
+STATES = ("done", "ready", "blocked")
+
+try:
+    _popcount = int.bit_count  # Python 3.10+
+except AttributeError:  # pragma: no cover
+    def _popcount(x: int) -> int:
+        return bin(x).count("1")
+
+
+def _zero() -> Dict[str, int]:
+    return {state: 0 for state in STATES}
+
+
+class StatusRollup:
+    def __init__(self, nodes: Dict[str, TaskNode]):
+        self.nodes = nodes
+        self.states: Dict[str, str] = {}
+        # Dependencies of each node that are not done yet
+        self.undone_deps: Dict[str, int] = {}
+        self.ancestor_counts: Dict[str, Dict[str, int]] = {}
+        self.descendant_counts: Dict[str, Dict[str, int]] = {}
+        self.ready: Set[str] = set()
+        self.rebuild()
+
+    # ---- full computation ----
+
+    def _own_state(self, key: str) -> str:
+        status = self.nodes[key].status
+        if status == DONE:
+            return "done"
+        if status == BLOCKED or self.undone_deps[key]:
+            return "blocked"
+        return "ready"
+
+    def _topo_order(self) -> List[str]:
+        indegree = {k: len(n.deps_resolved) for k, n in self.nodes.items()}
+        queue = deque(k for k, d in indegree.items() if d == 0)
+        order = []
+        while queue:
+            key = queue.popleft()
+            order.append(key)
+            for child in self.nodes[key].children:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    queue.append(child)
+        # Nodes on a cycle are left out of the counts rather than looping
+        return order
+
+    def _count_closure(self, order: List[str], index: Dict[str, int], masks, upward: bool) -> Dict[str, Dict[str, int]]:
+        """
+        Ancestor (upward=True) or descendant closure counts. Each node's
+        closure is a bitset over node indices; a set is freed as soon as
+        the last node that needs it has been processed.
+        """
+        nodes = self.nodes
+        links = (lambda n: n.deps_resolved) if upward else (lambda n: n.children)
+        back = (lambda n: n.children) if upward else (lambda n: n.deps_resolved)
+        remaining = {k: len(back(nodes[k])) for k in order}
+        bits: Dict[str, int] = {}
+        counts: Dict[str, Dict[str, int]] = {}
+
+        for key in (order if upward else reversed(order)):
+            closure = 0
+            for other in links(nodes[key]):
+                if other in bits:
+                    closure |= bits[other] | (1 << index[other])
+                    remaining[other] -= 1
+                    if remaining[other] == 0:
+                        del bits[other]
+            counts[key] = {state: _popcount(closure & masks[state]) for state in STATES}
+            if remaining[key]:
+                bits[key] = closure
+        return counts
+
+    @traced()
+    def rebuild(self) -> None:
+        nodes = self.nodes
+        self.undone_deps = {
+            k: sum(1 for d in n.deps_resolved if d in nodes and nodes[d].status != DONE)
+            for k, n in nodes.items()
+        }
+        self.states = {k: self._own_state(k) for k in nodes}
+        self.ready = {k for k, s in self.states.items() if s == "ready"}
+
+        order = self._topo_order()
+        index = {k: i for i, k in enumerate(order)}
+        masks = {state: 0 for state in STATES}
+        for key, i in index.items():
+            masks[self.states[key]] |= 1 << i
+
+        self.ancestor_counts = self._count_closure(order, index, masks, upward=True)
+        self.descendant_counts = self._count_closure(order, index, masks, upward=False)
+        for key in nodes:
+            self.ancestor_counts.setdefault(key, _zero())
+            self.descendant_counts.setdefault(key, _zero())
+
+    # ---- incremental updates ----
+
+    def _walk(self, start: str, upward: bool) -> Iterable[str]:
+        """Every ancestor / descendant of start, once each."""
+        seen = {start}
+        stack = [start]
+        while stack:
+            node = self.nodes[stack.pop()]
+            for other in (node.deps_resolved if upward else node.children):
+                if other not in seen and other in self.nodes:
+                    seen.add(other)
+                    stack.append(other)
+                    yield other
+
+    def _apply_state(self, key: str, new: str) -> bool:
+        old = self.states[key]
+        if old == new:
+            return False
+        self.states[key] = new
+        if new == "ready":
+            self.ready.add(key)
+        else:
+            self.ready.discard(key)
+        # key is one ancestor of each descendant, one descendant of each ancestor
+        for other in self._walk(key, upward=False):
+            counts = self.ancestor_counts[other]
+            counts[old] -= 1
+            counts[new] += 1
+        for other in self._walk(key, upward=True):
+            counts = self.descendant_counts[other]
+            counts[old] -= 1
+            counts[new] += 1
+        return True
+
+    def set_status(self, key: str, status: str) -> List[str]:
+        """
+        Change one node's stored status and update the roll-ups.
+        Returns the keys whose derived state changed (for restyling).
+        """
+        node = self.nodes[key]
+        was_done = node.status == DONE
+        node.status = normalize_status(status)
+        is_done = node.status == DONE
+
+        changed = []
+        if self._apply_state(key, self._own_state(key)):
+            changed.append(key)
+
+        if was_done != is_done:
+            delta = -1 if is_done else 1
+            for child in node.children:
+                if child not in self.nodes:
+                    continue
+                self.undone_deps[child] += delta
+                if self._apply_state(child, self._own_state(child)):
+                    changed.append(child)
+        return changed
+
+    def add_node(self, key: str) -> None:
+        """Account for a node inserted live (no children yet)."""
+        node = self.nodes[key]
+        self.undone_deps[key] = sum(
+            1 for d in node.deps_resolved if d in self.nodes and self.nodes[d].status != DONE
+        )
+        state = self.states[key] = self._own_state(key)
+        if state == "ready":
+            self.ready.add(key)
+
+        counts = _zero()
+        for other in self._walk(key, upward=True):
+            counts[self.states[other]] += 1
+            self.descendant_counts[other][state] += 1
+        self.ancestor_counts[key] = counts
+        self.descendant_counts[key] = _zero()
+
+    def _gained(self, sources: List[str], targets: List[str], edge, downward: bool) -> Dict[str, Dict[str, int]]:
+        """
+        For a new edge: per target, the states of the sources it is newly
+        linked to (downward: sources become its ancestors, else its
+        descendants). Reachability before the edge is one pass in
+        topological order over what the sources reach without it, with a
+        bitset over the sources per node, freed once no longer needed.
+        """
+        nodes = self.nodes
+        links = (lambda n: n.children) if downward else (lambda n: n.deps_resolved)
+        back = (lambda n: n.deps_resolved) if downward else (lambda n: n.children)
+        skip = edge if downward else (edge[1], edge[0])
+
+        bit = {key: 1 << i for i, key in enumerate(sources)}
+        masks = {state: 0 for state in STATES}
+        for key, b in bit.items():
+            masks[self.states[key]] |= b
+        full = (1 << len(sources)) - 1
+
+        region = set(sources)
+        stack = list(sources)
+        while stack:
+            key = stack.pop()
+            for other in links(nodes[key]):
+                if other not in region and other in nodes and (key, other) != skip:
+                    region.add(other)
+                    stack.append(other)
+
+        def inside(key: str) -> List[str]:
+            return [o for o in back(nodes[key]) if o in region and (o, key) != skip]
+
+        indegree = {key: len(inside(key)) for key in region}
+        remaining = {key: sum(1 for o in links(nodes[key]) if o in region and (key, o) != skip) for key in region}
+        queue = deque(key for key, d in indegree.items() if d == 0)
+        wanted = set(targets)
+        reach: Dict[str, int] = {}
+        gained: Dict[str, Dict[str, int]] = {}
+        while queue:
+            key = queue.popleft()
+            closure = 0
+            for other in inside(key):
+                closure |= reach[other] | bit.get(other, 0)
+                remaining[other] -= 1
+                if remaining[other] == 0:
+                    del reach[other]
+            if key in wanted:
+                new = full & ~closure & ~bit.get(key, 0)
+                gained[key] = {state: _popcount(new & masks[state]) for state in STATES}
+            if remaining[key]:
+                reach[key] = closure
+            for other in links(nodes[key]):
+                if other in region and (key, other) != skip:
+                    indegree[other] -= 1
+                    if indegree[other] == 0:
+                        queue.append(other)
+
+        # Targets the sources did not reach before: every source is new
+        everything = {state: _popcount(masks[state]) for state in STATES}
+        for key in targets:
+            gained.setdefault(key, everything)
+        return gained
+
+    def add_edge(self, parent: str, child: str) -> None:
+        """
+        Account for a new dependency parent -> child that is already in
+        the nodes' deps_resolved / children. Child and its descendants
+        gain parent and its ancestors as ancestors (and the other way
+        round) unless they were linked already; only those new pairs
+        are added to the counts.
+        """
+        ancestors = [parent, *self._walk(parent, upward=True)]
+        descendants = [child, *self._walk(child, upward=False)]
+        edge = (parent, child)
+        new_ancestors = self._gained(ancestors, descendants, edge, downward=True)
+        new_descendants = self._gained(descendants, ancestors, edge, downward=False)
+        for key, gained in new_ancestors.items():
+            counts = self.ancestor_counts[key]
+            for state, n in gained.items():
+                counts[state] += n
+        for key, gained in new_descendants.items():
+            counts = self.descendant_counts[key]
+            for state, n in gained.items():
+                counts[state] += n
+
+        if self.nodes[parent].status != DONE:
+            self.undone_deps[child] += 1
+        self._apply_state(child, self._own_state(child))
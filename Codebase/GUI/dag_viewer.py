@@ -8,84 +8,247 @@ This module is a thin entrypoint that wires together:
 - IO:       Codebase.GUI.IO.task_loader
 - Logic:    Codebase.GUI.Logic.dag_builder
 - GUI:      Codebase.GUI.GUI.dag_canvas + gui_profile
+
+Start-up is "fast start" by default: the window opens immediately
+showing the snapshot of the last session (UserData/.dag_snapshot.png)
+while the GUI modules are imported and the DAG is loaded in a
+background thread; the live canvas replaces the snapshot when ready.
+
+    python -m Codebase.GUI.dag_viewer [--timing] [--no-fast-start] [--workspace NAME ...]
+                                      [--collapse-groups] [--diff SNAPSHOT] [--import FILE]
+
+If UserData/workspaces.json lists several task roots (see
+GUI/IO/workspaces.py) all of them are shown; --workspace (repeatable)
+limits the view to the named ones.
+
+--collapse-groups starts with every group collapsed into one node
+(double-click a group to expand it), which keeps huge graphs small.
+
+--diff marks what changed since a saved graph snapshot (a name prefix,
+file, or "latest"; see Query/graph_snapshot.py). The sidebar can save
+snapshots and switch between them too.
+
+--import shows a DOT / GraphML / JSONL graph read-only, without writing
+task files (see Import/import_graph.py).
 """
 
 from __future__ import annotations
 
+from time import perf_counter
+
+_T0 = perf_counter()
+
+import argparse
+import logging
+import threading
 from pathlib import Path
-from typing import Dict, TYPE_CHECKING
+from typing import Dict, List
 import tkinter as tk
 
 from Codebase.Core.Pathing.get_project_root import get_project_root
 # --- Central path config ------------------------------------
 from Codebase.Core.Pathing.project_paths import ProjectPaths, add_to_sys_path
+from Codebase.Core.Tracing.log_config import configure_logging
+from Codebase.Core.Tracing.startup_timer import StartupTimer
 from Codebase.GUI.GUI.Bind.bind_escape_to_close import bind_escape_to_close
 from Codebase.GUI.GUI.Geometry.load_last_geometry import load_last_geometry
 from Codebase.GUI.GUI.Geometry.save_geometry import save_geometry
-from Codebase.GUI.GUI.Style.get_group_styles import get_group_styles
-from Codebase.GUI.GUI.Style.set_group_visible import set_group_visible
 from Codebase.GUI.GUI.Tool.center_on_current_monitor import center_on_current_monitor
 
+logger = logging.getLogger(__name__)
+
 # Make sure project_root / Codebase are on sys.path even if launched oddly
 add_to_sys_path()
 
-# --- Project imports ----------------------------------------
-from Codebase.GUI.GUI.dag_canvas import DAGCanvas
-from Codebase.GUI.Logic.dag_builder import build_dag
-
-
-def main() -> None:
-    # Use the central path definition for Tasks
-    tasks_dir: Path = ProjectPaths.tasks
-
-    if not tasks_dir.is_dir():
-        print(f"[DAGViewer] Tasks directory not found at:\n  {tasks_dir}")
-        print("Create it, or adjust ProjectPaths.tasks / project_paths.json.")
-        return
+# Everything else (DAGCanvas and its Draw/Interaction/Style/Tile helpers,
+# dag_builder, NumPy/Pillow) is imported by _load_in_background().
+
+
+def _load_in_background(source: Path | List["Workspace"], result: dict) -> None:
+    """Worker thread: heavy imports + build_dag (a tasks directory, a
+    list of workspaces or a graph file to import). Must not touch Tk."""
+    t0 = perf_counter()
+    import Codebase.GUI.GUI.dag_canvas  # noqa: F401  (warm the import cache)
+    import Codebase.GUI.GUI.minimap_canvas  # noqa: F401
+    from Codebase.GUI.Logic.dag_builder import build_dag, build_workspace_dag
+    from Codebase.GUI.Logic.status_rollup import StatusRollup
+    result["imports"] = (t0, perf_counter())
+
+    t1 = perf_counter()
+    try:
+        if isinstance(source, list):
+            result["nodes"] = build_workspace_dag(source)
+        elif source.is_file():
+            from Codebase.Import.import_graph import load_imported_graph
+
+            result["nodes"] = load_imported_graph(source)
+        else:
+            result["nodes"] = build_dag(source)
+    except Exception as e:
+        result["error"] = e
+    result["load_tasks"] = (t1, perf_counter())
+
+    if "nodes" in result:
+        t2 = perf_counter()
+        result["rollup"] = StatusRollup(result["nodes"])
+        result["status_rollup"] = (t2, perf_counter())
+
+
+def build_viewer(
+    root: tk.Tk,
+    main_frame: tk.Frame,
+    nodes: Dict[str, "TaskNode"],
+    tasks_dir: Path | Dict[str, Path] | None = None,
+    status_rollup=None,
+    collapse_groups: bool = False,
+    diff_against: str | None = None,
+    read_only: bool = False,
+):
+    """
+    Build the live canvas + sidebar inside main_frame.
+    The search box needs tasks_dir ({workspace: dir} for workspaces) and
+    is left out without it. collapse_groups starts with every group
+    collapsed. diff_against names a graph snapshot to overlay changes
+    against. read_only is for graphs without task files (imports).
+    Returns (canvas, subscriber).
+    """
+    from Codebase.GUI.GUI.Bind.bind_task_subscriber import bind_task_subscriber
+    from Codebase.GUI.GUI.Draw.set_edge_routing import set_edge_routing
+    from Codebase.GUI.GUI.Style.get_group_styles import get_group_styles
+    from Codebase.GUI.GUI.Style.highlight_nodes import highlight_nodes
+    from Codebase.GUI.GUI.Style.set_group_visible import set_group_visible
+    from Codebase.GUI.GUI.Style.set_groups_collapsed import set_groups_collapsed
+    from Codebase.GUI.GUI.Style.show_diff_overlay import (
+        move_diff_overlay, refresh_diff_overlay, show_diff_overlay,
+    )
+    from Codebase.GUI.GUI.dag_canvas import DAGCanvas
+    from Codebase.GUI.GUI.minimap_canvas import MinimapCanvas
+    from Codebase.GUI.GUI.search_panel import SearchPanel
+    from Codebase.GUI.Logic.edge_routing import ROUTING_MODES
+    from Codebase.Query.graph_snapshot import (
+        GraphState, diff_graphs, find_snapshot, list_snapshots, records_from_nodes, save_snapshot,
+    )
 
-    # Mapping of node_id -> TaskNode
-    # (TaskNode is only needed for typing; at runtime this is just a dict)
-    nodes: Dict[str, "TaskNode"] = build_dag(tasks_dir)
-
-    if not nodes:
-        print(f"[DAGViewer] No task JSON files found in {tasks_dir}")
-        return
-
-    root = tk.Tk()
-    root.title("DAG Viewer")
-
-    # Default size
-    root.geometry("1000x700")
+    # Canvas on the left
+    collapsed = {n.group for n in nodes.values() if n.group} if collapse_groups else ()
+    canvas = DAGCanvas(
+        main_frame,
+        nodes,
+        status_rollup=status_rollup,
+        collapsed_groups=collapsed,
+        read_only=read_only,
+        width=1000,
+        height=700,
+    )
+    canvas.pack(side="left", fill="both", expand=True)
 
-    proj_root = get_project_root()
-    dag_geometry_file = proj_root/"UserData"/".dag_geom_file"
+    # New tasks created elsewhere show up without a restart
+    subscriber = None if read_only else bind_task_subscriber(root, canvas)
 
-    # Geometry: load last if present, else center once
-    if not load_last_geometry(root, dag_geometry_file):
-        center_on_current_monitor(root)
-
-    # Close behavior (WM + ESC)
-    def on_close() -> None:
-        save_geometry(root, dag_geometry_file)
-        root.destroy()
+    # Sidebar on the right for group toggles
+    sidebar = tk.Frame(main_frame, padx=8, pady=8, relief="groove", borderwidth=2)
+    sidebar.pack(side="right", fill="y")
 
-    root.protocol("WM_DELETE_WINDOW", on_close)
-    bind_escape_to_close(root, on_close)
+    # Full-text search: rank as you type, click a result to jump to it
+    if tasks_dir is not None:
+        tk.Label(
+            sidebar,
+            text="Search",
+            font=("TkDefaultFont", 10, "bold"),
+        ).pack(anchor="nw", pady=(0, 4))
+        SearchPanel(sidebar, canvas, tasks_dir).pack(fill="x", anchor="nw", pady=(0, 12))
+
+    # Status totals + "ready to start" frontier (middle-click a node to
+    # change its status)
+    tk.Label(
+        sidebar,
+        text="Status",
+        font=("TkDefaultFont", 10, "bold"),
+    ).pack(anchor="nw", pady=(0, 4))
+    status_label = tk.Label(sidebar, anchor="w", justify="left")
+    status_label.pack(anchor="nw")
+
+    def refresh_status(_key=None) -> None:
+        states = list(canvas.status_rollup.states.values())
+        status_label.configure(
+            text=f"{states.count('ready')} ready, {states.count('blocked')} blocked, "
+                 f"{states.count('done')} done"
+        )
 
-    root.protocol("WM_DELETE_WINDOW", on_close)
-    bind_escape_to_close(root, on_close)
+    refresh_status()
+    canvas.status_changed_callbacks.append(refresh_status)
+    canvas.node_added_callbacks.append(refresh_status)
+    tk.Button(
+        sidebar,
+        text="Show ready",
+        command=lambda: highlight_nodes(canvas, sorted(canvas.status_rollup.ready)),
+    ).pack(anchor="nw", pady=(2, 12))
 
-    # ---- Main layout: canvas + right-side group filters ----
-    main_frame = tk.Frame(root)
-    main_frame.pack(fill="both", expand=True)
+    # Overview of the whole graph; click/drag to navigate
+    tk.Label(
+        sidebar,
+        text="Overview",
+        font=("TkDefaultFont", 10, "bold"),
+    ).pack(anchor="nw", pady=(0, 4))
+    MinimapCanvas(sidebar, canvas).pack(anchor="nw", pady=(0, 12))
 
-    # Canvas on the left
-    canvas = DAGCanvas(main_frame, nodes, width=1000, height=700)
-    canvas.pack(side="left", fill="both", expand=True)
+    # Changes since a saved snapshot of the graph
+    tk.Label(
+        sidebar,
+        text="Changes",
+        font=("TkDefaultFont", 10, "bold"),
+    ).pack(anchor="nw", pady=(0, 4))
+    snapshot_var = tk.StringVar(value="")
+    snapshot_menu = tk.OptionMenu(sidebar, snapshot_var, "")
+    snapshot_menu.pack(fill="x", anchor="nw")
+    diff_label = tk.Label(sidebar, anchor="w", justify="left")
+    diff_label.pack(anchor="nw")
+
+    def refresh_snapshot_menu() -> None:
+        menu = snapshot_menu["menu"]
+        menu.delete(0, "end")
+        for snap in reversed(list_snapshots()):
+            menu.add_command(label=snap.name, command=lambda n=snap.name: snapshot_var.set(n))
+        if not snapshot_var.get() and menu.index("end") is not None:
+            snapshot_var.set(menu.entrycget(0, "label"))
+
+    def show_changes(ref: str | None = None) -> None:
+        ref = ref or snapshot_var.get()
+        if not ref:
+            return
+        try:
+            snap = find_snapshot(ref)
+        except (LookupError, ValueError) as e:
+            logger.warning("Cannot show changes since %r: %s", ref, e)
+            return
+        snapshot_var.set(snap.name)
+        diff = diff_graphs(snap, GraphState(records_from_nodes(canvas.nodes)))
+        show_diff_overlay(canvas, diff)
+        diff_label.configure(
+            text=f"{len(diff.added)} added, {len(diff.modified)} modified, "
+                 f"{len(diff.removed)} removed"
+        )
 
-    # Sidebar on the right for group toggles
-    sidebar = tk.Frame(main_frame, padx=8, pady=8, relief="groove", borderwidth=2)
-    sidebar.pack(side="right", fill="y")
+    def take_snapshot() -> None:
+        path = save_snapshot(records_from_nodes(canvas.nodes))
+        logger.info("Saved graph snapshot %s", path.name)
+        snapshot_var.set(path.name[: -len(path.suffix)])
+        refresh_snapshot_menu()
+
+    def clear_changes() -> None:
+        show_diff_overlay(canvas, None)
+        diff_label.configure(text="")
+
+    refresh_snapshot_menu()
+    canvas.redraw_callbacks.append(lambda: refresh_diff_overlay(canvas))
+    canvas.node_moved_callbacks.append(lambda key: move_diff_overlay(canvas, key))
+    diff_buttons = tk.Frame(sidebar)
+    diff_buttons.pack(fill="x", anchor="nw", pady=(2, 12))
+    tk.Button(diff_buttons, text="Show", command=show_changes).pack(side="left")
+    tk.Button(diff_buttons, text="Clear", command=clear_changes).pack(side="left", padx=(4, 0))
+    tk.Button(diff_buttons, text="Save snapshot", command=take_snapshot).pack(side="left", padx=(4, 0))
+    if diff_against:
+        show_changes(diff_against)
 
     tk.Label(
         sidebar,
@@ -95,11 +258,35 @@ def main() -> None:
 
     group_styles = get_group_styles(canvas)
     group_vars: dict[str, tk.BooleanVar] = {}
+    collapse_vars: dict[str, tk.BooleanVar] = {}
 
     def on_toggle(group: str) -> None:
         visible = group_vars[group].get()
         set_group_visible(canvas, group, visible)
 
+    def on_collapse(group: str) -> None:
+        set_groups_collapsed(canvas, [group], collapse_vars[group].get())
+
+    def sync_collapse_vars() -> None:
+        # Groups also expand on double-click / search jumps
+        for group, var in collapse_vars.items():
+            if var.get() != (group in canvas.collapsed_groups):
+                var.set(group in canvas.collapsed_groups)
+
+    canvas.redraw_callbacks.append(sync_collapse_vars)
+    buttons = tk.Frame(sidebar)
+    buttons.pack(fill="x", anchor="nw", pady=(0, 4))
+    tk.Button(
+        buttons,
+        text="Collapse all",
+        command=lambda: set_groups_collapsed(canvas, list(group_styles), True),
+    ).pack(side="left")
+    tk.Button(
+        buttons,
+        text="Expand all",
+        command=lambda: set_groups_collapsed(canvas, list(group_styles), False),
+    ).pack(side="left", padx=(4, 0))
+
     # One row per group: color swatch + checkbox
     for group, (color, visible) in sorted(group_styles.items()):
         row = tk.Frame(sidebar)
@@ -126,6 +313,186 @@ def main() -> None:
         )
         cb.pack(side="left", fill="x", expand=True)
 
+        collapse_var = tk.BooleanVar(value=group in canvas.collapsed_groups)
+        collapse_vars[group] = collapse_var
+        tk.Checkbutton(
+            row,
+            text="collapse",
+            variable=collapse_var,
+            command=lambda g=group: on_collapse(g),
+        ).pack(side="right")
+
+    # Edge routing style (item backend only; tiles draw straight edges)
+    if canvas.full_backend != "tiles":
+        tk.Label(
+            sidebar,
+            text="Edges",
+            font=("TkDefaultFont", 10, "bold"),
+        ).pack(anchor="nw", pady=(12, 4))
+
+        routing_var = tk.StringVar(value=canvas.edge_router.mode)
+        for mode in ROUTING_MODES:
+            tk.Radiobutton(
+                sidebar,
+                text=mode.capitalize(),
+                variable=routing_var,
+                value=mode,
+                command=lambda: set_edge_routing(canvas, routing_var.get()),
+                anchor="w",
+            ).pack(anchor="nw")
+
+    return canvas, subscriber
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Interactive DAG viewer for the task JSON files.")
+    parser.add_argument("--timing", action="store_true", help="Print a start-up timing report")
+    parser.add_argument("--no-fast-start", dest="fast_start", action="store_false",
+                        help="Load everything before opening the window (no cached first frame)")
+    parser.add_argument("--workspace", action="append", default=[], metavar="NAME",
+                        help="Only show this workspace from UserData/workspaces.json (repeatable)")
+    parser.add_argument("--collapse-groups", action="store_true", help="Start with every group collapsed")
+    parser.add_argument("--diff", metavar="SNAPSHOT", default=None,
+                        help="Mark changes since a graph snapshot (name prefix, file or 'latest')")
+    parser.add_argument("--import", dest="import_file", type=Path, metavar="FILE", default=None,
+                        help="Show a DOT / GraphML / JSONL graph read-only")
+    args = parser.parse_args(argv)
+    fast_start = args.fast_start
+    import_file = args.import_file
+    configure_logging()
+    timer = StartupTimer(_T0)
+    timer.mark("imports")
+
+    from Codebase.GUI.IO.workspaces import load_workspace_config, select_workspaces
+
+    # Several task roots if workspaces.json lists them, else the central Tasks dir
+    names = args.workspace
+    try:
+        workspaces = select_workspaces(load_workspace_config(), names)
+    except ValueError as e:
+        print(f"[DAGViewer] {e}")
+        return
+
+    if import_file is not None:
+        if not import_file.is_file():
+            print(f"[DAGViewer] Import file not found: {import_file}")
+            return
+        source: Path | list = import_file
+        tasks_dir: Path | Dict[str, Path] | None = None
+        title = f"DAG Viewer — {import_file.name} (read-only)"
+        # The cached first frame belongs to the task graph; leave it alone
+        fast_start = False
+    elif workspaces:
+        source = workspaces
+        tasks_dir = {ws.name: ws.tasks_dir for ws in workspaces}
+        title = f"DAG Viewer — {', '.join(tasks_dir)}"
+    else:
+        if names:
+            print("[DAGViewer] --workspace needs UserData/workspaces.json (see GUI/IO/workspaces.py).")
+            return
+        tasks_dir = source = ProjectPaths.tasks
+        title = "DAG Viewer"
+
+        if not tasks_dir.is_dir():
+            print(f"[DAGViewer] Tasks directory not found at:\n  {tasks_dir}")
+            print("Create it, or adjust ProjectPaths.tasks / project_paths.json.")
+            return
+
+    # Start loading right away; the window comes up while this runs
+    result: dict = {}
+    loader = threading.Thread(
+        target=_load_in_background, args=(source, result), name="dag-loader", daemon=True
+    )
+    loader.start()
+    if not fast_start:
+        # Classic behavior: everything is loaded before the window opens
+        loader.join()
+
+    root = tk.Tk()
+    root.title(title)
+
+    # Default size
+    root.geometry("1000x700")
+
+    proj_root = get_project_root()
+    dag_geometry_file = proj_root/"UserData"/".dag_geom_file"
+    dag_snapshot_file = proj_root/"UserData"/".dag_snapshot.png"
+
+    # Geometry: load last if present, else center once
+    if not load_last_geometry(root, dag_geometry_file):
+        center_on_current_monitor(root)
+
+    # Live updates from the task channel (set up once the canvas exists)
+    state: dict = {"subscriber": None}
+
+    # Close behavior (WM + ESC)
+    def on_close() -> None:
+        save_geometry(root, dag_geometry_file)
+        if state["subscriber"] is not None:
+            state["subscriber"].close()
+        root.destroy()
+
+    root.protocol("WM_DELETE_WINDOW", on_close)
+    bind_escape_to_close(root, on_close)
+    timer.mark("tk_root")
+
+    # ---- Main layout: canvas + right-side group filters ----
+    main_frame = tk.Frame(root)
+    main_frame.pack(fill="both", expand=True)
+
+    # Placeholder: last session's snapshot if we have one, else a message
+    placeholder = tk.Label(main_frame, text="Loading tasks…", anchor="nw", background="white")
+    if fast_start:
+        from Codebase.GUI.GUI.Tool.snapshot import load_snapshot
+
+        snapshot = load_snapshot(root, dag_snapshot_file)
+        if snapshot is not None:
+            placeholder.configure(image=snapshot, anchor="nw")
+            placeholder.image = snapshot  # keep a reference
+    placeholder.pack(fill="both", expand=True)
+    root.update()
+    timer.mark("first_frame")
+
+    def finish_loading() -> None:
+        if loader.is_alive():
+            root.after(15, finish_loading)
+            return
+        for phase in ("imports", "load_tasks", "status_rollup"):
+            if phase in result:
+                timer.record(f"bg_{phase}", *result[phase])
+        timer.mark("wait_for_loader")
+
+        if "error" in result:
+            print(f"[DAGViewer] Could not load tasks from {import_file or tasks_dir}: {result['error']}")
+            root.destroy()
+            return
+
+        # Mapping of node_id -> TaskNode
+        nodes = result["nodes"]
+        if not nodes:
+            print(f"[DAGViewer] No tasks found in {import_file or tasks_dir}")
+            root.destroy()
+            return
+
+        placeholder.destroy()
+        canvas, state["subscriber"] = build_viewer(
+            root, main_frame, nodes, tasks_dir, result.get("rollup"), args.collapse_groups,
+            args.diff, read_only=import_file is not None,
+        )
+        timer.mark("build_canvas")
+        root.update_idletasks()
+        timer.mark("live_frame")
+
+        if fast_start:
+            from Codebase.GUI.GUI.Tool.snapshot import save_snapshot
+
+            # Refresh the cached first frame for next launch
+            root.after(500, lambda: save_snapshot(canvas, dag_snapshot_file))
+
+        if args.timing:
+            print(timer.report("DAGViewer startup"))
+
+    root.after(0, finish_loading)
     root.mainloop()
 
 
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Hotkey entrypoint for "Create Task".
+
+Asks the resident task_create_daemon to show its window. If no daemon is
+running yet, starts one in the background (it shows the window as soon
+as it is up). Deliberately imports nothing heavy: no Tk, no Jinja2.
+
+On platforms without Unix sockets this falls back to the plain
+task_create_gui window.
+"""
+
+from __future__ import annotations
+
+import socket
+import subprocess
+import sys
+
+from Codebase.Core.Pathing.project_paths import ProjectPaths
+
+SOCKET_PATH = ProjectPaths.userdata / ".create_task.sock"
+
+
+def send_command(command: str, timeout: float = 0.5) -> bool:
+    """Send one command to the daemon; True if it acknowledged."""
+    s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    s.settimeout(timeout)
+    try:
+        s.connect(str(SOCKET_PATH))
+        s.sendall(command.encode("utf-8") + b"\n")
+        return s.recv(16).startswith(b"ok")
+    except OSError:
+        return False
+    finally:
+        s.close()
+
+
+def start_daemon() -> None:
+    """Launch the daemon detached from this (short-lived) process."""
+    subprocess.Popen(
+        [sys.executable, "-m", "Codebase.GUI.task_create_daemon", "--show"],
+        cwd=str(ProjectPaths.project_root),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def main() -> int:
+    if not hasattr(socket, "AF_UNIX"):
+        from Codebase.GUI.task_create_gui import main as run_gui
+        run_gui()
+        return 0
+
+    command = sys.argv[1] if len(sys.argv) > 1 else "show"
+    if send_command(command):
+        return 0
+    if command == "show":
+        start_daemon()
+        return 0
+    print(f"[task_create_client] Daemon not running ({SOCKET_PATH})")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
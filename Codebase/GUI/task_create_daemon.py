@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Resident "Create Task" process.
+
+Builds the Create Task window once, keeps it hidden, and listens on a
+local Unix socket (UserData/.create_task.sock). The hotkey runs the tiny
+task_create_client, which just sends "show" here, so the window appears
+without paying for interpreter start-up, Tk and Jinja2 imports on every
+press.
+
+Commands (one line per connection):
+    show   - show, raise and focus the window
+    ping   - liveness check
+    quit   - shut the daemon down
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import sys
+import tkinter as tk
+
+from Codebase.Core.Pathing.project_paths import ProjectPaths
+from Codebase.Core.Tracing.log_config import configure_logging
+from Codebase.GUI.GUI.Bind.bind_escape_to_close import bind_escape_to_close
+from Codebase.GUI.task_create_gui import build_task_create_window
+
+logger = logging.getLogger(__name__)
+
+SOCKET_PATH = ProjectPaths.userdata / ".create_task.sock"
+
+
+def _socket_in_use() -> bool:
+    """True if another daemon is already answering on SOCKET_PATH."""
+    s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        s.connect(str(SOCKET_PATH))
+        return True
+    except OSError:
+        return False
+    finally:
+        s.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    show_on_start = "--show" in argv
+    configure_logging()
+
+    if not hasattr(socket, "AF_UNIX"):
+        logger.warning("Unix sockets are not available on this platform.")
+        return 1
+
+    SOCKET_PATH.parent.mkdir(parents=True, exist_ok=True)
+    if SOCKET_PATH.exists():
+        if _socket_in_use():
+            logger.info("Already running on %s", SOCKET_PATH)
+            return 0
+        SOCKET_PATH.unlink()  # stale socket from a crashed daemon
+
+    root = tk.Tk()
+    root.title("Create Task")
+    root.resizable(False, False)
+    view = build_task_create_window(root)
+    root.withdraw()
+
+    # Closing only hides the window; the process stays resident
+    def on_close() -> None:
+        root.withdraw()
+
+    root.protocol("WM_DELETE_WINDOW", on_close)
+    bind_escape_to_close(root, on_close)
+
+    def show() -> None:
+        root.deiconify()
+        root.lift()
+        root.attributes("-topmost", True)
+        root.after_idle(root.attributes, "-topmost", False)
+        root.focus_force()
+        view["entry_task"].focus_set()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(SOCKET_PATH))
+    os.chmod(SOCKET_PATH, 0o600)
+    server.listen(8)
+    server.setblocking(False)
+
+    def on_readable(*_args) -> None:
+        try:
+            conn, _ = server.accept()
+        except BlockingIOError:
+            return
+        with conn:
+            conn.settimeout(0.5)
+            try:
+                command = conn.recv(64).decode("utf-8", "replace").strip()
+                conn.sendall(b"ok\n")
+            except OSError:
+                return
+        if command == "show":
+            show()
+        elif command == "quit":
+            root.destroy()
+
+    # Let Tk's event loop wake us up when a client connects (no polling)
+    root.tk.createfilehandler(server, tk.READABLE, on_readable)
+
+    if show_on_start:
+        show()
+
+    try:
+        root.mainloop()
+    finally:
+        server.close()
+        try:
+            SOCKET_PATH.unlink()
+        except FileNotFoundError:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
 
+import logging
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from Codebase.Core.Tracing.log_config import configure_logging
 from Codebase.FileIO.create_task_file import create_task_file
 from Codebase.GUI.GUI.Bind.bind_submit_on_enter import bind_submit_on_enter
 from Codebase.GUI.GUI.Bind.bind_escape_to_close import bind_escape_to_close
 
+logger = logging.getLogger(__name__)
+
 
 def task_factory(name: str, description: str, group: str) -> dict:
     return {
@@ -56,7 +60,7 @@ def build_task_create_window(root: tk.Tk):
 
         t = task_factory(name, desc, grp)
         path = create_task_file(t)
-        print(f"Task file created at: {path}")
+        logger.info("Task file created at: %s", path)
 
         entry_task.delete(0, tk.END)
         entry_description.delete(0, tk.END)
@@ -81,6 +85,7 @@ def build_task_create_window(root: tk.Tk):
 
 
 def main():
+    configure_logging()
     root = tk.Tk()
     root.title("Create Task")
     root.resizable(False, False)
@@ -0,0 +1,47 @@
+"""
+What the streaming readers (read_dot, read_graphml, read_jsonl) yield.
+
+A reader produces ImportedNode / ImportedEdge records in file order and
+keeps nothing but the current statement in memory. Nodes may be
+mentioned by edges before (or without) their own node record.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, TextIO
+
+# Node attributes that map onto task document fields, first match wins
+LABEL_ATTRS = ("label", "task", "name", "title")
+GROUP_ATTRS = ("group", "cluster")
+DESCRIPTION_ATTRS = ("description", "tooltip", "comment")
+TASK_ATTRS = frozenset(LABEL_ATTRS + GROUP_ATTRS + DESCRIPTION_ATTRS + ("status", "owner"))
+
+
+class ImportedNode(NamedTuple):
+    name: str
+    attrs: Dict[str, Any]
+
+
+class ImportedEdge(NamedTuple):
+    # source -> target: target depends on source
+    source: str
+    target: str
+
+
+def first_attr(attrs: Dict[str, Any], names) -> Any:
+    for name in names:
+        value = attrs.get(name)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def open_text(path: Path) -> TextIO:
+    """Open an import file for reading text; *.gz is decompressed on the fly."""
+    path = Path(path)
+    if path.suffix == ".gz":
+        return io.TextIOWrapper(gzip.open(path, "rb"), encoding="utf-8")
+    return path.open("r", encoding="utf-8")
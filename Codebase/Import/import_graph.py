@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Import plans from other tools (Graphviz DOT, GraphML, JSONL edge lists)
+as task files, or straight into an in-memory graph for viewing.
+
+    python -m Codebase.Import.import_graph plan.dot [--tasks DIR] [--group IMPT]
+                                           [--format dot|graphml|jsonl] [--workers 8]
+    python -m Codebase.GUI.dag_viewer --import plan.dot      (view only)
+
+Every source node becomes a task <GROUP><n>.json: the group comes from
+its "group" attribute (or DOT cluster / GraphML parent node), else
+--group, and numbers continue after the tasks already in the folder.
+Its label, description, status and owner are taken from the usual
+attribute names (see graph_events.py). An edge a -> b adds a's key to
+b's depends_on. Existing files are never overwritten.
+
+Memory: a task document needs all of its dependencies, and those can be
+spread over the whole input. Rather than collecting the graph, the first
+pass streams the file and spills node and edge records into PARTITIONS
+temporary files by target task; the second pass turns one partition at
+a time into documents, written by a thread pool. What stays in memory is
+the node name -> key table and a single partition, so a file with
+millions of edges imports in a few hundred MB at most.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import re
+import sys
+import tempfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from Codebase.Core.Tracing.tracer import traced
+from Codebase.FileIO.task_document import render_task_document
+from Codebase.Import.graph_events import (
+    DESCRIPTION_ATTRS,
+    GROUP_ATTRS,
+    LABEL_ATTRS,
+    ImportedEdge,
+    ImportedNode,
+    first_attr,
+)
+from Codebase.Import.read_dot import read_dot
+from Codebase.Import.read_graphml import read_graphml
+from Codebase.Import.read_jsonl import read_jsonl
+from Codebase.Object.task_status import normalize_status
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GROUP = "IMPT"
+PARTITIONS = 64
+# Task files created per thread pool job
+WRITE_BATCH = 256
+
+READERS: Dict[str, Callable[[Path], Iterator[Union[ImportedNode, ImportedEdge]]]] = {
+    "dot": read_dot,
+    "graphml": read_graphml,
+    "jsonl": read_jsonl,
+}
+_SUFFIX_FORMATS = {
+    ".dot": "dot",
+    ".gv": "dot",
+    ".graphml": "graphml",
+    ".xml": "graphml",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+_TASK_FILE = re.compile(r"^([A-Za-z]+)(\d+)\.json$")
+
+
+def detect_format(path: Path) -> str:
+    suffixes = [s.lower() for s in Path(path).suffixes if s.lower() != ".gz"]
+    fmt = _SUFFIX_FORMATS.get(suffixes[-1] if suffixes else "")
+    if fmt is None:
+        raise ValueError(f"Cannot tell the format of {path}; pass --format")
+    return fmt
+
+
+def read_graph(path: Path, fmt: Optional[str] = None) -> Iterator[Union[ImportedNode, ImportedEdge]]:
+    return READERS[fmt or detect_format(path)](Path(path))
+
+
+def group_name(value, default: str) -> str:
+    """Task group for an attribute value: its letters, upper-cased."""
+    letters = re.sub(r"[^A-Za-z]", "", str(value or "")).upper()
+    return letters or default
+
+
+def task_fields(name: str, attrs: Dict) -> Dict:
+    """Task document fields for a source node."""
+    fields = {}
+    label = first_attr(attrs, LABEL_ATTRS)
+    if label is not None:
+        fields["task"] = str(label)
+    description = first_attr(attrs, DESCRIPTION_ATTRS)
+    if description is not None:
+        fields["description"] = str(description)
+    if attrs.get("status") not in (None, ""):
+        fields["status"] = normalize_status(attrs["status"])
+    if attrs.get("owner") not in (None, ""):
+        fields["owner"] = str(attrs["owner"])
+    return fields
+
+
+class KeyAllocator:
+    """
+    Source node name -> task key. A node's group is fixed when it is first
+    seen (node records normally come before the edges that use them).
+    """
+
+    def __init__(self, default_group: str = DEFAULT_GROUP, tasks_dir: Optional[Path] = None):
+        self.default_group = group_name(default_group, DEFAULT_GROUP)
+        self.keys: Dict[str, str] = {}
+        self.next_id: Dict[str, int] = {}
+        if tasks_dir is not None and tasks_dir.is_dir():
+            with os.scandir(tasks_dir) as entries:
+                for entry in entries:
+                    m = _TASK_FILE.match(entry.name)
+                    if m:
+                        group = m.group(1).upper()
+                        self.next_id[group] = max(self.next_id.get(group, 1), int(m.group(2)) + 1)
+
+    def key_for(self, name: str, attrs: Optional[Dict] = None) -> Tuple[str, bool]:
+        """(key, whether it was just allocated)."""
+        key = self.keys.get(name)
+        if key is not None:
+            return key, False
+        group = group_name(first_attr(attrs or {}, GROUP_ATTRS), self.default_group)
+        number = self.next_id.get(group, 1)
+        self.next_id[group] = number + 1
+        key = self.keys[name] = f"{group}{number}"
+        return key, True
+
+
+def split_key(key: str) -> Tuple[str, int]:
+    m = re.match(r"^([A-Z]+)(\d+)$", key)
+    return m.group(1), int(m.group(2))
+
+
+@dataclass
+class ImportStats:
+    nodes: int = 0
+    edges: int = 0
+    written: int = 0
+    skipped: int = 0
+
+
+def _partition(key: str) -> int:
+    return zlib.crc32(key.encode("utf-8")) % PARTITIONS
+
+
+def _write_new(tasks_dir: Path, docs: List[Tuple[str, Dict]]) -> int:
+    """Create the task files of one batch; returns how many were written."""
+    written = 0
+    for key, data in docs:
+        path = tasks_dir / f"{key}.json"
+        try:
+            with path.open("x", encoding="utf-8") as f:
+                f.write(render_task_document(data))
+            written += 1
+        except FileExistsError:
+            logger.warning("Not overwriting existing task file %s", path)
+    return written
+
+
+@traced()
+def import_graph(
+    events: Iterable[Union[ImportedNode, ImportedEdge]],
+    tasks_dir: Path,
+    default_group: str = DEFAULT_GROUP,
+    workers: int = 8,
+) -> ImportStats:
+    """Write task files for ``events`` into tasks_dir (see module docstring)."""
+    tasks_dir = Path(tasks_dir)
+    tasks_dir.mkdir(parents=True, exist_ok=True)
+    keys = KeyAllocator(default_group, tasks_dir)
+    stats = ImportStats()
+
+    with tempfile.TemporaryDirectory(prefix="dag-import-") as spill_dir:
+        spills = [
+            open(Path(spill_dir) / f"{i}.jsonl", "w", encoding="utf-8") for i in range(PARTITIONS)
+        ]
+        try:
+            # Pass 1: node records and edges, by target task. Lines are
+            # "n<TAB>key<TAB>fields JSON" and "e<TAB>key<TAB>parent key".
+            def node(name: str, attrs: Optional[Dict] = None) -> str:
+                key, new = keys.key_for(name, attrs)
+                fields = task_fields(name, attrs) if attrs else {}
+                if new:
+                    stats.nodes += 1
+                    fields.setdefault("task", name)
+                if new or fields:
+                    spills[_partition(key)].write(f"n\t{key}\t{json.dumps(fields)}\n")
+                return key
+
+            for event in events:
+                if isinstance(event, ImportedNode):
+                    node(event.name, event.attrs)
+                elif event.source != event.target:
+                    parent = node(event.source)
+                    child = node(event.target)
+                    spills[_partition(child)].write(f"e\t{child}\t{parent}\n")
+                    stats.edges += 1
+        finally:
+            for f in spills:
+                f.close()
+
+        # Pass 2: one partition at a time -> documents -> parallel writes
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for i in range(PARTITIONS):
+                docs: Dict[str, Dict] = {}
+                with open(Path(spill_dir) / f"{i}.jsonl", encoding="utf-8") as f:
+                    for line in f:
+                        kind, key, value = line.rstrip("\n").split("\t", 2)
+                        doc = docs.get(key)
+                        if doc is None:
+                            group, number = split_key(key)
+                            doc = docs[key] = {
+                                "task": key, "description": "", "id": number, "group": group,
+                                "owner": "", "status": "todo", "rev": 1,
+                                "depends_on": {}, "updates": [],
+                            }
+                        if kind == "n":
+                            doc.update(json.loads(value))
+                        else:
+                            doc["depends_on"][value] = None
+                for doc in docs.values():
+                    doc["depends_on"] = list(doc["depends_on"])
+                items = list(docs.items())
+                batches = [items[j:j + WRITE_BATCH] for j in range(0, len(items), WRITE_BATCH)]
+                written = sum(pool.map(lambda batch: _write_new(tasks_dir, batch), batches))
+                stats.written += written
+                stats.skipped += len(items) - written
+    return stats
+
+
+@traced()
+def load_imported_graph(
+    path: Path, fmt: Optional[str] = None, default_group: str = DEFAULT_GROUP
+) -> Dict[str, "TaskNode"]:
+    """
+    Resolved in-memory graph of an import file, like build_dag returns,
+    without writing task files (view-only). Nodes point at would-be task
+    files next to the import file.
+    """
+    from Codebase.GUI.Logic.dag_builder import compute_levels, resolve_dependencies
+    from Codebase.Object.task_node import TaskNode
+
+    path = Path(path)
+    keys = KeyAllocator(default_group)
+    nodes: Dict[str, TaskNode] = {}
+
+    def node(name: str, attrs: Optional[Dict] = None) -> TaskNode:
+        key, new = keys.key_for(name, attrs)
+        if new:
+            group, number = split_key(key)
+            nodes[key] = TaskNode(
+                key=key, label=name, file_path=path.parent / f"{key}.json",
+                depends_on_raw=[], group=group, id=number,
+            )
+        task = nodes[key]
+        if attrs:
+            fields = task_fields(name, attrs)
+            task.label = fields.get("task", task.label)
+            task.status = fields.get("status", task.status)
+        return task
+
+    for event in read_graph(path, fmt):
+        if isinstance(event, ImportedNode):
+            node(event.name, event.attrs)
+        elif event.source != event.target:
+            parent = node(event.source)
+            child = node(event.target)
+            if parent.key not in child.depends_on_raw:
+                child.depends_on_raw.append(parent.key)
+
+    resolve_dependencies(nodes)
+    compute_levels(nodes)
+    return nodes
+
+
+def main(argv: list[str] | None = None) -> int:
+    from Codebase.Core.Pathing.project_paths import ProjectPaths
+    from Codebase.Core.Tracing.log_config import configure_logging
+
+    parser = argparse.ArgumentParser(description="Import a DOT / GraphML / JSONL graph as task files.")
+    parser.add_argument("source", type=Path, help="Graph file (*.dot, *.gv, *.graphml, *.jsonl; optionally .gz)")
+    parser.add_argument("--tasks", type=Path, default=None, help="Tasks directory to write into (default: ProjectPaths.tasks)")
+    parser.add_argument("--format", choices=sorted(READERS), default=None, help="Override format detection")
+    parser.add_argument("--group", default=DEFAULT_GROUP, help=f"Group for nodes without one (default: {DEFAULT_GROUP})")
+    parser.add_argument("--workers", type=int, default=8, help="Parallel file writers")
+    args = parser.parse_args(argv)
+    configure_logging()
+
+    if not args.source.is_file():
+        print(f"[import_graph] File not found: {args.source}")
+        return 1
+    tasks_dir = args.tasks or ProjectPaths.tasks
+    try:
+        stats = import_graph(read_graph(args.source, args.format), tasks_dir, args.group, args.workers)
+    except ValueError as e:
+        print(f"[import_graph] {e}")
+        return 1
+    print(
+        f"[import_graph] Imported {stats.nodes} tasks and {stats.edges} edges into {tasks_dir}"
+        + (f" ({stats.skipped} existing files left alone)" if stats.skipped else "")
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
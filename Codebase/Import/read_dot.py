@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Streaming reader for Graphviz DOT files.
+
+The file is tokenised in fixed-size chunks and parsed one statement at a
+time, so memory does not grow with the file. Supported: graph / digraph
+(strict or not), node and edge statements (edge chains a -> b -> c,
+{a b} -> c), attribute lists, "node [...]" defaults (scoped to their
+subgraph), subgraphs, ports (dropped), quoted / HTML strings and all
+three comment styles.
+
+Nodes inside "subgraph cluster_<name>" get group <name> unless they set
+their own "group" attribute.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from sys import intern
+from typing import Dict, Generator, Iterator, List, Optional, TextIO, Tuple, Union
+
+from Codebase.Import.graph_events import TASK_ATTRS, ImportedEdge, ImportedNode, open_text
+
+CHUNK_SIZE = 1 << 16
+
+_KEYWORDS = {"strict", "graph", "digraph", "node", "edge", "subgraph"}
+
+# Whitespace / comments, then one token. The skip part is matched
+# atomically (lookahead + backreference) so a comment is never re-read
+# as tokens when what follows it does not match.
+_SKIP = r"(?:\s+|//[^\n]*|\#[^\n]*|/\*.*?\*/)*"
+_TOKEN_RE = re.compile(
+    r"(?=(" + _SKIP + r"))\1"
+    + r"""(?:
+    (?P<string>"(?:[^"\\]|\\.)*")
+    |(?P<edgeop>->|--)
+    |(?P<id>-?(?:\.[0-9]+|[0-9]+(?:\.[0-9]*)?)|[A-Za-z_\u0080-￿][A-Za-z0-9_\u0080-￿]*)
+    |(?P<punct>[{}\[\];,=:])
+    |(?P<html><)
+    )""",
+    re.S | re.X,
+)
+_TRAILING_RE = re.compile(_SKIP + r"\Z", re.S)
+
+# Escapes inside quoted strings: line continuation, quote, backslash, and
+# the label line breaks (\n centred, \l / \r justified); others are kept
+_ESCAPE_RE = re.compile(r"\\(.)", re.S)
+_ESCAPES = {"\n": "", '"': '"', "\\": "\\", "n": "\n", "l": "\n", "r": "\n"}
+
+# Token kinds
+ID, PUNCT, EDGEOP, END = "id", "punct", "edgeop", "end"
+
+Token = Tuple[str, str]
+Event = Union[ImportedNode, ImportedEdge]
+
+
+class DotSyntaxError(ValueError):
+    pass
+
+
+def _html_end(buf: str, start: int) -> int:
+    """Index just past the '>' closing the HTML string opened at start, or -1."""
+    depth = 0
+    for i in range(start, len(buf)):
+        c = buf[i]
+        if c == "<":
+            depth += 1
+        elif c == ">":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return -1
+
+
+def _unescape(text: str) -> str:
+    if "\\" not in text:
+        return text
+    return _ESCAPE_RE.sub(lambda m: _ESCAPES.get(m.group(1), m.group(0)), text)
+
+
+def tokenize(stream: TextIO) -> Iterator[Token]:
+    """
+    Tokens of a DOT document. Works on CHUNK_SIZE blocks; a token that
+    reaches the end of the buffer (it may continue in the next block) is
+    completed with the next block, so only that partial token is carried
+    over, even for single-line files.
+    """
+    buf = ""
+    eof = False
+    while not eof:
+        chunk = stream.read(CHUNK_SIZE)
+        eof = not chunk
+        buf += chunk
+        pos = 0
+        limit = len(buf)
+        match = _TOKEN_RE.match
+        while True:
+            m = match(buf, pos)
+            # A match touching the end may continue in the next block; no
+            # match may be an unterminated string / comment
+            if m is None or (m.end() == limit and not eof):
+                if eof and not _TRAILING_RE.match(buf, pos):
+                    raise DotSyntaxError(f"Cannot parse DOT near {buf[pos:pos + 40].strip()!r}")
+                break
+            kind = m.lastgroup
+            if kind == "id":
+                yield ID, m.group(kind)
+            elif kind == "punct":
+                yield PUNCT, m.group(kind)
+            elif kind == "edgeop":
+                yield EDGEOP, m.group(kind)
+            elif kind == "string":
+                yield ID, _unescape(m.group(kind)[1:-1])
+            else:
+                start = m.start(kind)
+                end = _html_end(buf, start)
+                if end < 0:
+                    if eof:
+                        raise DotSyntaxError("Unterminated HTML string")
+                    pos = start
+                    break
+                yield ID, buf[start + 1:end - 1]
+                pos = end
+                continue
+            pos = m.end()
+        buf = buf[pos:]
+    yield END, ""
+
+
+class _Parser:
+    def __init__(self, tokens: Iterator[Token]):
+        self.tokens = tokens
+        self.look: Token = next(tokens)
+        # Stack of (node default attrs, cluster group) per open subgraph
+        self.scopes: List[Tuple[Dict[str, str], Optional[str]]] = [({}, None)]
+        # Node ids mentioned inside the open subgraphs, in order; a
+        # subgraph's members are the tail from where it started. Interned
+        # references only, cleared after each top-level statement.
+        self.mentions: List[str] = []
+
+    # ---- token helpers ----
+
+    def take(self) -> Token:
+        tok, self.look = self.look, next(self.tokens)
+        return tok
+
+    def accept(self, value: str) -> bool:
+        if self.look[0] in (PUNCT, EDGEOP) and self.look[1] == value:
+            self.take()
+            return True
+        return False
+
+    def expect(self, value: str) -> None:
+        if not self.accept(value):
+            raise DotSyntaxError(f"Expected {value!r}, got {self.look[1]!r}")
+
+    def keyword(self) -> Optional[str]:
+        if self.look[0] == ID and self.look[1].lower() in _KEYWORDS:
+            return self.look[1].lower()
+        return None
+
+    def ident(self) -> str:
+        kind, value = self.take()
+        if kind != ID:
+            raise DotSyntaxError(f"Expected an identifier, got {value!r}")
+        return value
+
+    # ---- grammar ----
+
+    def graph(self) -> Iterator[Event]:
+        if self.keyword() == "strict":
+            self.take()
+        if self.keyword() not in ("graph", "digraph"):
+            raise DotSyntaxError("Expected 'graph' or 'digraph'")
+        self.take()
+        if self.look[0] == ID:
+            self.take()
+        self.expect("{")
+        yield from self.stmt_list()
+        self.expect("}")
+
+    def stmt_list(self) -> Iterator[Event]:
+        while not (self.look[0] == PUNCT and self.look[1] == "}") and self.look[0] != END:
+            yield from self.stmt()
+            self.accept(";")
+            if len(self.scopes) == 1:
+                self.mentions.clear()
+
+    def attr_list(self) -> Dict[str, str]:
+        attrs: Dict[str, str] = {}
+        while self.accept("["):
+            while not self.accept("]"):
+                name = self.ident()
+                value = "true"
+                if self.accept("="):
+                    value = self.ident()
+                attrs[name] = value
+                self.accept(",") or self.accept(";")
+        return attrs
+
+    def node_id(self) -> str:
+        name = self.ident()
+        if self.accept(":"):  # port (and maybe compass point)
+            self.ident()
+            if self.accept(":"):
+                self.ident()
+        return name
+
+    def node_attrs(self, attrs: Dict[str, str]) -> Dict[str, str]:
+        defaults, group = self.scopes[-1]
+        out = dict(defaults)
+        if group is not None:
+            out.setdefault("group", group)
+        out.update(attrs)
+        return out
+
+    def subgraph(self) -> Generator[Event, None, int]:
+        """
+        Parse a subgraph, yielding its events as they come; returns where
+        its members start in self.mentions.
+        """
+        name = None
+        if self.keyword() == "subgraph":
+            self.take()
+            if self.look[0] == ID:
+                name = self.take()[1]
+        defaults, group = self.scopes[-1]
+        if name and name.startswith("cluster"):
+            group = name[len("cluster"):].lstrip("_") or group
+        start = len(self.mentions)
+        self.scopes.append((dict(defaults), group))
+        self.expect("{")
+        yield from self.stmt_list()
+        self.expect("}")
+        self.scopes.pop()
+        return start
+
+    def operand(self) -> Generator[Event, None, Tuple[object, bool]]:
+        """
+        One edge operand: (node name, True) for a bare node id, else
+        (start of the subgraph's members in self.mentions, False).
+        """
+        if self.keyword() == "subgraph" or (self.look[0] == PUNCT and self.look[1] == "{"):
+            start = yield from self.subgraph()
+            return start, False
+        name = self.node_id()
+        if len(self.scopes) > 1:
+            self.mentions.append(intern(name))
+        return name, True
+
+    def members(self, operand: Tuple[object, bool]) -> List[str]:
+        ref, bare = operand
+        return [ref] if bare else list(dict.fromkeys(self.mentions[ref:]))
+
+    def stmt(self) -> Iterator[Event]:
+        kw = self.keyword()
+        if kw in ("graph", "node", "edge"):
+            self.take()
+            attrs = self.attr_list()
+            if kw == "node":
+                self.scopes[-1][0].update(attrs)
+            return
+
+        first = yield from self.operand()
+        name, bare = first
+        if bare and self.accept("="):
+            self.ident()  # "name = value" graph attribute
+            return
+        if self.look[0] != EDGEOP:
+            attrs = self.attr_list()
+            if bare:
+                yield ImportedNode(name, self.node_attrs(attrs))
+            return
+
+        # Members are only collected for subgraphs used as edge operands
+        chain = [(self.members(first), bare)]
+        while self.look[0] == EDGEOP:
+            self.take()
+            operand = yield from self.operand()
+            chain.append((self.members(operand), operand[1]))
+        self.attr_list()
+
+        # Nodes first mentioned by an edge still pick up defaults / cluster
+        defaults, group = self.scopes[-1]
+        if group is not None or not TASK_ATTRS.isdisjoint(defaults):
+            for names, is_bare in chain:
+                if is_bare:
+                    yield ImportedNode(names[0], self.node_attrs({}))
+        for (sources, _), (targets, _) in zip(chain, chain[1:]):
+            for source in sources:
+                for target in targets:
+                    yield ImportedEdge(source, target)
+
+
+def read_dot(path: Path) -> Iterator[Event]:
+    """Stream the nodes and edges of a DOT file (see module docstring)."""
+    with open_text(path) as stream:
+        yield from _Parser(tokenize(stream)).graph()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Streaming reader for GraphML (yEd, Gephi, networkx, ...).
+
+Uses ElementTree.iterparse and drops every <node> / <edge> element once
+it has been turned into an event, so memory stays flat however large
+the file is. <data> values are reported under their key's attr.name
+(or the key id when it has none); nested graphs inside a node put their
+nodes in a group named after that node.
+"""
+
+from __future__ import annotations
+
+import gzip
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, Iterator, List, Union
+
+from Codebase.Import.graph_events import ImportedEdge, ImportedNode
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def read_graphml(path: Path) -> Iterator[Union[ImportedNode, ImportedEdge]]:
+    """Stream the nodes and edges of a GraphML file (*.gz is fine too)."""
+    path = Path(path)
+    source = gzip.open(path, "rb") if path.suffix == ".gz" else path.open("rb")
+    # key id -> attribute name
+    key_names: Dict[str, str] = {}
+    # node ids whose <graph> we are inside (hierarchical GraphML)
+    parents: List[str] = []
+    stack: List[ET.Element] = []
+
+    with source:
+        for event, elem in ET.iterparse(source, events=("start", "end")):
+            tag = _local(elem.tag)
+            if event == "start":
+                if tag == "graph" and stack and _local(stack[-1].tag) == "node":
+                    parents.append(stack[-1].get("id", ""))
+                stack.append(elem)
+                continue
+
+            stack.pop()
+            if tag == "key":
+                key_names[elem.get("id", "")] = elem.get("attr.name") or elem.get("id", "")
+            elif tag == "node":
+                # Nested graph inside this node ends with it
+                if parents and parents[-1] == elem.get("id"):
+                    parents.pop()
+                attrs = {
+                    key_names.get(d.get("key", ""), d.get("key", "")): (d.text or "").strip()
+                    for d in elem if _local(d.tag) == "data"
+                }
+                if parents:
+                    attrs.setdefault("group", parents[-1])
+                yield ImportedNode(elem.get("id", ""), attrs)
+                elem.clear()
+            elif tag == "edge":
+                yield ImportedEdge(elem.get("source", ""), elem.get("target", ""))
+                elem.clear()
+            else:
+                continue
+            # Drop the finished element from its parent too
+            if stack:
+                stack[-1].remove(elem)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Streaming reader for JSON Lines graph dumps, one record per line:
+
+    {"source": "a", "target": "b"}                  edge a -> b (b depends on a)
+    {"from": "a", "to": "b"}                        same
+    ["a", "b"]                                      same
+    {"key": "b", "label": "...", "group": "...",    node; "id" or "name" work
+     "depends_on": ["a"]}                           as "key", depends_on adds edges
+
+Blank lines and lines starting with "#" are skipped.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Iterator, Union
+
+from Codebase.Import.graph_events import ImportedEdge, ImportedNode, open_text
+
+logger = logging.getLogger(__name__)
+
+
+def read_jsonl(path: Path) -> Iterator[Union[ImportedNode, ImportedEdge]]:
+    """Stream the nodes and edges of a JSONL file (*.gz is fine too)."""
+    with open_text(path) as stream:
+        for line_no, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"{path}:{line_no}: {e}") from None
+
+            if isinstance(record, list) and len(record) == 2:
+                yield ImportedEdge(str(record[0]), str(record[1]))
+                continue
+            if not isinstance(record, dict):
+                logger.warning("%s:%d: skipping %s record", path, line_no, type(record).__name__)
+                continue
+
+            source = record.get("source", record.get("from"))
+            target = record.get("target", record.get("to"))
+            if source is not None and target is not None:
+                yield ImportedEdge(str(source), str(target))
+                continue
+
+            name = record.get("key", record.get("id", record.get("name")))
+            if name is None:
+                logger.warning("%s:%d: record has no id/key/name or source/target", path, line_no)
+                continue
+            name = str(name)
+            depends_on = record.pop("depends_on", None) or []
+            yield ImportedNode(name, {k: v for k, v in record.items() if k not in ("id", "key")})
+            for dep in depends_on:
+                yield ImportedEdge(str(dep), name)
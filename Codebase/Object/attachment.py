@@ -6,21 +6,29 @@ Defines the Attachment data structure.
 """
 
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 @dataclass
 class Attachment:
     """
     A single text attachment associated with an update.
+
+    Once stored (see FileIO/blob_store.py) ``blob`` holds the content
+    reference and ``content`` is only read back on demand.
     """
     name: str
     content: str
     type: str = "text/plain"  # keep a type field for future flexibility
+    blob: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        data: Dict[str, Any] = {
             "name": self.name,
             "type": self.type,
-            "content": self.content,
         }
+        if self.blob:
+            data["blob"] = self.blob
+        else:
+            data["content"] = self.content
+        return data
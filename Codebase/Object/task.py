@@ -7,18 +7,14 @@ Defines the Task data structure and a convenience factory.
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
-from datetime import datetime
 
+from .task_status import DEFAULT_STATUS
 from .update import Update
 
-
-def _now_str() -> str:
-    """
-    Returns a simple ISO-like timestamp string for logs.
-    """
-    return datetime.now().isoformat(timespec="seconds")
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -34,6 +30,7 @@ class Task:
       "id": 1,
       "group": "AAAA",
       "owner": "Steven",
+      "status": "todo",
       "depends_on": ["clean_data"],
       "updates": [ ... ]
     }
@@ -44,27 +41,28 @@ class Task:
 
     id: Optional[int] = None  # Can be set by your create_task logic or DAG system
     owner: str = "Steven"
+    status: str = DEFAULT_STATUS  # see task_status.py
     depends_on: List[str] = field(default_factory=list)
     updates: List[Update] = field(default_factory=list)
 
     def __post_init__(self) -> None:
         # Log creation of the Task
-        print(
-            f"[{_now_str()}] [Task] Created: "
-            f"task='{self.task}', group='{self.group}', owner='{self.owner}'"
+        logger.debug(
+            "Created: task=%r, group=%r, owner=%r", self.task, self.group, self.owner
         )
 
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert Task into a plain dict suitable for Jinja2 rendering or JSON dumping.
         """
-        print(f"[{_now_str()}] [Task] to_dict() called for task='{self.task}'")
+        logger.debug("to_dict() called for task=%r", self.task)
         return {
             "task": self.task,
             "description": self.description,
             "id": self.id,
             "group": self.group,
             "owner": self.owner,
+            "status": self.status,
             "depends_on": list(self.depends_on),
             "updates": [u.to_dict() for u in self.updates],
         }
@@ -85,9 +83,8 @@ def task(
 
     and get a Task object.
     """
-    print(
-        f"[{_now_str()}] [TaskFactory] Creating Task from factory: "
-        f"name='{name}', group='{group}', owner='{owner}'"
+    logger.debug(
+        "Creating Task from factory: name=%r, group=%r, owner=%r", name, group, owner
     )
     return Task(
         task=name,
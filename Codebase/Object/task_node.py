@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Codebase/Object/task_node.py
+
+The graph node shared by the loader, dag_builder, the canvas and the
+exporters.
+
+Nodes are slotted (no per-instance __dict__), repeated strings (group
+names, labels, dependency references) are interned so equal values share
+one object, and the file path is kept as an interned directory string
+(shared by every task in Tasks/) plus the file name only when it is not
+simply "<key>.json". Nodes loaded from a workspace (see
+GUI/IO/workspaces.py) have namespaced keys, "<workspace>:<stem>".
+Adjacency is by
+key: deps_resolved and children hold node keys, never node objects.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from sys import intern
+from typing import List, Optional
+
+from .task_status import DEFAULT_STATUS, normalize_status
+
+
+def _intern_all(values) -> List[str]:
+    return [intern(v) if isinstance(v, str) else v for v in values]
+
+
+class TaskNode:
+    """
+    In-memory representation of a task JSON file.
+
+    key:
+        Filename stem, e.g. "EEEE1" from "EEEE1.json"; "core:EEEE1" when
+        the node belongs to workspace "core".
+    label:
+        Display label, from the "task" field in the JSON.
+    file_path:
+        Full path to the JSON file on disk (returned as a Path).
+    depends_on_raw:
+        Dependency strings exactly as written in the JSON.
+    group / id:
+        "group" and "id" fields from the JSON, if present.
+    status:
+        Stored status (see task_status.py).
+    workspace:
+        Workspace name, or None outside a federated load.
+
+    Filled in by dag_builder:
+
+    deps_resolved:
+        Keys this node depends on.
+    children:
+        Keys of nodes depending on this one (this -> child).
+    level:
+        Layout layer.
+    """
+
+    __slots__ = (
+        "key",
+        "label",
+        "_dir",
+        "_name",
+        "depends_on_raw",
+        "group",
+        "id",
+        "status",
+        "workspace",
+        "deps_resolved",
+        "children",
+        "level",
+    )
+
+    def __init__(
+        self,
+        key: str,
+        label: str,
+        file_path: Path | str,
+        depends_on_raw: Optional[List[str]] = None,
+        group: Optional[str] = None,
+        id: Optional[int] = None,
+        status: str = DEFAULT_STATUS,
+        workspace: Optional[str] = None,
+        deps_resolved: Optional[List[str]] = None,
+        children: Optional[List[str]] = None,
+        level: int = 0,
+    ):
+        self.key = intern(key)
+        self.workspace = intern(workspace) if isinstance(workspace, str) else None
+        self.label = intern(label) if isinstance(label, str) else label
+        self.file_path = file_path
+        self.depends_on_raw = _intern_all(depends_on_raw or [])
+        self.group = intern(group) if isinstance(group, str) else group
+        self.id = id
+        self.status = intern(normalize_status(status))
+        self.deps_resolved = list(deps_resolved or [])
+        self.children = list(children or [])
+        self.level = level
+
+    @property
+    def local_key(self) -> str:
+        """key without the "<workspace>:" prefix (the filename stem)."""
+        if self.workspace is None:
+            return self.key
+        return self.key[len(self.workspace) + 1:]
+
+    @property
+    def directory(self) -> str:
+        """The tasks directory this node was loaded from."""
+        return self._dir
+
+    @property
+    def file_path(self) -> Path:
+        return Path(self._dir, self._name or f"{self.local_key}.json")
+
+    @file_path.setter
+    def file_path(self, value: Path | str) -> None:
+        path = Path(value)
+        self._dir = intern(str(path.parent))
+        self._name = None if path.name == f"{self.local_key}.json" else path.name
+
+    def __repr__(self) -> str:
+        return (
+            f"TaskNode(key={self.key!r}, label={self.label!r}, group={self.group!r}, "
+            f"id={self.id!r}, status={self.status!r}, workspace={self.workspace!r}, "
+            f"deps_resolved={self.deps_resolved!r}, "
+            f"children={self.children!r}, level={self.level!r})"
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, TaskNode):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None  # mutable, like the dataclasses it replaces
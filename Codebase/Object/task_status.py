@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Codebase/Object/task_status.py
+
+Stored task statuses (the "status" field of a task JSON).
+
+"ready" is not stored: it is derived by GUI/Logic/status_rollup.py for
+tasks that are not done and whose dependencies are all done.
+"""
+
+from __future__ import annotations
+
+TODO = "todo"
+IN_PROGRESS = "in_progress"
+DONE = "done"
+BLOCKED = "blocked"
+
+STATUSES = (TODO, IN_PROGRESS, DONE, BLOCKED)
+DEFAULT_STATUS = TODO
+
+
+def normalize_status(value) -> str:
+    """Known status for any JSON value; unknown/missing -> DEFAULT_STATUS."""
+    if isinstance(value, str):
+        value = value.strip().lower().replace(" ", "_").replace("-", "_")
+        if value in STATUSES:
+            return value
+    return DEFAULT_STATUS
+
+
+def next_status(status: str) -> str:
+    """Cycle order used by the viewer: todo -> in_progress -> done -> blocked -> todo."""
+    return STATUSES[(STATUSES.index(normalize_status(status)) + 1) % len(STATUSES)]
@@ -7,18 +7,14 @@ Defines the Update data structure.
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
 from .attachment import Attachment
 
-
-def _now_str() -> str:
-    """
-    Returns a simple ISO-like timestamp string for logs.
-    """
-    return datetime.now().isoformat(timespec="seconds")
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -34,10 +30,9 @@ class Update:
 
     def __post_init__(self) -> None:
         # Log creation of the Update
-        print(
-            f"[{_now_str()}] [Update] Created: "
-            f"author='{self.author}', timestamp='{self.timestamp}', "
-            f"note_preview='{self.note[:40]}{'...' if len(self.note) > 40 else ''}'"
+        logger.debug(
+            "Created: author=%r, timestamp=%r, note_preview=%r",
+            self.author, self.timestamp, self.note[:40],
         )
 
     @classmethod
@@ -51,10 +46,9 @@ class Update:
         Convenience constructor that auto-fills the timestamp with UTC now.
         """
         ts = datetime.utcnow().isoformat(timespec="seconds") + "Z"
-        print(
-            f"[{_now_str()}] [Update.new] Creating new Update: "
-            f"author='{author}', utc_timestamp='{ts}', "
-            f"note_preview='{note[:40]}{'...' if len(note) > 40 else ''}'"
+        logger.debug(
+            "Creating new Update: author=%r, utc_timestamp=%r, note_preview=%r",
+            author, ts, note[:40],
         )
         return cls(
             timestamp=ts,
@@ -64,9 +58,8 @@ class Update:
         )
 
     def to_dict(self) -> Dict[str, Any]:
-        print(
-            f"[{_now_str()}] [Update] to_dict() called for "
-            f"author='{self.author}', timestamp='{self.timestamp}'"
+        logger.debug(
+            "to_dict() called for author=%r, timestamp=%r", self.author, self.timestamp
         )
         return {
             "timestamp": self.timestamp,
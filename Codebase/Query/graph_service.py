@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Local HTTP/JSON service for the task graph, so dashboards stop re-parsing
+Tasks/ themselves.
+
+    python -m Codebase.Query.graph_service [--port 8765] [--interval 1.0]
+
+Endpoints (GET):
+
+    /graph              {"version", "tasks": [...], "unresolved": {...}}
+                        ETag = version; If-None-Match -> 304
+    /delta?since=V      {"version", "changed": [...], "removed": [...]}
+                        tasks that changed after version V; 410 if V is
+                        older than the kept history or from another run
+                        of the service (fetch /graph again)
+    /version            {"version"}
+
+Versions are opaque strings "<epoch>-<n>": a random epoch per service
+process and a counter, so a restarted service never reissues a version
+(or ETag) an earlier run handed out.
+
+Task objects look like the query CLI's (see task_graph.TaskGraph.record).
+Responses are gzip-compressed when the client accepts it.
+
+One refresher thread re-checks the task roots every --interval seconds
+(a directory scan; files are only re-read when a signature moved) and
+publishes a new immutable Snapshot together with the change history. Request threads only read
+that pair (a short lock around swapping / reading two references), so
+readers never wait on the refresh itself.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import logging
+import secrets
+import sys
+import threading
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from Codebase.Core.Pathing.project_paths import ProjectPaths
+from Codebase.Core.Tracing.log_config import configure_logging
+from Codebase.GUI.IO.workspaces import Workspace, load_workspace_config, select_workspaces
+from Codebase.Query.task_graph import TaskGraph, graph_signatures, load_task_graph
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8765
+DEFAULT_INTERVAL = 1.0
+
+# Versions kept for /delta; older clients get 410 and re-fetch /graph
+HISTORY = 256
+
+# Smaller bodies are sent uncompressed
+GZIP_MIN_BYTES = 1024
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    # Counter within this run; see GraphService.version_tag
+    version: int
+    records: Dict[str, dict]
+    body: bytes
+    body_gzip: bytes
+
+
+@dataclass(frozen=True)
+class Change:
+    version: int
+    changed: Tuple[str, ...]
+    removed: Tuple[str, ...]
+
+
+def _encode(obj) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+class GraphService:
+    """
+    Holds the latest Snapshot plus a short history of which keys changed
+    in each version. Both are replaced wholesale (never mutated) and
+    always together, under _lock, so a reader never pairs a snapshot with
+    another version's history.
+    """
+
+    def __init__(self, tasks_dir: Path | None = None, workspaces: List[Workspace] | None = None):
+        self.tasks_dir = tasks_dir
+        self.workspaces = workspaces
+        # Versions of other runs of the service carry another epoch
+        self.epoch = secrets.token_hex(4)
+        self._state: Tuple[Optional[Snapshot], Tuple[Change, ...]] = (None, ())
+        self._lock = threading.Lock()
+        self._signatures: Optional[list] = None
+        self._stop = threading.Event()
+
+    @property
+    def snapshot(self) -> Optional[Snapshot]:
+        return self.state()[0]
+
+    def state(self) -> Tuple[Optional[Snapshot], Tuple[Change, ...]]:
+        """The current (snapshot, history) pair."""
+        with self._lock:
+            return self._state
+
+    def version_tag(self, version: int) -> str:
+        """Public version / ETag for a counter of this run."""
+        return f"{self.epoch}-{version}"
+
+    def parse_version(self, tag: str) -> Optional[int]:
+        """Counter of a version tag, None if another run issued it.
+        Raises ValueError for something that is not a version tag."""
+        epoch, sep, counter = tag.rpartition("-")
+        if not sep or not epoch:
+            raise ValueError(tag)
+        version = int(counter)
+        return version if epoch == self.epoch else None
+
+    # ---- refresh (one thread) ----
+
+    def refresh(self) -> bool:
+        """Publish a new version if the task roots changed. True if so."""
+        signatures = graph_signatures(self.tasks_dir, self.workspaces)
+        if signatures == self._signatures:
+            return False
+        graph: TaskGraph = load_task_graph(
+            self.tasks_dir, self.workspaces, signatures=signatures
+        )
+        records = {graph.keys[i]: graph.record(i) for i in range(len(graph))}
+
+        old, history = self.state()
+        version = 1 if old is None else old.version + 1
+        if old is not None:
+            changed = tuple(k for k, rec in records.items() if old.records.get(k) != rec)
+            removed = tuple(k for k in old.records if k not in records)
+            if not changed and not removed:
+                self._signatures = signatures
+                return False
+            history = history[-(HISTORY - 1):] + (Change(version, changed, removed),)
+
+        tag = self.version_tag(version)
+        body = _encode({
+            "version": tag,
+            "tasks": list(records.values()),
+            "unresolved": graph.unresolved,
+        })
+        snapshot = Snapshot(version, records, body, gzip.compress(body, 6))
+        with self._lock:
+            self._state = (snapshot, history)
+        self._signatures = signatures
+        logger.info("Published graph version %s (%d tasks)", tag, len(records))
+        return True
+
+    def run_refresher(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.refresh()
+            except Exception:
+                snapshot = self.snapshot
+                logger.exception("Graph refresh failed; keeping version %s",
+                                 self.version_tag(snapshot.version) if snapshot else None)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    # ---- reads (any thread) ----
+
+    def delta(self, since_tag: str) -> Optional[dict]:
+        """
+        Changes after version tag `since_tag`, or None if it is from
+        another run or older than the history. Raises ValueError for a
+        malformed tag.
+        """
+        since = self.parse_version(since_tag)
+        snapshot, history = self.state()
+        if since is None or snapshot is None:
+            return None
+        tag = self.version_tag(snapshot.version)
+        if since == snapshot.version:
+            return {"version": tag, "changed": [], "removed": []}
+        if since > snapshot.version:
+            return None
+        needed = [c for c in history if c.version > since]
+        if not needed or needed[0].version != since + 1:
+            return None
+        # Keys are judged by the current snapshot: present -> changed
+        touched = set()
+        for change in needed:
+            touched.update(change.changed)
+            touched.update(change.removed)
+        records = snapshot.records
+        return {
+            "version": tag,
+            "changed": [records[k] for k in sorted(touched) if k in records],
+            "removed": sorted(k for k in touched if k not in records),
+        }
+
+
+class GraphRequestHandler(BaseHTTPRequestHandler):
+    service: GraphService  # set by make_server()
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, fmt, *args) -> None:
+        logger.debug("%s " + fmt, self.address_string(), *args)
+
+    def _accepts_gzip(self) -> bool:
+        return "gzip" in self.headers.get("Accept-Encoding", "")
+
+    def _send(
+        self,
+        status: int,
+        body: bytes,
+        body_gzip: Optional[bytes] = None,
+        etag: Optional[str] = None,
+    ) -> None:
+        if self._accepts_gzip() and len(body) >= GZIP_MIN_BYTES:
+            body = body_gzip if body_gzip is not None else gzip.compress(body, 6)
+            encoding = "gzip"
+        else:
+            encoding = None
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status: HTTPStatus, message: str) -> None:
+        self._send(status, _encode({"error": message}))
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        snapshot = self.service.snapshot
+        if snapshot is None:
+            self._error(HTTPStatus.SERVICE_UNAVAILABLE, "graph not loaded yet")
+            return
+
+        if url.path == "/graph":
+            # Weak: the same version is sent gzipped or not
+            etag = f'W/"{self.service.version_tag(snapshot.version)}"'
+            if etag in self.headers.get("If-None-Match", ""):
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self._send(HTTPStatus.OK, snapshot.body, snapshot.body_gzip, etag)
+
+        elif url.path == "/delta":
+            since = parse_qs(url.query).get("since", [""])[0]
+            try:
+                delta = self.service.delta(since)
+            except ValueError:
+                self._error(HTTPStatus.BAD_REQUEST, "since must be a version from /graph or /version")
+                return
+            if delta is None:
+                self._error(HTTPStatus.GONE, f"version {since} is too old; fetch /graph")
+                return
+            self._send(HTTPStatus.OK, _encode(delta))
+
+        elif url.path == "/version":
+            self._send(HTTPStatus.OK, _encode({"version": self.service.version_tag(snapshot.version)}))
+
+        else:
+            self._error(HTTPStatus.NOT_FOUND, "unknown endpoint (try /graph, /delta, /version)")
+
+
+def make_server(service: GraphService, host: str, port: int) -> ThreadingHTTPServer:
+    handler = type("Handler", (GraphRequestHandler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve the task graph as JSON over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: localhost only)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="Seconds between change checks")
+    parser.add_argument("--tasks", type=Path, default=None, help="Tasks directory (default: workspaces.json, else ProjectPaths.tasks)")
+    parser.add_argument("--workspace", action="append", default=[], help="Only this workspace (repeatable)")
+    args = parser.parse_args(argv)
+    configure_logging()
+
+    workspaces = None
+    tasks_dir = args.tasks
+    if tasks_dir is None:
+        try:
+            workspaces = select_workspaces(load_workspace_config(), args.workspace)
+        except ValueError as e:
+            print(f"[graph_service] {e}", file=sys.stderr)
+            return 2
+        if not workspaces:
+            tasks_dir = ProjectPaths.tasks
+    if tasks_dir is not None and not tasks_dir.is_dir():
+        print(f"[graph_service] Tasks directory not found at:\n  {tasks_dir}", file=sys.stderr)
+        return 2
+
+    service = GraphService(tasks_dir, workspaces)
+    service.refresh()
+    refresher = threading.Thread(
+        target=service.run_refresher, args=(args.interval,), name="graph-refresher", daemon=True
+    )
+    refresher.start()
+
+    server = make_server(service, args.host, args.port)
+    print(f"[graph_service] Serving on http://{args.host}:{server.server_port}/graph", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.stop()
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
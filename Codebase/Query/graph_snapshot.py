@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Snapshots of the resolved task graph, and a structural diff between them.
+
+    python -m Codebase.Query.graph_snapshot save [--label weekly]
+    python -m Codebase.Query.graph_snapshot list
+    python -m Codebase.Query.graph_snapshot diff OLD [NEW]
+
+OLD / NEW are snapshot files, labels, a unique prefix of a snapshot
+name, or "latest"; NEW defaults to the current task tree.
+
+File format (UserData/Snapshots/<UTC time, microseconds>[-n][-label].dagsnap):
+
+    b"DAGSNAP1"
+    u32 header length, header JSON (created, label, task / edge counts, seq of a "-n" name)
+    BUCKETS x u64   bucket hashes
+    BUCKETS+1 x u32 block offsets
+    BUCKETS blocks  zlib-compressed JSON list of node records
+
+Every task is one record [key, label, group, id, status, [dep keys]]
+and falls in bucket hash(key) % BUCKETS. Its content hash covers the
+whole record (so its incoming edges too); a bucket's hash is the XOR of
+its tasks' hashes. Diffing two snapshots compares the bucket tables and
+only decompresses buckets whose hash differs, so the work grows with
+the size of the change, not of the graph. Against the live tree the
+current hashes have to be computed once (one pass over the nodes).
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Sequence, Tuple
+
+from Codebase.Core.Pathing.project_paths import ProjectPaths
+from Codebase.Core.Tracing.tracer import traced
+
+if TYPE_CHECKING:
+    from Codebase.Object.task_node import TaskNode
+    from Codebase.Query.task_graph import TaskGraph
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = ProjectPaths.userdata / "Snapshots"
+SUFFIX = ".dagsnap"
+MAGIC = b"DAGSNAP1"
+BUCKETS = 1024
+
+# [key, label, group, id, status, [dep keys]]
+Record = list
+
+_FIELDS = ("label", "group", "id", "status", "depends_on")
+
+
+def _key_bucket(key: str) -> int:
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=4).digest()
+    return int.from_bytes(digest, "big") % BUCKETS
+
+
+def record_hash(record: Record) -> int:
+    key, label, group, task_id, status, deps = record
+    payload = "\x1f".join((key, label, str(group), str(task_id), status, "\x1e".join(deps)))
+    return int.from_bytes(hashlib.blake2b(payload.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def records_from_nodes(nodes: Dict[str, "TaskNode"]) -> Iterable[Record]:
+    """Snapshot records for a resolved node dict (build_dag / the canvas)."""
+    for key, node in nodes.items():
+        yield [key, node.label, node.group, node.id, node.status, sorted(node.deps_resolved)]
+
+
+def records_from_graph(graph: "TaskGraph") -> Iterable[Record]:
+    """Snapshot records for a Query TaskGraph."""
+    keys = graph.keys
+    for key, label, group, task_id, status, parents in zip(
+        keys, graph.labels, graph.groups, graph.ids, graph.statuses, graph.parents
+    ):
+        yield [key, label, group, task_id, status, sorted([keys[p] for p in parents])]
+
+
+class GraphState:
+    """Bucketed records + hashes, in memory (the live tree, or a new snapshot)."""
+
+    def __init__(self, records: Iterable[Record]):
+        self.hashes = [0] * BUCKETS
+        self.buckets: List[List[Record]] = [[] for _ in range(BUCKETS)]
+        self.tasks = 0
+        self.edges = 0
+        for record in records:
+            b = _key_bucket(record[0])
+            self.buckets[b].append(record)
+            self.hashes[b] ^= record_hash(record)
+            self.tasks += 1
+            self.edges += len(record[5])
+
+    def bucket(self, i: int) -> List[Record]:
+        return self.buckets[i]
+
+
+class SnapshotFile:
+    """A saved snapshot; bucket blocks are only read and inflated on demand."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{self.path} is not a graph snapshot")
+            (header_len,) = struct.unpack("<I", f.read(4))
+            self.header = json.loads(f.read(header_len))
+            self.hashes = list(struct.unpack(f"<{BUCKETS}Q", f.read(8 * BUCKETS)))
+            self._offsets = struct.unpack(f"<{BUCKETS + 1}I", f.read(4 * (BUCKETS + 1)))
+            self._data_start = f.tell()
+
+    @property
+    def name(self) -> str:
+        return self.path.name[: -len(SUFFIX)]
+
+    def bucket(self, i: int) -> List[Record]:
+        start, end = self._offsets[i], self._offsets[i + 1]
+        if start == end:
+            return []
+        with self.path.open("rb") as f:
+            f.seek(self._data_start + start)
+            return json.loads(zlib.decompress(f.read(end - start)))
+
+
+@traced()
+def save_snapshot(
+    records: Iterable[Record], label: str = "", directory: Path | None = None
+) -> Path:
+    """Write a snapshot of these records; returns its path."""
+    state = GraphState(records)
+    directory = directory or SNAPSHOT_DIR
+    directory.mkdir(parents=True, exist_ok=True)
+    created = time.time()
+    stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime(created)) + f".{int(created % 1 * 1e6):06d}Z"
+    suffix = ""
+    if label:
+        suffix = "-" + "".join(c if c.isalnum() or c in "-_" else "_" for c in label)
+
+    blocks = []
+    offsets = [0]
+    for records_in_bucket in state.buckets:
+        block = b""
+        if records_in_bucket:
+            payload = json.dumps(records_in_bucket, separators=(",", ":"), ensure_ascii=False)
+            block = zlib.compress(payload.encode("utf-8"), 6)
+        blocks.append(block)
+        offsets.append(offsets[-1] + len(block))
+
+    def encode(seq: int) -> bytes:
+        header = {
+            "created": created,
+            "label": label,
+            "tasks": state.tasks,
+            "edges": state.edges,
+        }
+        if seq > 1:
+            header["seq"] = seq
+        header_bytes = json.dumps(header).encode("utf-8")
+        return b"".join([
+            MAGIC,
+            struct.pack("<I", len(header_bytes)),
+            header_bytes,
+            struct.pack(f"<{BUCKETS}Q", *state.hashes),
+            struct.pack(f"<{BUCKETS + 1}I", *offsets),
+            *blocks,
+        ])
+
+    # Written to a temp file, then published under its final name with
+    # os.link, which fails if the name is taken: readers never see a
+    # partial snapshot, and a save in the same microsecond gets "-2", "-3"...
+    fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=f".{stamp}.", suffix=".tmp")
+    tmp = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(encode(1))
+        for n in range(1, 1000):
+            if n > 1:
+                tmp.write_bytes(encode(n))
+            path = directory / f"{stamp}{f'-{n}' if n > 1 else ''}{suffix}{SUFFIX}"
+            try:
+                os.link(tmp, path)
+                return path
+            except FileExistsError:
+                continue
+    finally:
+        tmp.unlink(missing_ok=True)
+    raise FileExistsError(f"Could not find a free snapshot name for {stamp}{suffix}")
+
+
+def list_snapshots(directory: Path | None = None) -> List[SnapshotFile]:
+    """Saved snapshots, oldest first (by creation time, then save order)."""
+    directory = directory or SNAPSHOT_DIR
+    if not directory.is_dir():
+        return []
+    snapshots = []
+    for path in directory.glob(f"*{SUFFIX}"):
+        try:
+            snapshots.append(SnapshotFile(path))
+        except (ValueError, struct.error) as e:
+            logger.debug("Skipping unreadable snapshot %s: %s", path, e)
+    # Not by name: "<stamp>-2" sorts before "<stamp>.dagsnap"
+    snapshots.sort(key=lambda s: (s.header.get("created", 0), s.header.get("seq", 1), s.name))
+    return snapshots
+
+
+def find_snapshot(ref: str, directory: Path | None = None) -> SnapshotFile:
+    """
+    A snapshot by path, "latest", unique name prefix, or label (the
+    newest snapshot saved with that label).
+    """
+    path = Path(ref)
+    if path.suffix == SUFFIX and path.is_file():
+        return SnapshotFile(path)
+    snapshots = list_snapshots(directory)
+    if ref == "latest":
+        if not snapshots:
+            raise LookupError("No snapshots saved yet")
+        return snapshots[-1]
+    labelled = [s for s in snapshots if s.header.get("label") == ref]
+    if labelled:
+        return labelled[-1]
+    matches = [s for s in snapshots if s.name.startswith(ref)]
+    if len(matches) != 1:
+        raise LookupError(f"{len(matches)} snapshots match {ref!r}")
+    return matches[0]
+
+
+@dataclass
+class GraphDiff:
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    # key -> names of the fields that changed
+    modified: Dict[str, List[str]] = field(default_factory=dict)
+    edges_added: List[Tuple[str, str]] = field(default_factory=list)
+    edges_removed: List[Tuple[str, str]] = field(default_factory=list)
+    buckets_compared: int = 0
+
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.modified)
+
+    def to_dict(self) -> dict:
+        return {
+            "added": self.added,
+            "removed": self.removed,
+            "modified": self.modified,
+            "edges_added": [list(e) for e in self.edges_added],
+            "edges_removed": [list(e) for e in self.edges_removed],
+        }
+
+
+@traced()
+def diff_graphs(old, new) -> GraphDiff:
+    """
+    Changes from `old` to `new` (SnapshotFile or GraphState). Only buckets
+    whose hashes differ are opened.
+    """
+    diff = GraphDiff()
+    for b in range(BUCKETS):
+        if old.hashes[b] == new.hashes[b]:
+            continue
+        diff.buckets_compared += 1
+        before = {r[0]: r for r in old.bucket(b)}
+        after = {r[0]: r for r in new.bucket(b)}
+        for key, rec in after.items():
+            prev = before.get(key)
+            if prev is None:
+                diff.added.append(key)
+                diff.edges_added.extend((dep, key) for dep in rec[5])
+            elif prev != rec:
+                diff.modified[key] = [
+                    name for name, a, c in zip(_FIELDS, prev[1:], rec[1:]) if a != c
+                ]
+                old_deps, new_deps = set(prev[5]), set(rec[5])
+                diff.edges_added.extend((dep, key) for dep in sorted(new_deps - old_deps))
+                diff.edges_removed.extend((dep, key) for dep in sorted(old_deps - new_deps))
+        for key, rec in before.items():
+            if key not in after:
+                diff.removed.append(key)
+                diff.edges_removed.extend((dep, key) for dep in rec[5])
+    diff.added.sort()
+    diff.removed.sort()
+    return diff
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    from Codebase.Core.Tracing.log_config import configure_logging
+    from Codebase.GUI.IO.workspaces import load_workspace_config, select_workspaces
+    from Codebase.Query.task_graph import load_task_graph
+
+    parser = argparse.ArgumentParser(description="Save and diff task graph snapshots.")
+    parser.add_argument("--tasks", type=Path, default=None, help="Tasks directory (default: workspaces.json, else ProjectPaths.tasks)")
+    parser.add_argument("--workspace", action="append", default=[], help="Only this workspace (repeatable)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    save = sub.add_parser("save", help="Snapshot the current graph")
+    save.add_argument("--label", default="", help="Appended to the snapshot name")
+    sub.add_parser("list", help="List saved snapshots")
+    diff = sub.add_parser("diff", help="Changes between two snapshots (JSON)")
+    diff.add_argument("old")
+    diff.add_argument("new", nargs="?", default=None, help="Default: the current task tree")
+    args = parser.parse_args(argv)
+    configure_logging("ERROR")
+
+    def current() -> GraphState:
+        workspaces = None
+        tasks_dir = args.tasks
+        if tasks_dir is None:
+            workspaces = select_workspaces(load_workspace_config(), args.workspace)
+            if not workspaces:
+                tasks_dir = ProjectPaths.tasks
+        return GraphState(records_from_graph(load_task_graph(tasks_dir, workspaces)))
+
+    try:
+        if args.command == "save":
+            state = current()
+            path = save_snapshot(
+                (r for b in state.buckets for r in b), args.label
+            )
+            print(f"[graph_snapshot] Saved {state.tasks} tasks to {path}", file=sys.stderr)
+        elif args.command == "list":
+            for snap in list_snapshots():
+                h = snap.header
+                print(f"{snap.name}\t{h['tasks']} tasks\t{h['edges']} edges")
+        else:
+            old = find_snapshot(args.old)
+            new = find_snapshot(args.new) if args.new else current()
+            json.dump(diff_graphs(old, new).to_dict(), sys.stdout, indent=2)
+            sys.stdout.write("\n")
+    except (LookupError, ValueError) as e:
+        print(f"[graph_snapshot] {e}", file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
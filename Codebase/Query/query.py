@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Query the task DAG from scripts, shell prompts and git hooks (no Tk).
+
+Usage (from project root):
+
+    python -m Codebase.Query.query ready
+    python -m Codebase.Query.query ready --count --group AAAA
+    python -m Codebase.Query.query topo --format keys
+    python -m Codebase.Query.query ancestors AAAA12 --depth 2
+    python -m Codebase.Query.query descendants core:AAAA1 --format jsonl
+    python -m Codebase.Query.query unresolved        # exit 1 if any
+
+Tasks come from --tasks, else every workspace in UserData/workspaces.json
+(narrow with --workspace), else ProjectPaths.tasks. The resolved graph is
+cached on disk (see task_graph.py), so repeated runs on an unchanged tree
+only scan the directories.
+
+Output formats: json (one array, default), jsonl (one object per line),
+keys (one task key per line); --count prints just the number of results.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Iterable, List
+
+from Codebase.Core.Pathing.project_paths import ProjectPaths
+from Codebase.Core.Tracing.log_config import configure_logging
+from Codebase.GUI.IO.workspaces import load_workspace_config, select_workspaces
+from Codebase.Query.task_graph import TaskGraph, load_task_graph
+
+COMMANDS = ("ready", "topo", "list", "ancestors", "descendants", "unresolved")
+
+
+def _write(records: Iterable[dict], fmt: str, count: bool, out) -> int:
+    records = list(records)
+    if count:
+        out.write(f"{len(records)}\n")
+    elif fmt == "keys":
+        for record in records:
+            out.write(f"{record['key']}\n")
+    elif fmt == "jsonl":
+        for record in records:
+            out.write(json.dumps(record) + "\n")
+    else:
+        json.dump(records, out, indent=2)
+        out.write("\n")
+    return len(records)
+
+
+def _nodes(graph: TaskGraph, args) -> List[int]:
+    if args.command == "ready":
+        return graph.ready()
+    if args.command == "topo":
+        return graph.topological_order()
+    if args.command == "list":
+        return list(range(len(graph)))
+    start = graph.lookup(args.task)
+    if start is None:
+        raise KeyError(args.task)
+    if args.command == "ancestors":
+        return graph.ancestors(start, args.depth)
+    return graph.descendants(start, args.depth)
+
+
+def main(argv: list[str] | None = None) -> int:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--tasks", type=Path, default=None, help="Tasks directory (default: workspaces.json, else ProjectPaths.tasks)")
+    common.add_argument("--workspace", action="append", default=[], help="Only this workspace (repeatable)")
+    common.add_argument("--group", action="append", default=None, help="Only report tasks in this group (repeatable)")
+    common.add_argument("--format", choices=("json", "jsonl", "keys"), default="json")
+    common.add_argument("--count", action="store_true", help="Print the number of results only")
+    common.add_argument("--no-cache", action="store_true", help="Ignore and do not write the on-disk cache")
+    common.add_argument("-v", "--verbose", action="store_true", help="Log loader messages to stderr")
+
+    parser = argparse.ArgumentParser(description="Query the task DAG (JSON output).")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("ready", parents=[common], help="Tasks that can be started now")
+    sub.add_parser("topo", parents=[common], help="All tasks, dependencies first")
+    sub.add_parser("list", parents=[common], help="All tasks")
+    for name, text in (("ancestors", "Everything a task depends on"), ("descendants", "Everything depending on a task")):
+        p = sub.add_parser(name, parents=[common], help=text)
+        p.add_argument("task", help="Task key, group+id or label")
+        p.add_argument("--depth", type=int, default=None, help="Stop after this many edges")
+    sub.add_parser("unresolved", parents=[common], help="depends_on entries matching no task (exit 1 if any)")
+    args = parser.parse_args(argv)
+    configure_logging(logging.INFO if args.verbose else logging.ERROR)
+
+    workspaces = None
+    tasks_dir = args.tasks
+    if tasks_dir is None:
+        try:
+            workspaces = select_workspaces(load_workspace_config(), args.workspace)
+        except ValueError as e:
+            print(f"[query] {e}", file=sys.stderr)
+            return 2
+        if not workspaces:
+            tasks_dir = ProjectPaths.tasks
+    if tasks_dir is not None and not tasks_dir.is_dir():
+        print(f"[query] Tasks directory not found at:\n  {tasks_dir}", file=sys.stderr)
+        return 2
+
+    graph = load_task_graph(tasks_dir, workspaces, use_cache=not args.no_cache)
+
+    out = sys.stdout
+    try:
+        if args.command == "unresolved":
+            groups = set(args.group or ())
+            records = [
+                {"key": key, "dependency": dep}
+                for key, deps in graph.unresolved.items()
+                if not groups or graph.groups[graph.index[key]] in groups
+                for dep in deps
+            ]
+            return 1 if _write(records, args.format, args.count, out) else 0
+
+        try:
+            indices = _nodes(graph, args)
+        except KeyError:
+            print(f"[query] No task matches {args.task!r}", file=sys.stderr)
+            return 2
+        _write((graph.record(i) for i in graph.in_groups(indices, args.group)), args.format, args.count, out)
+    except BrokenPipeError:
+        # Reader (head, grep -q) went away; not an error for a query tool
+        sys.stderr.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Read-only, Tk-free view of the task DAG for scripts and the query CLI.
+
+TaskGraph stores the resolved graph column-wise (parallel lists indexed by
+node number, adjacency as lists of ints), which pickles and unpickles far
+faster than TaskNode objects. load_task_graph() keeps one such pickle per
+set of task roots under UserData/.task_cache and rebuilds it with
+dag_builder only when a root's signature (see GUI/IO/task_cache.py) moved,
+so repeated invocations cost a directory scan plus one small unpickle.
+
+Nothing here imports tkinter.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import logging
+import os
+import pickle
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from Codebase.Core.Tracing.tracer import traced
+from Codebase.GUI.IO.task_cache import CACHE_DIR, TaskCache, dir_signature
+from Codebase.GUI.IO.task_loader import load_task_nodes
+from Codebase.GUI.IO.workspaces import Workspace, load_workspaces
+from Codebase.GUI.Logic.dag_builder import compute_levels, resolve_dependencies
+from Codebase.Object.task_node import TaskNode
+from Codebase.Object.task_status import BLOCKED, DONE
+
+logger = logging.getLogger(__name__)
+
+GRAPH_VERSION = 1
+
+
+class TaskGraph:
+    """
+    keys[i], labels[i], ... describe node i; parents[i] / children[i] are
+    lists of node numbers. unresolved maps a key to the depends_on
+    entries that matched no task.
+    """
+
+    def __init__(self) -> None:
+        self.keys: List[str] = []
+        self.labels: List[str] = []
+        self.groups: List[Optional[str]] = []
+        self.ids: List[Optional[int]] = []
+        self.statuses: List[str] = []
+        self.levels: List[int] = []
+        self.files: List[str] = []
+        self.parents: List[List[int]] = []
+        self.children: List[List[int]] = []
+        self.unresolved: Dict[str, List[str]] = {}
+        self.index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @classmethod
+    def from_nodes(
+        cls, nodes: Dict[str, TaskNode], unresolved: Dict[str, List[str]] | None = None
+    ) -> "TaskGraph":
+        """Columnar copy of a resolved node dict (as returned by build_dag)."""
+        graph = cls()
+        graph.keys = list(nodes)
+        graph.index = {key: i for i, key in enumerate(graph.keys)}
+        for node in nodes.values():
+            graph.labels.append(node.label)
+            graph.groups.append(node.group)
+            graph.ids.append(node.id)
+            graph.statuses.append(node.status)
+            graph.levels.append(node.level)
+            graph.files.append(str(node.file_path))
+            graph.parents.append([graph.index[k] for k in node.deps_resolved])
+            graph.children.append([graph.index[k] for k in node.children])
+        graph.unresolved = dict(unresolved or {})
+        return graph
+
+    # ---- pickling: the index is cheap to rebuild, so it is not stored ----
+
+    def __getstate__(self) -> dict:
+        state = dict(self.__dict__)
+        del state["index"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.index = {key: i for i, key in enumerate(self.keys)}
+
+    # ---- lookups ----
+
+    def lookup(self, ref: str) -> Optional[int]:
+        """
+        Node number for a key ("AAAA1", "core:AAAA1"), a group+id or an
+        exact label, in that order, like dependency resolution.
+        """
+        i = self.index.get(ref)
+        if i is not None:
+            return i
+        for i, (group, node_id) in enumerate(zip(self.groups, self.ids)):
+            if group is not None and node_id is not None and f"{group}{node_id}" == ref:
+                return i
+        try:
+            return self.labels.index(ref)
+        except ValueError:
+            return None
+
+    def record(self, i: int) -> dict:
+        """JSON-ready description of node i."""
+        return {
+            "key": self.keys[i],
+            "label": self.labels[i],
+            "group": self.groups[i],
+            "id": self.ids[i],
+            "status": self.statuses[i],
+            "level": self.levels[i],
+            "depends_on": [self.keys[p] for p in self.parents[i]],
+            "file": self.files[i],
+        }
+
+    # ---- queries (all return node numbers) ----
+
+    def ready(self) -> List[int]:
+        """
+        The frontier: not done, not marked blocked, every dependency done
+        (same rule as GUI/Logic/status_rollup.py).
+        """
+        statuses = self.statuses
+        return [
+            i for i, status in enumerate(statuses)
+            if status != DONE and status != BLOCKED
+            and all(statuses[p] == DONE for p in self.parents[i])
+        ]
+
+    def topological_order(self) -> List[int]:
+        """
+        Kahn's algorithm, ties broken by key so the output is stable.
+        Nodes on a cycle are left out (and logged).
+        """
+        indegree = [len(p) for p in self.parents]
+        heap = [(self.keys[i], i) for i, d in enumerate(indegree) if d == 0]
+        heapq.heapify(heap)
+        order: List[int] = []
+        while heap:
+            _, i = heapq.heappop(heap)
+            order.append(i)
+            for child in self.children[i]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    heapq.heappush(heap, (self.keys[child], child))
+        if len(order) < len(self.keys):
+            logger.warning("%d tasks are on dependency cycles", len(self.keys) - len(order))
+        return order
+
+    def _walk(self, start: int, edges: List[List[int]], max_depth: Optional[int]) -> List[int]:
+        seen = {start}
+        out: List[int] = []
+        queue = deque([(start, 0)])
+        while queue:
+            i, depth = queue.popleft()
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for j in edges[i]:
+                if j not in seen:
+                    seen.add(j)
+                    out.append(j)
+                    queue.append((j, depth + 1))
+        return out
+
+    def ancestors(self, i: int, max_depth: Optional[int] = None) -> List[int]:
+        """Everything i depends on, nearest first."""
+        return self._walk(i, self.parents, max_depth)
+
+    def descendants(self, i: int, max_depth: Optional[int] = None) -> List[int]:
+        """Everything depending on i, nearest first."""
+        return self._walk(i, self.children, max_depth)
+
+    def in_groups(self, indices: Iterable[int], groups: Optional[Sequence[str]]) -> Iterator[int]:
+        if not groups:
+            yield from indices
+            return
+        wanted = set(groups)
+        for i in indices:
+            if self.groups[i] in wanted:
+                yield i
+
+
+def graph_signatures(
+    tasks_dir: Path | None = None, workspaces: List[Workspace] | None = None
+) -> list:
+    """[(workspace, root, signature)] for the roots a graph is built from;
+    equal lists mean the graph would come out the same."""
+    if workspaces:
+        roots = [(ws.name, ws.tasks_dir) for ws in workspaces if ws.tasks_dir.is_dir()]
+    else:
+        roots = [(None, Path(tasks_dir))]
+    return [(name, str(root.resolve()), dir_signature(root)) for name, root in roots]
+
+
+def _graph_cache_file(signatures: list, cache_dir: Path) -> Path:
+    roots = "|".join(f"{name or ''}={root}" for name, root, _ in signatures)
+    return cache_dir / f"graph-{hashlib.sha1(roots.encode('utf-8')).hexdigest()[:16]}.pickle"
+
+
+@traced()
+def load_task_graph(
+    tasks_dir: Path | None = None,
+    workspaces: List[Workspace] | None = None,
+    cache_dir: Path | None = None,
+    use_cache: bool = True,
+    signatures: list | None = None,
+) -> TaskGraph:
+    """
+    The resolved graph for one tasks directory, or for several workspaces
+    (cross-workspace dependencies included), from the on-disk cache when
+    none of the roots changed. Pass signatures if graph_signatures() was
+    just called for the same roots.
+    """
+    cache_dir = cache_dir or CACHE_DIR
+    if signatures is None:
+        signatures = graph_signatures(tasks_dir, workspaces)
+
+    path = _graph_cache_file(signatures, cache_dir)
+    if use_cache:
+        try:
+            with path.open("rb") as f:
+                version, cached_signatures, graph = pickle.load(f)
+            if version == GRAPH_VERSION and cached_signatures == signatures:
+                return graph
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("Ignoring unreadable graph cache %s: %s", path, e)
+
+    # Rebuild from the per-root node caches (only changed roots are parsed)
+    node_cache = TaskCache(cache_dir, persist=use_cache)
+    if workspaces:
+        nodes, _ = load_workspaces(workspaces, node_cache)
+    elif use_cache:
+        nodes, _ = node_cache.load(Path(tasks_dir))
+    else:
+        nodes = load_task_nodes(Path(tasks_dir))
+    unresolved = resolve_dependencies(nodes)
+    compute_levels(nodes)
+    graph = TaskGraph.from_nodes(nodes, unresolved)
+
+    if use_cache:
+        tmp = path.with_suffix(".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp.open("wb") as f:
+                pickle.dump((GRAPH_VERSION, signatures, graph), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("Could not write graph cache %s: %s", path, e)
+    return graph
@@ -19,4 +19,5 @@ cd "$PROJECT_ROOT"
 
 export PYTHONPATH="$PROJECT_ROOT${PYTHONPATH:+:$PYTHONPATH}"
 
-"$PYTHON_BIN" -m Codebase.GUI.task_create_gui
\ No newline at end of file
+# Ask the resident Create Task process to show its window (starts it if needed)
+"$PYTHON_BIN" -m Codebase.GUI.task_create_client
\ No newline at end of file
@@ -22,4 +22,4 @@ cd "$PROJECT_ROOT"
 export PYTHONPATH="$PROJECT_ROOT${PYTHONPATH:+:$PYTHONPATH}"
 
 # Run the DAG viewer Run as a module
-"$PYTHON_BIN" -m Codebase.GUI.dag_viewer
+"$PYTHON_BIN" -m Codebase.GUI.dag_viewer "$@"
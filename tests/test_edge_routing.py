@@ -0,0 +1,77 @@
+from Codebase.GUI.Logic.edge_routing import EdgeRouter, route_polyline
+from Codebase.GUI.Logic.layout import NODE_WIDTH, X_MARGIN, X_SPACING, Y_SPACING, Y_START
+
+
+def _pos(column, layer):
+    return X_MARGIN + column * X_SPACING, Y_START + layer * Y_SPACING
+
+
+def _waypoints(points):
+    # Drop the two ports, keep (x, y) of every dummy
+    return list(zip(points[2:-2:2], points[3:-2:2]))
+
+
+def test_parallel_long_edges_get_distinct_slots():
+    router = EdgeRouter("polyline")
+    edges = [(f"s{i}", f"d{i}", _pos(0, 0), _pos(1, 4)) for i in range(3)]
+    router.plan(edges)
+    routes = [_waypoints(router.route(*edge)) for edge in edges]
+
+    for layer in range(3):
+        xs = [route[layer][0] for route in routes]
+        assert len(set(xs)) == 3
+        # Same order in every layer, so the edges never cross each other
+        assert xs == sorted(xs)
+        # And all inside the column gap
+        gap_left = X_MARGIN + NODE_WIDTH / 2
+        assert all(gap_left < x < gap_left + X_SPACING - NODE_WIDTH for x in xs)
+
+
+def test_single_edge_uses_gap_centre():
+    router = EdgeRouter("polyline")
+    src, dst = _pos(0, 0), _pos(1, 3)
+    assert router.route("a", "b", src, dst) == route_polyline(src, dst)
+
+
+def test_new_edge_displaces_channel_members():
+    router = EdgeRouter("spline")
+    first = router.route("a", "b", _pos(0, 0), _pos(1, 3))
+    assert router.take_displaced() == set()
+
+    router.route("c", "d", _pos(0, 0), _pos(1, 3))
+    assert router.take_displaced() == {("a", "b")}
+    moved = router.route("a", "b", _pos(0, 0), _pos(1, 3))
+    assert moved != first
+    assert router.take_displaced() == set()
+
+
+def test_moving_edge_out_frees_its_slot():
+    router = EdgeRouter("polyline")
+    edges = [("a", "b", _pos(0, 0), _pos(1, 3)), ("c", "d", _pos(0, 0), _pos(1, 3))]
+    router.plan(edges)
+    shared = router.route(*edges[0])
+
+    # Drag c's child far to the right: a -> b has the gap to itself again
+    router.route("c", "d", _pos(0, 0), _pos(6, 3))
+    assert router.take_displaced() == {("a", "b")}
+    alone = router.route(*edges[0])
+    assert alone != shared
+    assert alone == route_polyline(edges[0][2], edges[0][3])
+
+
+def test_plan_matches_incremental_routing():
+    edges = [
+        ("a", "b", _pos(0, 0), _pos(2, 3)),
+        ("c", "d", _pos(1, 0), _pos(1, 4)),
+        ("e", "f", _pos(2, 1), _pos(0, 4)),
+        ("g", "h", _pos(0, 0), _pos(1, 1)),
+    ]
+    planned = EdgeRouter("polyline")
+    planned.plan(edges)
+    incremental = EdgeRouter("polyline")
+    for edge in edges:
+        incremental.route(*edge)
+    incremental.take_displaced()
+    for edge in edges:
+        incremental.forget({edge[0]})
+        assert planned.route(*edge) == incremental.route(*edge)
@@ -0,0 +1,73 @@
+import pytest
+
+from Codebase.Export.export_graph import export_graph
+from Codebase.Export.graph_selection import select_nodes
+from Codebase.GUI.Logic.dag_builder import compute_levels, resolve_dependencies
+from Codebase.Import.graph_events import ImportedNode
+from Codebase.Import.import_graph import load_imported_graph, read_graph
+from Codebase.Object.task_node import TaskNode
+
+TASKS = [
+    # key, label, status, depends_on
+    ("AAAA1", 'Build "API"', "done", []),
+    ("AAAA2", "Schema <v2> & co", "in_progress", ["AAAA1"]),
+    ("BBBB3", "UI, then\ndocs", "todo", ["AAAA1", "AAAA2"]),
+    ("BBBB4", "Ship", "blocked", ["BBBB3"]),
+]
+
+
+@pytest.fixture
+def nodes():
+    nodes = {
+        key: TaskNode(key=key, label=label, file_path=f"/x/{key}.json", depends_on_raw=deps,
+                      group=key[:4], id=int(key[4:]), status=status)
+        for key, label, status, deps in TASKS
+    }
+    resolve_dependencies(nodes)
+    compute_levels(nodes)
+    return nodes
+
+
+def _edges(nodes):
+    return {(dep, key) for key, node in nodes.items() for dep in node.deps_resolved}
+
+
+@pytest.mark.parametrize("fmt", ["dot", "graphml", "jsonl"])
+def test_export_reads_back_unchanged(nodes, tmp_path, fmt):
+    path = tmp_path / f"graph.{fmt}"
+    path.write_text("".join(export_graph(nodes, fmt)), encoding="utf-8")
+
+    read = {}
+    edges = set()
+    for event in read_graph(path):
+        if isinstance(event, ImportedNode):
+            read[event.name] = event.attrs
+        else:
+            edges.add((event.source, event.target))
+    assert edges == _edges(nodes)
+    assert {name: (a["label"], a["group"], a["status"]) for name, a in read.items()} == {
+        key: (node.label, node.group, node.status) for key, node in nodes.items()
+    }
+
+
+@pytest.mark.parametrize("fmt", ["dot", "graphml", "jsonl"])
+def test_export_loads_back_as_the_same_graph(nodes, tmp_path, fmt):
+    path = tmp_path / f"graph.{fmt}"
+    path.write_text("".join(export_graph(nodes, fmt)), encoding="utf-8")
+    loaded = load_imported_graph(path)
+
+    def labelled(graph):
+        return (
+            {(n.label, n.status, n.level) for n in graph.values()},
+            {(graph[a].label, graph[b].label) for a, b in _edges(graph)},
+        )
+
+    assert labelled(loaded) == labelled(nodes)
+
+
+def test_selection_keeps_only_edges_between_selected_nodes(nodes):
+    selection = select_nodes(nodes, ancestors_of="BBBB3", max_depth=1)
+    lines = "".join(export_graph(nodes, "csv", selection)).splitlines()
+    text = "\n".join(lines)
+    assert "BBBB4" not in text
+    assert "AAAA1" in text and "AAAA2" in text
@@ -0,0 +1,91 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from Codebase.FileIO.task_document import render_task_document
+from Codebase.Query.graph_service import GraphService, make_server
+
+
+def _write(tasks_dir, key, task, depends_on=()):
+    path = tasks_dir / f"{key}.json"
+    path.write_text(render_task_document({
+        "task": task, "group": key[:4], "id": int(key[4:]), "depends_on": list(depends_on),
+    }))
+    return path
+
+
+@pytest.fixture
+def tasks_dir(tmp_path):
+    tasks_dir = tmp_path / "Tasks"
+    tasks_dir.mkdir()
+    _write(tasks_dir, "AAAA1", "One")
+    _write(tasks_dir, "AAAA2", "Two", ["AAAA1"])
+    return tasks_dir
+
+
+def _bump(path, task):
+    # New content and size, so the signature moves whatever the mtime granularity
+    data = json.loads(path.read_text())
+    data["task"] = task
+    path.write_text(render_task_document(data))
+
+
+def test_delta_follows_versions_of_this_run(tasks_dir):
+    service = GraphService(tasks_dir)
+    assert service.refresh()
+    first = service.version_tag(service.snapshot.version)
+
+    _bump(tasks_dir / "AAAA2.json", "Two, renamed")
+    assert service.refresh()
+    (tasks_dir / "AAAA1.json").unlink()
+    assert service.refresh()
+
+    delta = service.delta(first)
+    assert delta["version"] == service.version_tag(service.snapshot.version)
+    assert [r["key"] for r in delta["changed"]] == ["AAAA2"]
+    assert delta["removed"] == ["AAAA1"]
+    assert service.delta(delta["version"]) == {"version": delta["version"], "changed": [], "removed": []}
+
+
+def test_versions_of_another_run_are_gone(tasks_dir):
+    old = GraphService(tasks_dir)
+    old.refresh()
+    old_tag = old.version_tag(old.snapshot.version)
+
+    restarted = GraphService(tasks_dir)
+    restarted.refresh()
+    assert restarted.version_tag(restarted.snapshot.version) != old_tag
+    assert restarted.delta(old_tag) is None
+    with pytest.raises(ValueError):
+        restarted.delta("12345")
+
+
+def test_http_etag_and_410(tasks_dir):
+    service = GraphService(tasks_dir)
+    service.refresh()
+    server = make_server(service, "127.0.0.1", 0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    try:
+        with urllib.request.urlopen(f"{base}/graph") as resp:
+            etag = resp.headers["ETag"]
+            version = json.loads(resp.read())["version"]
+        assert etag == f'W/"{version}"'
+
+        request = urllib.request.Request(f"{base}/graph", headers={"If-None-Match": etag})
+        with pytest.raises(urllib.error.HTTPError) as e:
+            urllib.request.urlopen(request)
+        assert e.value.code == 304
+
+        with pytest.raises(urllib.error.HTTPError) as e:
+            urllib.request.urlopen(f"{base}/delta?since=deadbeef-1")
+        assert e.value.code == 410
+        with pytest.raises(urllib.error.HTTPError) as e:
+            urllib.request.urlopen(f"{base}/delta?since=7")
+        assert e.value.code == 400
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,55 @@
+from Codebase.Query import graph_snapshot
+from Codebase.Query.graph_snapshot import (
+    GraphState,
+    diff_graphs,
+    find_snapshot,
+    list_snapshots,
+    save_snapshot,
+)
+
+
+def _records(n, status="todo"):
+    return [[f"T{i}", f"t{i}", "T", i, status, [f"T{i - 1}"] if i else []] for i in range(n)]
+
+
+def test_saves_in_the_same_second_are_all_kept(tmp_path):
+    paths = [save_snapshot(_records(3), directory=tmp_path) for _ in range(5)]
+    assert len(set(paths)) == 5
+    assert [s.path for s in list_snapshots(tmp_path)] == paths
+    assert find_snapshot("latest", tmp_path).path == paths[-1]
+
+
+def test_same_microsecond_saves_sort_in_save_order(tmp_path, monkeypatch):
+    monkeypatch.setattr(graph_snapshot.time, "time", lambda: 1700000000.25)
+    paths = [save_snapshot(_records(i + 1), directory=tmp_path) for i in range(3)]
+    assert [p.name[-len("-2.dagsnap"):] for p in paths[1:]] == ["-2.dagsnap", "-3.dagsnap"]
+    assert [s.path for s in list_snapshots(tmp_path)] == paths
+    assert find_snapshot("latest", tmp_path).header["tasks"] == 3
+    # Only the published snapshots are left, no temp files
+    assert sorted(tmp_path.iterdir()) == sorted(paths)
+
+
+def test_unpublished_temp_files_are_not_listed(tmp_path):
+    path = save_snapshot(_records(3), directory=tmp_path)
+    (tmp_path / ".20250101T000000.000000Z.abc.tmp").write_bytes(path.read_bytes()[:100])
+    assert [s.path for s in list_snapshots(tmp_path)] == [path]
+
+
+def test_diff_round_trip_through_a_file(tmp_path):
+    old = _records(200)
+    new = [list(r) for r in old[:-1]]  # T199 removed
+    new[5][4] = "done"
+    new[7][5] = ["T1", "T6"]
+    new.append(["X1", "x", "X", 1, "todo", ["T3"]])
+
+    save_snapshot(old, label="before", directory=tmp_path)
+    snap = find_snapshot("before", tmp_path)
+    diff = diff_graphs(snap, GraphState(new))
+
+    assert diff.added == ["X1"]
+    assert diff.removed == ["T199"]
+    assert diff.modified == {"T5": ["status"], "T7": ["depends_on"]}
+    assert sorted(diff.edges_added) == [("T1", "T7"), ("T3", "X1")]
+    assert sorted(diff.edges_removed) == [("T198", "T199")]
+    assert diff.buckets_compared <= 5
+    assert diff_graphs(snap, GraphState(old)).is_empty()
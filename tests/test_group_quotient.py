@@ -0,0 +1,80 @@
+import random
+
+from Codebase.GUI.Logic.dag_builder import compute_levels, resolve_dependencies
+from Codebase.GUI.Logic.group_quotient import GroupQuotient, super_key, super_key_group
+from Codebase.Object.task_node import TaskNode
+
+GROUPS = ["AAAA", "BBBB", "CCCC", None]
+
+
+def _graph(seed, n=60):
+    rng = random.Random(seed)
+    nodes = {}
+    for i in range(n):
+        deps = [f"T{p}" for p in rng.sample(range(i), min(i, rng.randint(0, 3)))]
+        nodes[f"T{i}"] = TaskNode(key=f"T{i}", label=f"t{i}", file_path=f"/x/T{i}.json",
+                                  depends_on_raw=deps, group=rng.choice(GROUPS))
+    resolve_dependencies(nodes)
+    compute_levels(nodes)
+    return nodes
+
+
+def _expected(nodes, collapsed):
+    """Collapsed view worked out edge by edge."""
+    def rep(key):
+        group = nodes[key].group
+        return super_key(group) if group in collapsed else key
+
+    edges = {}
+    for key, node in nodes.items():
+        for dep in node.deps_resolved:
+            edge = (rep(dep), rep(key))
+            if edge[0] != edge[1]:
+                edges[edge] = edges.get(edge, 0) + 1
+    levels = {}
+    for key, node in nodes.items():
+        display = rep(key)
+        levels[display] = min(levels.get(display, node.level), node.level)
+    return levels, edges
+
+
+def test_views_match_a_direct_merge():
+    nodes = _graph(1)
+    quotient = GroupQuotient(nodes)
+    for collapsed in ([], ["AAAA"], ["AAAA", "BBBB"], ["AAAA", "BBBB", "CCCC"], ["ZZZZ"]):
+        view = quotient.view(collapsed)
+        assert (view.levels, view.edges) == _expected(nodes, set(collapsed))
+        for key, size in view.sizes.items():
+            assert size == sum(1 for n in nodes.values() if n.group == super_key_group(key))
+
+
+def test_incremental_updates_match_a_rebuild():
+    nodes = _graph(2)
+    quotient = GroupQuotient(nodes)
+    rng = random.Random(3)
+    keys = list(nodes)
+
+    # Live-inserted node depending on two existing ones
+    nodes["NEW"] = TaskNode(key="NEW", label="new", file_path="/x/NEW.json",
+                            depends_on_raw=[keys[3], keys[10]], group="BBBB",
+                            deps_resolved=[keys[3], keys[10]], level=nodes[keys[10]].level + 1)
+    for dep in (keys[3], keys[10]):
+        nodes[dep].children.append("NEW")
+    quotient.add_node("NEW")
+
+    # New edges between existing nodes (old index -> newer index keeps it acyclic)
+    for _ in range(20):
+        a, b = sorted(rng.sample(range(len(keys)), 2))
+        parent, child = keys[a], keys[b]
+        if parent in nodes[child].deps_resolved:
+            continue
+        nodes[child].deps_resolved.append(parent)
+        nodes[parent].children.append(child)
+        quotient.add_edge(parent, child)
+
+    fresh = GroupQuotient(nodes)
+    assert quotient.edge_counts == fresh.edge_counts
+    assert quotient.min_level == fresh.min_level
+    assert {g: list(m) for g, m in quotient.members.items()} == {g: list(m) for g, m in fresh.members.items()}
+    collapsed = ["AAAA", "BBBB"]
+    assert quotient.view(collapsed) == fresh.view(collapsed)
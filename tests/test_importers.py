@@ -0,0 +1,156 @@
+import io
+import json
+
+import pytest
+
+from Codebase.Import import read_dot as read_dot_module
+from Codebase.Import.graph_events import ImportedEdge, ImportedNode
+from Codebase.Import.import_graph import import_graph, load_imported_graph, read_graph
+from Codebase.Import.read_dot import DotSyntaxError, _Parser, read_dot, tokenize
+
+PLAN_DOT = """// plan
+digraph "Plan" {
+  rankdir=LR; node [shape=box];
+  subgraph cluster_backend {
+    label="Backend";
+    api [label="Build API", status=done];
+    db  [label="Schema \\"v2\\"", description=<<b>bold</b>>];
+    db -> api;
+  }
+  ui [label="UI"]
+  api -> ui -> "ship it";
+  {tests lint} -> ship;
+  /* block
+     comment -> not an edge */
+  x:port:n -> y
+}
+"""
+
+
+def _events(events):
+    nodes = {}
+    edges = []
+    for event in events:
+        if isinstance(event, ImportedNode):
+            nodes.setdefault(event.name, {}).update(event.attrs)
+        else:
+            edges.append((event.source, event.target))
+    return nodes, edges
+
+
+@pytest.fixture
+def plan_dot(tmp_path):
+    path = tmp_path / "plan.dot"
+    path.write_text(PLAN_DOT)
+    return path
+
+
+def test_dot_nodes_edges_and_clusters(plan_dot):
+    nodes, edges = _events(read_dot(plan_dot))
+    assert nodes["api"] == {"shape": "box", "group": "backend", "label": "Build API", "status": "done"}
+    assert nodes["db"]["label"] == 'Schema "v2"'
+    assert nodes["db"]["description"] == "<b>bold</b>"
+    assert sorted(edges) == sorted([
+        ("db", "api"), ("api", "ui"), ("ui", "ship it"),
+        ("tests", "ship"), ("lint", "ship"), ("x", "y"),
+    ])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+def test_dot_tokens_do_not_depend_on_chunk_size(plan_dot, monkeypatch, chunk_size):
+    expected = list(map(repr, read_dot(plan_dot)))
+    monkeypatch.setattr(read_dot_module, "CHUNK_SIZE", chunk_size)
+    assert list(map(repr, read_dot(plan_dot))) == expected
+
+
+def test_dot_single_line_input_is_tokenised_incrementally(monkeypatch):
+    monkeypatch.setattr(read_dot_module, "CHUNK_SIZE", 16)
+    text = "digraph G { " + " ".join(f"n{i} -> n{i + 1};" for i in range(1000)) + " }"
+    stream = io.StringIO(text)
+    tokens = tokenize(stream)
+    for _ in range(10):
+        next(tokens)
+    # Only a few blocks were needed for the first tokens
+    assert stream.tell() < 200
+
+
+def test_dot_cluster_statements_stream_before_the_cluster_ends(monkeypatch):
+    monkeypatch.setattr(read_dot_module, "CHUNK_SIZE", 256)
+    body = "\n".join(f"a{i} -> b{i};" for i in range(1000))
+    text = "digraph G { subgraph cluster_x { " + body + " } }"
+    stream = io.StringIO(text)
+    events = _Parser(tokenize(stream)).graph()
+    first = [next(events) for _ in range(3)]
+    assert ImportedEdge("a0", "b0") in first
+    assert stream.tell() < len(text)
+
+
+def test_dot_subgraph_operands_use_their_members():
+    text = "digraph { subgraph s { a; subgraph t { b } } -> {c d} }"
+    _, edges = _events(_Parser(tokenize(io.StringIO(text))).graph())
+    assert sorted(edges) == [("a", "c"), ("a", "d"), ("b", "c"), ("b", "d")]
+
+
+def test_dot_syntax_error():
+    with pytest.raises(DotSyntaxError):
+        list(_Parser(tokenize(io.StringIO("digraph { a -> ; }"))).graph())
+
+
+def test_graphml_keys_and_nested_groups(tmp_path):
+    path = tmp_path / "g.graphml"
+    path.write_text("""<?xml version="1.0" encoding="UTF-8"?>
+<graphml xmlns="http://graphml.graphdrawing.org/xmlns">
+  <key id="d0" for="node" attr.name="label" attr.type="string"/>
+  <graph id="G" edgedefault="directed">
+    <node id="a"><data key="d0">Design</data></node>
+    <node id="grp">
+      <graph id="grp:" edgedefault="directed"><node id="b"/></graph>
+    </node>
+    <edge source="a" target="b"/>
+  </graph>
+</graphml>
+""")
+    nodes, edges = _events(read_graph(path))
+    assert nodes["a"]["label"] == "Design"
+    assert nodes["b"]["group"] == "grp"
+    assert edges == [("a", "b")]
+
+
+def test_jsonl_records(tmp_path):
+    path = tmp_path / "g.jsonl"
+    path.write_text(
+        '{"key":"x","label":"X","group":"core","depends_on":["y"]}\n'
+        "# comment\n"
+        '["y","z"]\n'
+        '{"from":"z","to":"x"}\n'
+    )
+    nodes, edges = _events(read_graph(path))
+    assert nodes == {"x": {"label": "X", "group": "core"}}
+    assert edges == [("y", "x"), ("y", "z"), ("z", "x")]
+
+
+def test_import_writes_task_files_and_keeps_existing(plan_dot, tmp_path):
+    tasks = tmp_path / "Tasks"
+    tasks.mkdir()
+    (tasks / "BACKEND1.json").write_text('{"task": "existing"}\n')
+
+    stats = import_graph(read_graph(plan_dot), tasks, workers=2)
+    docs = {p.stem: json.loads(p.read_text()) for p in tasks.glob("*.json")}
+    by_label = {d["task"]: (key, d) for key, d in docs.items()}
+
+    assert stats.edges == 6 and stats.written == stats.nodes == len(docs) - 1
+    assert docs["BACKEND1"] == {"task": "existing"}
+    api_key, api = by_label["Build API"]
+    db_key, _ = by_label['Schema "v2"']
+    assert api_key.startswith("BACKEND") and api_key != "BACKEND1"
+    assert api["status"] == "done" and api["depends_on"] == [db_key]
+
+    # Same graph in memory, without files
+    nodes = load_imported_graph(plan_dot)
+    assert sum(len(n.deps_resolved) for n in nodes.values()) == 6
+
+
+def test_dot_string_escapes():
+    text = 'digraph { a [label="two\\nlines \\"q\\" c:\\\\tmp \\x long\\\nline"] }'
+    nodes, _ = _events(_Parser(tokenize(io.StringIO(text))).graph())
+    assert nodes["a"]["label"] == 'two\nlines "q" c:\\tmp \\x longline'
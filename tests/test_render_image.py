@@ -0,0 +1,101 @@
+import io
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from Codebase.Export.group_colors import collect_group_colors
+from Codebase.Export.render_png import fit_scale, render_png
+from Codebase.Export.render_svg import DEFAULT_FILL, render_svg
+from Codebase.GUI.Logic.dag_builder import compute_levels, resolve_dependencies
+from Codebase.GUI.Logic.layout import NODE_HEIGHT, NODE_WIDTH, compute_grid_layout, layout_extent
+from Codebase.Object.task_node import TaskNode
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+TASKS = [
+    # key, label, group, depends_on
+    ("AAAA1", "Plan & <scope>", "AAAA", []),
+    ("AAAA2", "Build", "AAAA", ["AAAA1"]),
+    ("BBBB3", "Review", "BBBB", ["AAAA1", "AAAA2"]),
+    ("misc", "Loose end", None, ["BBBB3"]),
+]
+
+
+@pytest.fixture
+def nodes():
+    nodes = {
+        key: TaskNode(key=key, label=label, file_path=f"/x/{key}.json", depends_on_raw=deps, group=group)
+        for key, label, group, deps in TASKS
+    }
+    resolve_dependencies(nodes)
+    compute_levels(nodes)
+    return nodes
+
+
+def _svg(nodes, groups=None):
+    out = io.StringIO()
+    render_svg(nodes, compute_grid_layout(nodes), out, groups=groups)
+    root = ET.fromstring(out.getvalue())
+    # First rect is the white background
+    rects = root.findall(f"{SVG}rect")[1:]
+    return root, rects, root.findall(f"{SVG}text"), root.findall(f"{SVG}line")
+
+
+def test_svg_has_one_box_label_and_line_per_node_and_edge(nodes):
+    root, rects, texts, lines = _svg(nodes)
+    assert len(rects) == len(texts) == 4
+    assert len(lines) == 4
+    assert [t.text for t in texts] == [label for _, label, _, _ in TASKS]
+
+    max_x, max_y = layout_extent(compute_grid_layout(nodes))
+    assert (float(root.get("width")), float(root.get("height"))) == (max_x, max_y)
+
+    colors = collect_group_colors(nodes)
+    assert [r.get("fill") for r in rects] == [colors["AAAA"], colors["AAAA"], colors["BBBB"], DEFAULT_FILL]
+
+
+def test_svg_hidden_group_drops_its_nodes_and_edges(nodes):
+    _, rects, texts, lines = _svg(nodes, groups=["BBBB"])
+    # AAAA hidden: BBBB3 and the ungrouped task stay, with the edge between them
+    assert [t.text for t in texts] == ["Review", "Loose end"]
+    assert len(rects) == 2
+    assert len(lines) == 1
+
+
+def test_png_size_follows_layout_scale_and_cap(nodes, tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    positions = compute_grid_layout(nodes)
+    max_x, max_y = layout_extent(positions)
+
+    path = render_png(nodes, positions, tmp_path / "full.png")
+    assert Image.open(path).size == (int(max_x), int(max_y))
+
+    path = render_png(nodes, positions, tmp_path / "half.png", scale=0.5)
+    assert Image.open(path).size == (int(max_x * 0.5), int(max_y * 0.5))
+
+    path = render_png(nodes, positions, tmp_path / "capped.png", max_size=100)
+    assert max(Image.open(path).size) <= 100
+    assert fit_scale(max_x, max_y, 1.0, 100) == pytest.approx(100 / max(max_x, max_y))
+
+
+def test_png_viewport_crops_to_the_window(nodes, tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    positions = compute_grid_layout(nodes)
+    colors = collect_group_colors(nodes)
+
+    # Window around BBBB3 only
+    x, y = positions["BBBB3"]
+    viewport = (x - NODE_WIDTH, y - NODE_HEIGHT, 2 * NODE_WIDTH, 2 * NODE_HEIGHT)
+    img = Image.open(render_png(nodes, positions, tmp_path / "view.png", viewport=viewport)).convert("RGB")
+    assert img.size == (2 * NODE_WIDTH, 2 * NODE_HEIGHT)
+
+    def rgb(color):
+        return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+
+    # BBBB3's box fills the centre, just off its label
+    assert img.getpixel((NODE_WIDTH // 2 + 10, NODE_HEIGHT // 2 + 5)) == rgb(colors["BBBB"])
+    # Same window with BBBB hidden: nothing of it is drawn there
+    img = Image.open(
+        render_png(nodes, positions, tmp_path / "hidden.png", groups=["AAAA"], viewport=viewport)
+    ).convert("RGB")
+    assert img.getpixel((NODE_WIDTH // 2 + 10, NODE_HEIGHT // 2 + 5)) == (255, 255, 255)
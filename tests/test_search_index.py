@@ -0,0 +1,93 @@
+from Codebase.FileIO.task_document import render_task_document
+from Codebase.FileIO.update_log import append_update
+from Codebase.GUI.IO.search_index import SearchIndex, WorkspaceSearchIndex
+
+
+def _write(tasks_dir, key, task, description="", notes=()):
+    updates = [{"timestamp": "2025-01-01T00:00:00Z", "note": note} for note in notes]
+    path = tasks_dir / f"{key}.json"
+    path.write_text(render_task_document({"task": task, "description": description, "updates": updates}))
+    return path
+
+
+def _index(tmp_path):
+    tasks_dir = tmp_path / "Tasks"
+    tasks_dir.mkdir(exist_ok=True)
+    return tasks_dir, SearchIndex(tasks_dir, tmp_path / "index.json")
+
+
+def test_field_weights_rank_and_all_words_must_match(tmp_path):
+    tasks_dir, index = _index(tmp_path)
+    _write(tasks_dir, "AAAA1", "Deploy database", "")
+    _write(tasks_dir, "AAAA2", "Other", "deploy the database")
+    _write(tasks_dir, "AAAA3", "Other", "", notes=["database deploy done"])
+    _write(tasks_dir, "AAAA4", "Database only")
+    assert index.refresh() == 4
+
+    assert [key for key, _ in index.search("database deploy ")] == ["AAAA1", "AAAA2", "AAAA3"]
+    assert index.search("deploy nothing ") == []
+
+
+def test_last_word_matches_as_prefix(tmp_path):
+    tasks_dir, index = _index(tmp_path)
+    _write(tasks_dir, "AAAA1", "Migrate schema")
+    _write(tasks_dir, "AAAA2", "Migration plan")
+    index.refresh()
+
+    assert {key for key, _ in index.search("migra")} == {"AAAA1", "AAAA2"}
+    # A trailing space ends the word: no prefix match
+    assert index.search("migra ") == []
+
+
+def test_refresh_picks_up_edits_logged_updates_and_deletions(tmp_path):
+    tasks_dir, index = _index(tmp_path)
+    first = _write(tasks_dir, "AAAA1", "Alpha")
+    _write(tasks_dir, "AAAA2", "Beta")
+    index.refresh()
+    assert index.refresh() == 0
+
+    append_update(first, {"timestamp": "2025-01-02T00:00:00Z", "note": "gamma"})
+    _write(tasks_dir, "AAAA2", "Delta")
+    assert index.refresh() == 2
+    assert [key for key, _ in index.search("gamma ")] == ["AAAA1"]
+    assert index.search("beta ") == []
+    assert [key for key, _ in index.search("delta ")] == ["AAAA2"]
+
+    (tasks_dir / "AAAA2.json").unlink()
+    assert index.refresh() == 1
+    assert index.search("delta ") == []
+
+
+def test_saved_index_loads_back_without_rereading(tmp_path):
+    tasks_dir, index = _index(tmp_path)
+    for i in range(5):
+        _write(tasks_dir, f"AAAA{i}", f"Task number {i}", "shared words")
+    index.refresh()
+    index.save()
+
+    reloaded = SearchIndex(tasks_dir, tmp_path / "index.json")
+    reloaded.load()
+    assert reloaded.docs == {key: (tuple(sig), terms) for key, (sig, terms) in index.docs.items()}
+    assert reloaded.refresh() == 0
+    assert reloaded.search("shared w") == index.search("shared w")
+
+    # An index saved for another directory is ignored
+    other = SearchIndex(tmp_path / "Elsewhere", tmp_path / "index.json")
+    other.load()
+    assert len(other) == 0
+
+
+def test_workspaces_are_searched_together(tmp_path, monkeypatch):
+    from Codebase.GUI.IO import search_index
+
+    monkeypatch.setattr(search_index, "INDEX_FILE", tmp_path / ".search_index.json")
+    roots = {}
+    for name in ("app", "infra"):
+        roots[name] = tmp_path / name
+        roots[name].mkdir()
+        _write(roots[name], "AAAA1", f"Deploy {name}")
+    index = WorkspaceSearchIndex(roots)
+    assert index.refresh() == 2
+
+    assert sorted(key for key, _ in index.search("deploy ")) == ["app:AAAA1", "infra:AAAA1"]
+    assert [key for key, _ in index.search("infra")] == ["infra:AAAA1"]
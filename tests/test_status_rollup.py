@@ -0,0 +1,78 @@
+import random
+
+from Codebase.GUI.Logic.dag_builder import compute_levels, resolve_dependencies
+from Codebase.GUI.Logic.status_rollup import StatusRollup
+from Codebase.Object.task_node import TaskNode
+
+
+def _graph(n, edges, statuses):
+    nodes = {
+        f"T{i}": TaskNode(key=f"T{i}", label=f"t{i}", file_path=f"/x/T{i}.json",
+                          depends_on_raw=[f"T{p}" for p, c in edges if c == i],
+                          status=statuses[i])
+        for i in range(n)
+    }
+    resolve_dependencies(nodes)
+    compute_levels(nodes)
+    return nodes
+
+
+def _link(nodes, parent, child):
+    nodes[child].deps_resolved.append(parent)
+    nodes[parent].children.append(child)
+
+
+def _snapshot(rollup):
+    return rollup.states, rollup.ready, rollup.ancestor_counts, rollup.descendant_counts
+
+
+def test_counts_on_a_small_graph():
+    # T0 -> T1 -> T2, T0 done
+    nodes = _graph(3, [(0, 1), (1, 2)], ["done", "todo", "todo"])
+    rollup = StatusRollup(nodes)
+    assert rollup.states == {"T0": "done", "T1": "ready", "T2": "blocked"}
+    assert rollup.ancestor_counts["T2"] == {"done": 1, "ready": 1, "blocked": 0}
+    assert rollup.descendant_counts["T0"] == {"done": 0, "ready": 1, "blocked": 1}
+
+    assert rollup.set_status("T1", "done") == ["T1", "T2"]
+    assert rollup.ready == {"T2"}
+
+
+def test_incremental_updates_match_a_rebuild():
+    rng = random.Random(7)
+    for _ in range(30):
+        n = rng.randint(2, 40)
+        edges = {(p, c) for c in range(n) for p in range(c) if rng.random() < 0.08}
+        statuses = [rng.choice(["todo", "done", "in_progress", "blocked"]) for _ in range(n)]
+        nodes = _graph(n, sorted(edges), statuses)
+        rollup = StatusRollup(nodes)
+
+        for _ in range(10):
+            if rng.random() < 0.5:
+                key = f"T{rng.randrange(n)}"
+                rollup.set_status(key, rng.choice(["todo", "done", "blocked"]))
+            else:
+                p, c = sorted(rng.sample(range(n), 2))
+                if (p, c) in edges:
+                    continue
+                edges.add((p, c))
+                _link(nodes, f"T{p}", f"T{c}")
+                rollup.add_edge(f"T{p}", f"T{c}")
+            fresh = StatusRollup(nodes)
+            assert _snapshot(rollup) == _snapshot(fresh)
+
+
+def test_edge_at_the_head_of_a_long_chain_is_cheap():
+    import time
+
+    n = 3000
+    nodes = _graph(n + 1, [(i, i + 1) for i in range(1, n)], ["todo"] * (n + 1))
+    rollup = StatusRollup(nodes)
+    _link(nodes, "T0", "T1")
+    t0 = time.perf_counter()
+    rollup.add_edge("T0", "T1")
+    elapsed = time.perf_counter() - t0
+    assert rollup.ancestor_counts[f"T{n}"]["ready"] == 1
+    assert rollup.descendant_counts["T0"]["blocked"] == n
+    assert _snapshot(rollup) == _snapshot(StatusRollup(nodes))
+    assert elapsed < 0.5
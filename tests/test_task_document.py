@@ -0,0 +1,102 @@
+import json
+import multiprocessing
+
+import pytest
+
+from Codebase.FileIO.task_document import (
+    VersionConflict,
+    append_dependency,
+    read_task_document,
+    render_task_document,
+    update_task_document,
+    write_task_document,
+)
+
+
+def _task(tmp_path):
+    task_file = tmp_path / "AAAA1.json"
+    task_file.write_text(render_task_document({"task": "t", "rev": 1, "depends_on": []}))
+    return task_file
+
+
+def test_write_needs_the_version_it_read(tmp_path):
+    task_file = _task(tmp_path)
+    data, version = read_task_document(task_file)
+    data["task"] = "first"
+    new_version = write_task_document(task_file, data, version)
+    assert json.loads(task_file.read_text())["rev"] == 2
+
+    stale = {"task": "second", "rev": 1}
+    with pytest.raises(VersionConflict):
+        write_task_document(task_file, stale, version)
+    assert json.loads(task_file.read_text())["task"] == "first"
+    assert read_task_document(task_file)[1] == new_version
+
+
+def test_create_only_if_missing(tmp_path):
+    task_file = tmp_path / "AAAA2.json"
+    write_task_document(task_file, {"task": "new"}, None)
+    with pytest.raises(VersionConflict):
+        write_task_document(task_file, {"task": "again"}, None)
+
+
+def test_edit_returning_false_writes_nothing(tmp_path):
+    task_file = _task(tmp_path)
+    before = task_file.read_bytes()
+    assert append_dependency(task_file, "AAAA9", publish=False)[1]
+    assert not append_dependency(task_file, "AAAA9", publish=False)[1]
+    assert task_file.read_bytes() != before
+    assert json.loads(task_file.read_text())["depends_on"] == ["AAAA9"]
+
+
+def test_conflicting_edit_is_reapplied(tmp_path):
+    task_file = _task(tmp_path)
+    calls = []
+
+    def edit(data):
+        calls.append(list(data["depends_on"]))
+        if len(calls) == 1:
+            # Another writer gets in between our read and our write
+            append_dependency(task_file, "BBBB1", publish=False)
+        data["depends_on"].append("CCCC1")
+
+    update_task_document(task_file, edit, publish=False)
+    assert calls == [[], ["BBBB1"]]
+    assert json.loads(task_file.read_text())["depends_on"] == ["BBBB1", "CCCC1"]
+
+
+def test_busy_file_is_retried_past_many_conflicts(tmp_path):
+    task_file = _task(tmp_path)
+    calls = []
+
+    def edit(data):
+        calls.append(None)
+        if len(calls) <= 20:
+            append_dependency(task_file, f"BBBB{len(calls)}", publish=False)
+        data["depends_on"].append("CCCC1")
+
+    assert update_task_document(task_file, edit, publish=False)[1]
+    assert len(calls) == 21
+    assert json.loads(task_file.read_text())["depends_on"][-1] == "CCCC1"
+
+
+def _appender(task_file, worker, count):
+    for i in range(count):
+        append_dependency(task_file, f"W{worker}x{i}", publish=False)
+
+
+def test_concurrent_writers_lose_no_edits(tmp_path):
+    task_file = _task(tmp_path)
+    ctx = multiprocessing.get_context("fork")
+    workers = [ctx.Process(target=_appender, args=(task_file, w, 50)) for w in range(4)]
+    for p in workers:
+        p.start()
+    for p in workers:
+        p.join(60)
+    assert [p.exitcode for p in workers] == [0, 0, 0, 0]
+
+    data = json.loads(task_file.read_text())
+    assert sorted(data["depends_on"]) == sorted(f"W{w}x{i}" for w in range(4) for i in range(50))
+    assert data["rev"] == 1 + 200
+    # No temp files left behind
+    assert [p.name for p in tmp_path.iterdir() if p.name.startswith(".AAAA1")] == []
@@ -0,0 +1,29 @@
+from Codebase.GUI.GUI.Tile.tile_cache import TileCache
+
+
+def test_lru_eviction_calls_back():
+    evicted = []
+    cache = TileCache(max_tiles=2, on_evict=evicted.append)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert evicted == ["b"]
+    assert "a" in cache and "c" in cache
+
+
+def test_pinned_viewport_tiles_are_never_evicted():
+    evicted = []
+    cache = TileCache(max_tiles=4, on_evict=evicted.append)
+    cache.put("old", 0)
+    # A 4K viewport needs more tiles than the cache holds
+    viewport = [(x, y) for x in range(4) for y in range(2)]
+    cache.pinned = set(viewport)
+    for key in viewport:
+        cache.put(key, key)
+    assert evicted == ["old"]
+    assert all(key in cache for key in viewport)
+
+    cache.pinned = set()
+    cache.resize(3)
+    assert len(cache) == 3 and evicted[1:] == viewport[:5]
@@ -0,0 +1,89 @@
+import json
+import multiprocessing
+import os
+
+from Codebase.FileIO import update_log
+from Codebase.FileIO.task_document import render_task_document
+from Codebase.FileIO.update_log import (
+    COMPACTED_KEY,
+    append_update,
+    compact,
+    load_task_document,
+    log_path,
+    pending_logs,
+    read_updates,
+)
+
+
+def _task(tmp_path, updates=()):
+    task_file = tmp_path / "AAAA1.json"
+    task_file.write_text(render_task_document({"task": "t", "rev": 1, "updates": list(updates)}))
+    return task_file
+
+
+def _note(i):
+    return {"timestamp": "2025-01-01T00:00:00Z", "author": "a", "note": f"n{i}"}
+
+
+def test_log_is_read_after_base_and_compacted(tmp_path):
+    task_file = _task(tmp_path, [_note(0)])
+    for i in range(1, 4):
+        append_update(task_file, _note(i))
+    assert [u["note"] for u in read_updates(task_file)] == ["n0", "n1", "n2", "n3"]
+    assert [u["note"] for u in read_updates(task_file, tail=2)] == ["n2", "n3"]
+
+    assert compact(task_file) == 3
+    assert not log_path(task_file).exists() and not pending_logs(task_file)
+    assert [u["note"] for u in load_task_document(task_file)["updates"]] == ["n0", "n1", "n2", "n3"]
+    assert compact(task_file) == 0
+
+
+def test_pending_log_is_visible_and_folded_once(tmp_path):
+    task_file = _task(tmp_path)
+    append_update(task_file, _note(1))
+    # A compactor took the log over and died before writing the document
+    pending = log_path(task_file).with_name("AAAA1.updates.00000000000000000001.compacting")
+    os.replace(log_path(task_file), pending)
+    append_update(task_file, _note(2))
+    assert [u["note"] for u in read_updates(task_file)] == ["n1", "n2"]
+
+    assert compact(task_file) == 2
+    assert [u["note"] for u in read_updates(task_file)] == ["n1", "n2"]
+
+
+def test_pending_log_already_folded_is_not_applied_again(tmp_path):
+    # A compactor died after its document write, before deleting the log
+    task_file = _task(tmp_path, [_note(1)])
+    data = json.loads(task_file.read_text())
+    data[COMPACTED_KEY] = "00000000000000000001"
+    task_file.write_text(render_task_document(data))
+    pending = log_path(task_file).with_name("AAAA1.updates.00000000000000000001.compacting")
+    pending.write_text(json.dumps(_note(1)) + "\n")
+
+    assert [u["note"] for u in read_updates(task_file)] == ["n1"]
+    assert compact(task_file) == 0
+    assert not pending.exists()
+    assert [u["note"] for u in load_task_document(task_file)["updates"]] == ["n1"]
+
+
+def _writer(task_file, worker, count):
+    for i in range(count):
+        append_update(task_file, _note(f"{worker}-{i}"), compact_bytes=4096)
+
+
+def test_concurrent_appends_and_compactions_keep_every_update_once(tmp_path):
+    task_file = _task(tmp_path)
+    ctx = multiprocessing.get_context("fork")
+    workers = [ctx.Process(target=_writer, args=(task_file, w, 100)) for w in range(4)]
+    for p in workers:
+        p.start()
+    for p in workers:
+        p.join(60)
+    assert [p.exitcode for p in workers] == [0, 0, 0, 0]
+
+    compact(task_file)
+    notes = [u["note"] for u in json.loads(task_file.read_text())["updates"]]
+    assert len(notes) == 400
+    assert set(notes) == {f"n{w}-{i}" for w in range(4) for i in range(100)}
+    assert not log_path(task_file).exists() and not pending_logs(task_file)
+    assert update_log.read_updates(task_file) == json.loads(task_file.read_text())["updates"]